@@ -1,2 +1,3 @@
+from neofs_testlib.blockchain.funding import FundingSender, Nep17Funder
 from neofs_testlib.blockchain.multisig import Multisig
 from neofs_testlib.blockchain.rpc_client import RPCClient
@@ -0,0 +1,177 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from neofs_testlib.blockchain.rpc_client import NeoRPCException, RPCClient
+from neofs_testlib.cli import NeoGo
+
+logger = logging.getLogger("neofs.testlib.blockchain")
+
+# Each transfer adds about 100 bytes to the script of transaction, so with this number of
+# transfers transaction stays well below the limit of 100 KiB on transaction size
+DEFAULT_TRANSFERS_PER_TRANSACTION = 500
+# Error that neo-go returns for transactions that are not included in a block yet
+_UNKNOWN_TRANSACTION_ERROR = "unknown transaction"
+
+
+@dataclass
+class FundingSender:
+    """Account that sends tokens to recipients.
+
+    Attributes:
+        wallet: Path to the wallet file of the account.
+        address: Address of the account.
+        wallet_password: Password of the wallet. Either password or wallet_config must be set.
+        wallet_config: Path to neo-go wallet config that specifies the wallet and its password.
+    """
+
+    wallet: Optional[str] = None
+    address: Optional[str] = None
+    wallet_password: Optional[str] = None
+    wallet_config: Optional[str] = None
+
+
+class Nep17Funder:
+    """Funds many addresses with NEP-17 tokens using multi-transfer transactions.
+
+    Recipients are split into chunks, each chunk is transferred with a single transaction.
+    Chunks are distributed among sender accounts and submitted concurrently, then the funder
+    waits for all transactions to be included in blocks.
+    """
+
+    def __init__(
+        self,
+        neogo: NeoGo,
+        rpc_endpoint: str,
+        token: str = "GAS",
+        transfers_per_transaction: int = DEFAULT_TRANSFERS_PER_TRANSACTION,
+    ) -> None:
+        """
+        Args:
+            neogo: neo-go CLI that is used to send transactions.
+            rpc_endpoint: RPC endpoint of the chain (for example, http://localhost:30333).
+            token: Token to send (hash or name).
+            transfers_per_transaction: Max number of recipients in a single transaction.
+        """
+        self.neogo = neogo
+        self.rpc_endpoint = rpc_endpoint
+        self.token = token
+        self.transfers_per_transaction = transfers_per_transaction
+        self.rpc_client = RPCClient(rpc_endpoint)
+
+    def fund(
+        self,
+        recipients: list[tuple[str, Union[int, float, str]]],
+        senders: list[FundingSender],
+        wait: bool = True,
+        timeout: float = 60,
+        poll_interval: float = 0.5,
+    ) -> list[str]:
+        """Transfers tokens to recipients.
+
+        Args:
+            recipients: Pairs of recipient address and amount of tokens to send to it.
+            senders: Accounts that send the tokens; chunks of recipients are distributed among
+                them in round-robin order.
+            wait: Whether to wait until all transactions are included in blocks.
+            timeout: Timeout (in seconds) of waiting for transactions.
+            poll_interval: Interval (in seconds) between checks of transactions state.
+
+        Returns:
+            Hashes of sent transactions.
+        """
+        if not senders:
+            raise ValueError("At least one sender is required")
+
+        chunks = [
+            recipients[start : start + self.transfers_per_transaction]
+            for start in range(0, len(recipients), self.transfers_per_transaction)
+        ]
+        chunks_by_sender = [chunks[index :: len(senders)] for index in range(len(senders))]
+        logger.info(
+            f"Sending {len(recipients)} transfers in {len(chunks)} transactions "
+            f"from {len(senders)} senders"
+        )
+
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            tx_hashes_by_sender = executor.map(self._send_chunks, senders, chunks_by_sender)
+            tx_hashes = [
+                tx_hash for sender_hashes in tx_hashes_by_sender for tx_hash in sender_hashes
+            ]
+
+        if wait:
+            self.wait_for_transactions(tx_hashes, timeout, poll_interval)
+        return tx_hashes
+
+    def wait_for_transactions(
+        self, tx_hashes: list[str], timeout: float = 60, poll_interval: float = 0.5
+    ) -> None:
+        """Waits until transactions are included in blocks and checks they were successful.
+
+        Args:
+            tx_hashes: Hashes of transactions to wait for.
+            timeout: Timeout (in seconds) of waiting.
+            poll_interval: Interval (in seconds) between checks of transactions state.
+        """
+        pending = list(tx_hashes)
+        deadline = time.monotonic() + timeout
+        while True:
+            still_pending = []
+            for tx_hash in pending:
+                executions = self._get_executions(tx_hash)
+                if not executions:
+                    still_pending.append(tx_hash)
+                    continue
+                vm_state = executions[0].get("vmstate")
+                if vm_state != "HALT":
+                    raise RuntimeError(
+                        f"Transaction {tx_hash} failed with state {vm_state}: "
+                        f"{executions[0].get('exception')}"
+                    )
+            pending = still_pending
+            if not pending:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Transactions were not included in {timeout}s: {pending}")
+            time.sleep(poll_interval)
+
+    def _get_executions(self, tx_hash: str) -> Optional[list[dict]]:
+        """Returns executions of transaction or None if transaction is not in a block yet."""
+        try:
+            application_log = self.rpc_client.get_application_log(tx_hash)
+        except NeoRPCException as exc:
+            # neo-go responds with error status, so the error is in the response of the cause
+            response = getattr(exc.__cause__, "response", None)
+            details = f"{exc} {response.text if response is not None else ''}"
+            if _UNKNOWN_TRANSACTION_ERROR in details.lower():
+                return None
+            raise
+        error = application_log.get("error")
+        if error:
+            if _UNKNOWN_TRANSACTION_ERROR in str(error.get("message", "")).lower():
+                return None
+            raise NeoRPCException(f"Could not get application log of {tx_hash}: {error}")
+        return application_log.get("executions")
+
+    def _send_chunks(
+        self, sender: FundingSender, chunks: list[list[tuple[str, Union[int, float, str]]]]
+    ) -> list[str]:
+        tx_hashes = []
+        for chunk in chunks:
+            result = self.neogo.nep17.multitransfer(
+                token=self.token,
+                to_address=[address for address, _ in chunk],
+                sysgas=0,
+                rpc_endpoint=self.rpc_endpoint,
+                wallet=sender.wallet if not sender.wallet_config else None,
+                wallet_config=sender.wallet_config,
+                wallet_password=sender.wallet_password if not sender.wallet_config else None,
+                from_address=sender.address,
+                force=True,
+                transfers=[f"{self.token}:{address}:{amount}" for address, amount in chunk],
+            )
+            # neo-go prints hash of the sent transaction in the last line of output
+            tx_hashes.append(result.stdout.strip().splitlines()[-1].strip())
+        return tx_hashes
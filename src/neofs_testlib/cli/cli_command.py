@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from neofs_testlib.shell import CommandOptions, CommandResult, InteractiveInput, Shell
 
@@ -68,6 +68,14 @@ class CliCommand:
     def _execute(self, command: Optional[str], **params) -> CommandResult:
         return self.shell.exec(self._format_command(command, **params))
 
+    def _execute_lines(self, command: Optional[str], **params) -> Iterator[str]:
+        return self.shell.exec_lines(self._format_command(command, **params))
+
+    def _execute_with_options(
+        self, command: Optional[str], options: CommandOptions, **params
+    ) -> CommandResult:
+        return self.shell.exec(self._format_command(command, **params), options=options)
+
     def _execute_with_password(self, command: Optional[str], password, **params) -> CommandResult:
         return self.shell.exec(
             self._format_command(command, **params),
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from neofs_testlib.cli.cli_command import CliCommand
 from neofs_testlib.shell import CommandResult
+from neofs_testlib.utils.object_ids import parse_object_ids
 
 
 class NeofsCliContainer(CliCommand):
@@ -226,6 +227,40 @@ class NeofsCliContainer(CliCommand):
             **{param: value for param, value in locals().items() if param not in ["self"]},
         )
 
+    def iter_objects(
+        self,
+        rpc_endpoint: str,
+        wallet: str,
+        cid: str,
+        address: Optional[str] = None,
+        ttl: Optional[int] = None,
+        xhdr: Optional[dict] = None,
+        timeout: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Iterate over IDs of objects in container as they are printed by the command.
+
+        Unlike list_objects, output is not accumulated, so memory usage does not depend on the
+        number of objects.
+
+        Args:
+            address: Address of wallet account.
+            cid: Container ID.
+            rpc_endpoint: Remote node address (as 'multiaddr' or '<host>:<port>').
+            ttl: TTL value in request meta header (default 2).
+            wallet: WIF (NEP-2) string or path to the wallet or binary key.
+            xhdr: Dict with request X-Headers.
+            timeout: Timeout for the operation (default 15s).
+
+        Yields:
+            Object IDs.
+        """
+        lines = self._execute_lines(
+            "container list-objects",
+            **{param: value for param, value in locals().items() if param not in ["self"]},
+        )
+        yield from parse_object_ids(lines)
+
     def set_eacl(
         self,
         rpc_endpoint: str,
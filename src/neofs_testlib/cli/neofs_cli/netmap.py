@@ -97,6 +97,7 @@ class NeofsCliNetmap(CliCommand):
         wallet: str,
         address: Optional[str] = None,
         generate_key: bool = False,
+        json: bool = False,
         ttl: Optional[int] = None,
         xhdr: Optional[dict] = None,
     ) -> CommandResult:
@@ -106,6 +107,7 @@ class NeofsCliNetmap(CliCommand):
         Args:
             address: Address of wallet account.
             generate_key: Generate new private key.
+            json: Print network map in JSON format.
             rpc_endpoint: Remote node address (as 'multiaddr' or '<host>:<port>').
             ttl: TTL value in request meta header (default 2).
             wallet: Path to the wallet or binary key.
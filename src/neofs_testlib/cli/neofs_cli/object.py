@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from neofs_testlib.cli.cli_command import CliCommand
 from neofs_testlib.shell import CommandResult
+from neofs_testlib.utils.object_ids import parse_object_ids
 
 
 class NeofsCliObject(CliCommand):
@@ -351,3 +352,49 @@ class NeofsCliObject(CliCommand):
             "object search",
             **{param: value for param, value in locals().items() if param not in ["self"]},
         )
+
+    def iter_search(
+        self,
+        rpc_endpoint: str,
+        wallet: str,
+        cid: str,
+        address: Optional[str] = None,
+        bearer: Optional[str] = None,
+        filters: Optional[list] = None,
+        oid: Optional[str] = None,
+        phy: bool = False,
+        root: bool = False,
+        session: Optional[str] = None,
+        ttl: Optional[int] = None,
+        xhdr: Optional[dict] = None,
+        timeout: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Iterate over IDs of found objects as they are printed by the command.
+
+        Unlike search, output is not accumulated, so memory usage does not depend on the number
+        of found objects.
+
+        Args:
+            address: Address of wallet account.
+            bearer: File with signed JSON or binary encoded bearer token.
+            cid: Container ID.
+            filters: Repeated filter expressions or files with protobuf JSON.
+            oid: Object ID.
+            phy: Search physically stored objects.
+            root: Search for user objects.
+            rpc_endpoint: Remote node address (as 'multiaddr' or '<host>:<port>').
+            session: Filepath to a JSON- or binary-encoded token of the object SEARCH session.
+            ttl: TTL value in request meta header (default 2).
+            wallet: WIF (NEP-2) string or path to the wallet or binary key.
+            xhdr: Dict with request X-Headers.
+            timeout: Timeout for the operation (default 15s).
+
+        Yields:
+            Object IDs.
+        """
+        lines = self._execute_lines(
+            "object search",
+            **{param: value for param, value in locals().items() if param not in ["self"]},
+        )
+        yield from parse_object_ids(lines)
@@ -1,7 +1,7 @@
 from typing import Optional, List
 
 from neofs_testlib.cli.cli_command import CliCommand
-from neofs_testlib.shell import CommandResult
+from neofs_testlib.shell import CommandOptions, CommandResult
 
 
 class NeofsCliShards(CliCommand):
@@ -73,6 +73,8 @@ class NeofsCliShards(CliCommand):
         path: str,
         address: Optional[str] = None,
         no_errors: bool = False,
+        timeout: Optional[str] = None,
+        shell_timeout: Optional[int] = None,
     ) -> CommandResult:
         """
         Dump objects from shard to a file.
@@ -84,16 +86,20 @@ class NeofsCliShards(CliCommand):
             path: File to write objects to.
             endpoint: Remote node address (as 'multiaddr' or '<host>:<port>').
             wallet: WIF (NEP-2) string or path to the wallet or binary key.
+            timeout: Timeout for the operation (default 15s).
+            shell_timeout: Timeout (in seconds) of the command in the shell; default shell
+                timeout if not set.
 
         Returns:
             Command's result.
         """
-        return self._execute(
+        return self._execute_with_options(
             f"control shards dump",
+            CommandOptions(timeout=shell_timeout),
             **{
                 param: value
                 for param, value in locals().items()
-                if param not in ["self"]
+                if param not in ["self", "shell_timeout"]
             },
         )
 
@@ -169,6 +175,7 @@ class NeofsCliShards(CliCommand):
             no_errors: bool = False,
             address: Optional[str] = None,
             timeout: Optional[str] = None,
+            shell_timeout: Optional[int] = None,
     ) -> CommandResult:
         """
         Restore objects from shard to a file.
@@ -181,16 +188,19 @@ class NeofsCliShards(CliCommand):
             no_errors: Skip invalid/unreadable objects.
             address: Address of wallet account.
             timeout: Timeout for the operation (default 15s).
+            shell_timeout: Timeout (in seconds) of the command in the shell; default shell
+                timeout if not set.
 
         Returns:
             Command's result.
         """
 
-        return self._execute(
+        return self._execute_with_options(
             f"control shards restore",
+            CommandOptions(timeout=shell_timeout),
             **{
                 param: value
                 for param, value in locals().items()
-                if param not in ["self"]
+                if param not in ["self", "shell_timeout"]
             },
         )
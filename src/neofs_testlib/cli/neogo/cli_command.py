@@ -0,0 +1,24 @@
+from neofs_testlib.cli.cli_command import CliCommand
+from neofs_testlib.cli.neogo.wallet_config import get_wallet_config
+from neofs_testlib.shell import CommandResult, LocalShell
+
+
+class NeoGoCliCommand(CliCommand):
+    """Base class of neo-go commands.
+
+    Commands that open a wallet file with a password on a local machine are executed with
+    a generated wallet config instead of interactive password prompt.
+    """
+
+    def _execute_with_password(self, command: str, password, **params) -> CommandResult:
+        wallet = params.get("wallet")
+        if (
+            isinstance(self.shell, LocalShell)
+            and wallet
+            and wallet != "-"
+            and not params.get("wallet_config")
+        ):
+            params["wallet"] = None
+            params["wallet_config"] = get_wallet_config(wallet, password)
+            return self._execute(command, **params)
+        return super()._execute_with_password(command, password, **params)
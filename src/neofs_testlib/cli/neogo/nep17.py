@@ -1,10 +1,10 @@
 from typing import Optional
 
-from neofs_testlib.cli.cli_command import CliCommand
+from neofs_testlib.cli.neogo.cli_command import NeoGoCliCommand
 from neofs_testlib.shell import CommandResult
 
 
-class NeoGoNep17(CliCommand):
+class NeoGoNep17(NeoGoCliCommand):
     def balance(
         self,
         address: str,
@@ -207,6 +207,8 @@ class NeoGoNep17(CliCommand):
         gas: Optional[float] = None,
         amount: float = 0,
         timeout: int = 10,
+        wallet_password: Optional[str] = None,
+        transfers: Optional[list[str]] = None,
     ) -> CommandResult:
         """Transfer NEP-17 tokens to multiple recipients.
 
@@ -225,15 +227,32 @@ class NeoGoNep17(CliCommand):
             amount: Amount of asset to send.
             rpc_endpoint: RPC node address.
             timeout: Timeout for the operation (default: 10s).
+            wallet_password: Wallet password.
+            transfers: Transfers in `token:address:amount` format. If set, token, to_address and
+                amount are not passed to the command.
 
         Returns:
             Command's result.
         """
         assert bool(wallet) ^ bool(wallet_config), self.WALLET_SOURCE_ERROR_MSG
         exec_param = {
-            param: param_value for param, param_value in locals().items() if param not in ["self"]
+            param: param_value
+            for param, param_value in locals().items()
+            if param not in ["self", "wallet_password", "transfers"]
         }
         exec_param["timeout"] = f"{timeout}s"
+        if transfers:
+            for param in ("token", "to_address", "amount"):
+                exec_param.pop(param)
+            # Transfers are positional arguments, so they go after all flags
+            exec_param["post_data"] = " ".join(transfers)
+
+        if wallet_password is not None:
+            return self._execute_with_password(
+                "wallet nep17 multitransfer",
+                wallet_password,
+                **exec_param,
+            )
         return self._execute(
             "wallet nep17 multitransfer",
             **exec_param,
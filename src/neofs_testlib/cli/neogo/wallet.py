@@ -1,10 +1,10 @@
 from typing import Optional
 
-from neofs_testlib.cli.cli_command import CliCommand
+from neofs_testlib.cli.neogo.cli_command import NeoGoCliCommand
 from neofs_testlib.shell import CommandResult
 
 
-class NeoGoWallet(CliCommand):
+class NeoGoWallet(NeoGoCliCommand):
     def claim(
         self,
         address: str,
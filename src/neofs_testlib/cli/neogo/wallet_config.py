@@ -0,0 +1,48 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional
+
+_wallet_configs: dict[tuple[str, str], str] = {}
+_wallet_configs_lock = threading.Lock()
+_wallet_configs_dir: Optional[str] = None
+
+
+def _get_wallet_configs_dir() -> str:
+    global _wallet_configs_dir
+    if _wallet_configs_dir is None:
+        # Directory is created with 0700 permissions, so passwords are readable only by the owner
+        _wallet_configs_dir = tempfile.mkdtemp(prefix="neogo-wallet-configs-")
+        atexit.register(shutil.rmtree, _wallet_configs_dir, ignore_errors=True)
+    return _wallet_configs_dir
+
+
+def get_wallet_config(wallet: str, password: str) -> str:
+    """Returns path to neo-go wallet config file with location and password of the wallet.
+
+    The config allows neo-go to open the wallet without password prompt. Configs are created in
+    a private temporary directory on first use, cached for the lifetime of the process and
+    removed on exit.
+
+    Args:
+        wallet: Path to the wallet file.
+        password: Password of the wallet.
+
+    Returns:
+        Path to the wallet config file.
+    """
+    wallet = os.path.abspath(wallet)
+    with _wallet_configs_lock:
+        config_path = _wallet_configs.get((wallet, password))
+        if config_path is None or not os.path.isfile(config_path):
+            config_path = os.path.join(_get_wallet_configs_dir(), f"{uuid.uuid4()}.yaml")
+            descriptor = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(descriptor, "w") as config_file:
+                # JSON is valid YAML and takes care of escaping of special characters
+                json.dump({"Path": wallet, "Password": password}, config_file)
+            _wallet_configs[(wallet, password)] = config_path
+        return config_path
@@ -9,22 +9,36 @@ import string
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from importlib.resources import files
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import allure
 import jinja2
 import requests
 import yaml
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_result,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_fixed,
+)
 
 from neofs_testlib.cli import NeofsAdm, NeofsCli
+from neofs_testlib.env import log_rotation, logs, pprof
+from neofs_testlib.env.metrics import MetricsScraper
+from neofs_testlib.env.resources import ResourceSampler
 from neofs_testlib.shell import LocalShell
 from neofs_testlib.utils import wallet as wallet_utils
 
+if TYPE_CHECKING:
+    from neofs_testlib.hosting import Hosting
+
 logger = logging.getLogger("neofs.testlib.env")
 
 
@@ -43,12 +57,22 @@ class WalletType(Enum):
 class NeoFSEnv:
     _busy_ports = []
 
-    def __init__(self, neofs_env_config: dict = None):
+    def __init__(
+        self,
+        neofs_env_config: dict = None,
+        enable_metrics: bool = False,
+        enable_pprof: bool = False,
+    ):
         self.domain = "localhost"
         self.default_password = "password"
         self.shell = LocalShell()
+        self.metrics_enabled = enable_metrics
+        self.pprof_enabled = enable_pprof
         # utilities
         self.neofs_env_config = neofs_env_config
+        self.log_rotation = log_rotation.LogRotationConfig.from_dict(
+            (neofs_env_config or {}).get("logs")
+        )
         self.neofs_adm_path = os.getenv("NEOFS_ADM_BIN", "./neofs-adm")
         self.neofs_cli_path = os.getenv("NEOFS_CLI_BIN", "./neofs-cli")
         self.neo_go_path = os.getenv("NEO_GO_BIN", "./neo-go")
@@ -150,6 +174,94 @@ class NeoFSEnv:
                 ready_counter += 1
         assert ready_counter == len(self.storage_nodes)
             
+    def get_epochs(self, ignore_errors: bool = False) -> dict[str, Optional[int]]:
+        """Returns current epoch reported by each storage node; nodes are queried in parallel.
+
+        Args:
+            ignore_errors: Whether nodes that failed to report epoch should be returned with
+                None epoch instead of raising an error.
+
+        Returns:
+            Mapping of node name (see `nodes`) to its current epoch.
+        """
+        if not self.storage_nodes:
+            raise ValueError("No storage nodes configured in this env")
+
+        def get_epoch(sn: "StorageNode") -> Optional[int]:
+            neofs_cli = self.neofs_cli(sn.cli_config)
+            try:
+                result = neofs_cli.netmap.epoch(rpc_endpoint=sn.endpoint, wallet=sn.wallet.path)
+                return int(result.stdout.strip().splitlines()[-1])
+            except (RuntimeError, ValueError, IndexError) as exc:
+                if not ignore_errors:
+                    raise
+                logger.info(f"Failed to get epoch of sn{sn.sn_number}: {exc}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=len(self.storage_nodes)) as executor:
+            epochs = executor.map(get_epoch, self.storage_nodes)
+            return {f"sn{sn.sn_number}": epoch for sn, epoch in zip(self.storage_nodes, epochs)}
+
+    @allure.step("Tick epoch")
+    def tick_epoch(self, wait: bool = True, timeout: float = 60) -> int:
+        """Forces new epoch in the network.
+
+        Args:
+            wait: Whether to wait until all storage nodes report the new epoch.
+            timeout: Timeout (in seconds) of waiting for the new epoch.
+
+        Returns:
+            Number of the new epoch.
+        """
+        new_epoch = max(self.get_epochs().values()) + 1
+        self.neofs_adm().morph.force_new_epoch(
+            rpc_endpoint=f"http://{self.morph_rpc}",
+            alphabet_wallets=self.alphabet_wallets_dir,
+        )
+        if wait:
+            self.wait_for_epoch(new_epoch, timeout=timeout)
+        return new_epoch
+
+    @allure.step("Wait for epoch {epoch}")
+    def wait_for_epoch(
+        self,
+        epoch: int,
+        timeout: float = 60,
+        poll_interval: float = 0.1,
+        max_poll_interval: float = 1,
+    ) -> None:
+        """Waits until all storage nodes report the epoch (or a later one).
+
+        Nodes are polled in parallel, interval between polls grows exponentially from
+        poll_interval to max_poll_interval. Nodes that fail to report epoch (for example, if
+        they are briefly unavailable during the tick) are considered lagging.
+
+        Args:
+            epoch: Epoch to wait for.
+            timeout: Timeout (in seconds) of waiting.
+            poll_interval: Initial interval (in seconds) between polls.
+            max_poll_interval: Max interval (in seconds) between polls.
+        """
+
+        @retry(
+            wait=wait_exponential(multiplier=poll_interval, max=max_poll_interval),
+            stop=stop_after_delay(timeout),
+            retry=retry_if_result(bool),
+            retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+        )
+        def get_lagging_nodes() -> dict[str, Optional[int]]:
+            epochs = self.get_epochs(ignore_errors=True)
+            return {
+                name: value for name, value in epochs.items() if value is None or value < epoch
+            }
+
+        lagging_nodes = get_lagging_nodes()
+        if lagging_nodes:
+            raise TimeoutError(
+                f"Storage nodes did not reach epoch {epoch} in {timeout}s "
+                f"(None means the node did not respond): {lagging_nodes}"
+            )
+
     @allure.step("Deploy s3 gateway")
     def deploy_s3_gw(self):
         self.s3_gw = S3_GW(self)
@@ -207,15 +319,103 @@ class NeoFSEnv:
             prepared_wallet.path, prepared_wallet.password
         )
 
+    def nodes(self) -> dict[str, "InnerRing | StorageNode | S3_GW | HTTP_GW | REST_GW"]:
+        """Returns all deployed nodes in the env keyed by node name."""
+        nodes = {f"ir{index}": ir for index, ir in enumerate(self.inner_ring_nodes, start=1)}
+        nodes.update({f"sn{sn.sn_number}": sn for sn in self.storage_nodes})
+        nodes.update({"s3_gw": self.s3_gw, "http_gw": self.http_gw, "rest_gw": self.rest_gw})
+        return {name: node for name, node in nodes.items() if node is not None}
+
+    def processes(self) -> dict[str, subprocess.Popen]:
+        """Returns processes of all running nodes in the env keyed by node name.
+
+        Nodes of a loaded env have no process handles, use `pids` to get their processes.
+        """
+        return {
+            name: node.process
+            for name, node in self.nodes().items()
+            if getattr(node, "process", None) is not None and node.process.poll() is None
+        }
+
+    def pids(self) -> dict[str, int]:
+        """Returns PIDs of all running nodes in the env keyed by node name.
+
+        Unlike `processes`, includes nodes of a loaded env that are still running.
+        """
+        pids = {name: process.pid for name, process in self.processes().items()}
+        for name, node in self.nodes().items():
+            if name not in pids and getattr(node, "process", None) is None:
+                pid = getattr(node, "pid", None)
+                if pid and self._is_node_process(pid, node.stdout):
+                    pids[name] = pid
+        return pids
+
+    def resource_sampler(self, interval: float = 1.0, capacity: int = 3600) -> ResourceSampler:
+        """Creates sampler of CPU, memory, FDs and IO usage of all processes in the env.
+
+        Args:
+            interval: Time (in seconds) between samples.
+            capacity: Max number of samples stored for each process.
+
+        Returns:
+            Sampler that should be started explicitly or used as a context manager.
+        """
+        return ResourceSampler(
+            self.pids,
+            interval=interval,
+            capacity=capacity,
+        )
+
+    def metrics_scraper(self, timeout: int = 10) -> MetricsScraper:
+        """Creates scraper of Prometheus metrics exposed by all nodes in the env.
+
+        Metrics must be enabled when the env is created.
+
+        Args:
+            timeout: Timeout (in seconds) for a single scrape request.
+
+        Returns:
+            Scraper of the nodes' metrics endpoints.
+        """
+        if not self.metrics_enabled:
+            raise RuntimeError("Metrics are not enabled in this env")
+        endpoints = {name: node.metrics_address for name, node in self.nodes().items()}
+        return MetricsScraper(endpoints, timeout=timeout)
+
+    def hosting(self) -> "Hosting":
+        """Creates hosting that manages processes of the env as services of a local host.
+
+        Service names are the same as node names (see `nodes`).
+
+        Returns:
+            Hosting with a single host bound to this env.
+        """
+        # Hosting plugin for local processes depends on the env module
+        from neofs_testlib.hosting import Hosting
+
+        hosting = Hosting()
+        hosting.configure(
+            {
+                "hosts": [
+                    {
+                        "address": self.domain,
+                        "plugin_name": "local",
+                        "services": [{"name": name} for name in self.nodes()],
+                    }
+                ]
+            }
+        )
+        for host in hosting.hosts:
+            host.bind(self)
+        return hosting
+
     @allure.step("Kill current neofs env")
     def kill(self):
-        self.rest_gw.process.kill()
-        self.http_gw.process.kill()
-        self.s3_gw.process.kill()
-        for sn in self.storage_nodes:
-            sn.process.kill()
-        for ir in self.inner_ring_nodes:
-            ir.process.kill()
+        nodes = [self.rest_gw, self.http_gw, self.s3_gw, *self.storage_nodes]
+        nodes.extend(self.inner_ring_nodes)
+        for node in nodes:
+            node.process.kill()
+            log_rotation.stop_rotation(node.stdout, node.stderr)
 
     def persist(self) -> str:
         persisted_path = NeoFSEnv._generate_temp_file(prefix="persisted_env")
@@ -307,12 +507,21 @@ class NeoFSEnv:
 
     @classmethod
     @allure.step("Deploy simple neofs env")
-    def simple(cls, neofs_env_config: dict = None) -> "NeoFSEnv":
+    def simple(
+        cls,
+        neofs_env_config: dict = None,
+        enable_metrics: bool = False,
+        enable_pprof: bool = False,
+    ) -> "NeoFSEnv":
         if not neofs_env_config:
             neofs_env_config = yaml.safe_load(
                 files("neofs_testlib.env.templates").joinpath("neofs_env_config.yaml").read_text()
             )
-        neofs_env = NeoFSEnv(neofs_env_config=neofs_env_config)
+        neofs_env = NeoFSEnv(
+            neofs_env_config=neofs_env_config,
+            enable_metrics=enable_metrics,
+            enable_pprof=enable_pprof,
+        )
         neofs_env.download_binaries()
         neofs_env.deploy_inner_ring_node()
         neofs_env.deploy_storage_nodes(
@@ -396,8 +605,19 @@ class NeoFSEnv:
         Path(dir_path).mkdir(parents=True, exist_ok=True)
         return dir_path
 
+    @staticmethod
+    def _is_node_process(pid: int, stdout: str) -> bool:
+        # Process of a loaded env was launched by another test process. PID might have been
+        # reused since then, so we make sure the process still writes to the node output file
+        try:
+            return os.path.samefile(f"/proc/{pid}/fd/1", stdout)
+        except OSError:
+            return False
+
+
+class InnerRing(pprof.ProfilingMixin, logs.LogSearchMixin):
+    pprof_name = "ir"
 
-class InnerRing:
     def __init__(self, neofs_env: NeoFSEnv):
         self.neofs_env = neofs_env
         self.network_config = NeoFSEnv._generate_temp_file(extension="yml", prefix="ir_network_config")
@@ -413,6 +633,8 @@ class InnerRing:
         self.rpc_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.p2p_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.grpc_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.metrics_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.ir_state_file = NeoFSEnv._generate_temp_file(prefix="ir_state_file")
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
@@ -427,6 +649,8 @@ class InnerRing:
             - RPC address: {self.rpc_address}
             - P2P address: {self.p2p_address}
             - GRPC address: {self.grpc_address}
+            - Metrics address: {self.metrics_address}
+            - Pprof address: {self.pprof_address}
             - IR State file path: {self.ir_state_file}
             - STDOUT: {self.stdout}
             - STDERR: {self.stderr}
@@ -435,6 +659,7 @@ class InnerRing:
     def __getstate__(self):
         attributes = self.__dict__.copy()
         del attributes["process"]
+        attributes["pid"] = self.process.pid if self.process else None
         return attributes
 
     def start(self):
@@ -474,6 +699,10 @@ class InnerRing:
             p2p_address=self.p2p_address,
             grpc_address=self.grpc_address,
             ir_state_file=self.ir_state_file,
+            metrics_enabled=self.neofs_env.metrics_enabled,
+            metrics_address=self.metrics_address,
+            pprof_enabled=self.neofs_env.pprof_enabled,
+            pprof_address=self.pprof_address,
         )
         logger.info(f"Generating CLI config at: {self.cli_config}")
         NeoFSEnv.generate_config_file(
@@ -489,12 +718,11 @@ class InnerRing:
     def _launch_process(self):
         self.stdout = NeoFSEnv._generate_temp_file(prefix="ir_stdout")
         self.stderr = NeoFSEnv._generate_temp_file(prefix="ir_stderr")
-        stdout_fp = open(self.stdout, "w")
-        stderr_fp = open(self.stderr, "w")
-        self.process = subprocess.Popen(
+        self.process = log_rotation.launch_process(
             [self.neofs_env.neofs_ir_path, "--config", self.ir_node_config_path],
-            stdout=stdout_fp,
-            stderr=stderr_fp,
+            self.stdout,
+            self.stderr,
+            self.neofs_env.log_rotation,
         )
 
     @retry(wait=wait_fixed(10), stop=stop_after_attempt(10), reraise=True)
@@ -513,7 +741,7 @@ class Shard:
         self.wc_path = NeoFSEnv._generate_temp_file(prefix="shard_wc")
 
 
-class StorageNode:
+class StorageNode(pprof.ProfilingMixin, logs.LogSearchMixin):
     def __init__(
         self, 
         neofs_env: NeoFSEnv, 
@@ -533,6 +761,8 @@ class StorageNode:
         self.shards = [Shard(), Shard()]
         self.endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.control_grpc_endpoint = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.metrics_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
         self.sn_number = sn_number
@@ -543,11 +773,17 @@ class StorageNode:
         if attrs:
             self.attrs.update(attrs)
 
+    @property
+    def pprof_name(self) -> str:
+        return f"sn_{self.sn_number}"
+
     def __str__(self):
         return f"""
             Storage node:
             - Endpoint: {self.endpoint}
             - Control gRPC endpoint: {self.control_grpc_endpoint}
+            - Metrics address: {self.metrics_address}
+            - Pprof address: {self.pprof_address}
             - Attributes: {self.attrs}
             - STDOUT: {self.stdout}
             - STDERR: {self.stderr}
@@ -556,6 +792,7 @@ class StorageNode:
     def __getstate__(self):
         attributes = self.__dict__.copy()
         del attributes["process"]
+        attributes["pid"] = self.process.pid if self.process else None
         return attributes
 
     @allure.step("Start storage node")
@@ -564,18 +801,7 @@ class StorageNode:
             logger.info(f"Generating wallet for storage node")
             self.neofs_env.generate_wallet(WalletType.STORAGE, self.wallet, label=f"sn{self.sn_number}")
             logger.info(f"Generating config for storage node at {self.storage_node_config_path}")
-
-            sn_config_template = "sn.yaml"
-
-            NeoFSEnv.generate_config_file(
-                config_template=sn_config_template,
-                config_path=self.storage_node_config_path,
-                custom=Path(sn_config_template).is_file(),
-                morph_endpoint=self.neofs_env.morph_rpc,
-                shards=self.shards,
-                wallet=self.wallet,
-                state_file=self.state_file,
-            )
+            self._generate_config()
             logger.info(f"Generating cli config for storage node at: {self.cli_config}")
             NeoFSEnv.generate_config_file(
                 config_template="cli_cfg.yaml", config_path=self.cli_config, wallet=self.wallet
@@ -589,6 +815,7 @@ class StorageNode:
     @allure.step("Stop storage node")
     def stop(self):
         self.process.terminate()
+        log_rotation.stop_rotation(self.stdout, self.stderr)
         
     @allure.step("Delete storage node data")
     def delete_data(self):
@@ -601,18 +828,7 @@ class StorageNode:
             os.remove(shard.wc_path)
         os.remove(self.state_file)
         self.shards = [Shard(), Shard()]
-
-        sn_config_template = "sn.yaml"
-
-        NeoFSEnv.generate_config_file(
-            config_template=sn_config_template,
-            config_path=self.storage_node_config_path,
-            custom=Path(sn_config_template).is_file(),
-            morph_endpoint=self.neofs_env.morph_rpc,
-            shards=self.shards,
-            wallet=self.wallet,
-            state_file=self.state_file,
-        )
+        self._generate_config()
         time.sleep(1)
         
     @allure.step("Delete storage node metadata")
@@ -621,7 +837,17 @@ class StorageNode:
         for shard in self.shards:
             os.remove(shard.metabase_path)
             shard.metabase_path = NeoFSEnv._generate_temp_file(prefix=f"shard_metabase")
+        self._generate_config()
+        time.sleep(1)
+        
+    @allure.step("Set metabase resync")
+    def set_metabase_resync(self, resync_state: bool):
+        self.stop()
+        for idx, _ in enumerate(self.shards):
+            self.attrs.update({f"NEOFS_STORAGE_SHARD_{idx}_RESYNC_METABASE": f"{resync_state}".lower()})
+        self.start(fresh=False)
 
+    def _generate_config(self):
         sn_config_template = "sn.yaml"
 
         NeoFSEnv.generate_config_file(
@@ -632,21 +858,15 @@ class StorageNode:
             shards=self.shards,
             wallet=self.wallet,
             state_file=self.state_file,
+            metrics_enabled=self.neofs_env.metrics_enabled,
+            metrics_address=self.metrics_address,
+            pprof_enabled=self.neofs_env.pprof_enabled,
+            pprof_address=self.pprof_address,
         )
-        time.sleep(1)
-        
-    @allure.step("Set metabase resync")
-    def set_metabase_resync(self, resync_state: bool):
-        self.stop()
-        for idx, _ in enumerate(self.shards):
-            self.attrs.update({f"NEOFS_STORAGE_SHARD_{idx}_RESYNC_METABASE": f"{resync_state}".lower()})
-        self.start(fresh=False)
 
     def _launch_process(self):
         self.stdout = NeoFSEnv._generate_temp_file(prefix=f"sn_{self.sn_number}_stdout")
         self.stderr = NeoFSEnv._generate_temp_file(prefix=f"sn_{self.sn_number}_stderr")
-        stdout_fp = open(self.stdout, "w")
-        stderr_fp = open(self.stderr, "w")
         env_dict = {
             "NEOFS_NODE_WALLET_PATH": self.wallet.path,
             "NEOFS_NODE_WALLET_PASSWORD": self.wallet.password,
@@ -655,10 +875,11 @@ class StorageNode:
             "NEOFS_CONTROL_GRPC_ENDPOINT": self.control_grpc_endpoint,
         }
         env_dict.update(self.attrs)
-        self.process = subprocess.Popen(
+        self.process = log_rotation.launch_process(
             [self.neofs_env.neofs_node_path, "--config", self.storage_node_config_path],
-            stdout=stdout_fp,
-            stderr=stderr_fp,
+            self.stdout,
+            self.stderr,
+            self.neofs_env.log_rotation,
             env=env_dict,
         )
 
@@ -670,7 +891,9 @@ class StorageNode:
         assert "Network status: ONLINE" in result.stdout, "Network is not online"
 
 
-class S3_GW:
+class S3_GW(pprof.ProfilingMixin, logs.LogSearchMixin):
+    pprof_name = "s3gw"
+
     def __init__(self, neofs_env: NeoFSEnv):
         self.neofs_env = neofs_env
         self.config_path = NeoFSEnv._generate_temp_file(extension="yml", prefix="s3gw_config")
@@ -680,6 +903,8 @@ class S3_GW:
             password=self.neofs_env.default_password,
         )
         self.address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.metrics_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.tls_cert_path = NeoFSEnv._generate_temp_file(prefix="s3gw_tls_cert")
         self.tls_key_path = NeoFSEnv._generate_temp_file(prefix="s3gw_tls_key")
         self.stdout = "Not initialized"
@@ -690,6 +915,8 @@ class S3_GW:
         return f"""
             S3 Gateway:
             - Address: {self.address}
+            - Metrics address: {self.metrics_address}
+            - Pprof address: {self.pprof_address}
             - S3 GW Config path: {self.config_path}
             - STDOUT: {self.stdout}
             - STDERR: {self.stderr}
@@ -698,6 +925,7 @@ class S3_GW:
     def __getstate__(self):
         attributes = self.__dict__.copy()
         del attributes["process"]
+        attributes["pid"] = self.process.pid if self.process else None
         return attributes
 
     def start(self):
@@ -728,13 +956,15 @@ class S3_GW:
             key_file_path=self.tls_key_path,
             wallet=self.wallet,
             morph_endpoint=self.neofs_env.morph_rpc,
+            metrics_enabled=self.neofs_env.metrics_enabled,
+            metrics_address=self.metrics_address,
+            pprof_enabled=self.neofs_env.pprof_enabled,
+            pprof_address=self.pprof_address,
         )
 
     def _launch_process(self):
         self.stdout = NeoFSEnv._generate_temp_file(prefix="s3gw_stdout")
         self.stderr = NeoFSEnv._generate_temp_file(prefix="s3gw_stderr")
-        stdout_fp = open(self.stdout, "w")
-        stderr_fp = open(self.stderr, "w")
         s3_gw_env = {
             "S3_GW_LISTEN_DOMAINS": self.neofs_env.domain,
             "S3_GW_TREE_SERVICE": self.neofs_env.storage_nodes[0].endpoint,
@@ -744,15 +974,18 @@ class S3_GW:
             s3_gw_env[f"S3_GW_PEERS_{index}_ADDRESS"] = sn.endpoint
             s3_gw_env[f"S3_GW_PEERS_{index}_WEIGHT"] = "0.2"
 
-        self.process = subprocess.Popen(
+        self.process = log_rotation.launch_process(
             [self.neofs_env.neofs_s3_gw_path, "--config", self.config_path],
-            stdout=stdout_fp,
-            stderr=stderr_fp,
+            self.stdout,
+            self.stderr,
+            self.neofs_env.log_rotation,
             env=s3_gw_env,
         )
 
 
-class HTTP_GW:
+class HTTP_GW(pprof.ProfilingMixin, logs.LogSearchMixin):
+    pprof_name = "http_gw"
+
     def __init__(self, neofs_env: NeoFSEnv):
         self.neofs_env = neofs_env
         self.config_path = NeoFSEnv._generate_temp_file(extension="yml", prefix="http_gw_config")
@@ -762,6 +995,8 @@ class HTTP_GW:
             password=self.neofs_env.default_password,
         )
         self.address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.metrics_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
+        self.pprof_address = f"{self.neofs_env.domain}:{NeoFSEnv.get_available_port()}"
         self.stdout = "Not initialized"
         self.stderr = "Not initialized"
         self.process = None
@@ -770,6 +1005,8 @@ class HTTP_GW:
         return f"""
             HTTP Gateway:
             - Address: {self.address}
+            - Metrics address: {self.metrics_address}
+            - Pprof address: {self.pprof_address}
             - HTTP GW Config path: {self.config_path}
             - STDOUT: {self.stdout}
             - STDERR: {self.stderr}
@@ -778,6 +1015,7 @@ class HTTP_GW:
     def __getstate__(self):
         attributes = self.__dict__.copy()
         del attributes["process"]
+        attributes["pid"] = self.process.pid if self.process else None
         return attributes
 
     def start(self):
@@ -799,28 +1037,33 @@ class HTTP_GW:
             custom=Path(http_config_template).is_file(),
             address=self.address,
             wallet=self.wallet,
+            metrics_enabled=self.neofs_env.metrics_enabled,
+            metrics_address=self.metrics_address,
+            pprof_enabled=self.neofs_env.pprof_enabled,
+            pprof_address=self.pprof_address,
         )
 
     def _launch_process(self):
         self.stdout = NeoFSEnv._generate_temp_file(prefix="http_gw_stdout")
         self.stderr = NeoFSEnv._generate_temp_file(prefix="http_gw_stderr")
-        stdout_fp = open(self.stdout, "w")
-        stderr_fp = open(self.stderr, "w")
         http_gw_env = {}
 
         for index, sn in enumerate(self.neofs_env.storage_nodes):
             http_gw_env[f"HTTP_GW_PEERS_{index}_ADDRESS"] = sn.endpoint
             http_gw_env[f"HTTP_GW_PEERS_{index}_WEIGHT"] = "0.2"
 
-        self.process = subprocess.Popen(
+        self.process = log_rotation.launch_process(
             [self.neofs_env.neofs_http_gw_path, "--config", self.config_path],
-            stdout=stdout_fp,
-            stderr=stderr_fp,
+            self.stdout,
+            self.stderr,
+            self.neofs_env.log_rotation,
             env=http_gw_env,
         )
 
 
-class REST_GW:
+class REST_GW(pprof.ProfilingMixin, logs.LogSearchMixin):
+    pprof_name = "rest_gw"
+
     def __init__(self, neofs_env: NeoFSEnv):
         self.neofs_env = neofs_env
         self.config_path = NeoFSEnv._generate_temp_file(extension="yml", prefix="rest_gw_config")
@@ -836,6 +1079,11 @@ class REST_GW:
         self.stderr = "Not initialized"
         self.process = None
 
+    @property
+    def pprof_enabled(self) -> bool:
+        # pprof of REST gateway is always enabled by its config template
+        return True
+
     def __str__(self):
         return f"""
             REST Gateway:
@@ -850,6 +1098,7 @@ class REST_GW:
     def __getstate__(self):
         attributes = self.__dict__.copy()
         del attributes["process"]
+        attributes["pid"] = self.process.pid if self.process else None
         return attributes
 
     def start(self):
@@ -878,17 +1127,16 @@ class REST_GW:
     def _launch_process(self):
         self.stdout = NeoFSEnv._generate_temp_file(prefix="rest_gw_stdout")
         self.stderr = NeoFSEnv._generate_temp_file(prefix="rest_gw_stderr")
-        stdout_fp = open(self.stdout, "w")
-        stderr_fp = open(self.stderr, "w")
         rest_gw_env = {}
 
         for index, sn in enumerate(self.neofs_env.storage_nodes):
             rest_gw_env[f"REST_GW_POOL_PEERS_{index}_ADDRESS"] = sn.endpoint
             rest_gw_env[f"REST_GW_POOL_PEERS_{index}_WEIGHT"] = "0.2"
 
-        self.process = subprocess.Popen(
+        self.process = log_rotation.launch_process(
             [self.neofs_env.neofs_rest_gw_path, "--config", self.config_path],
-            stdout=stdout_fp,
-            stderr=stderr_fp,
+            self.stdout,
+            self.stderr,
+            self.neofs_env.log_rotation,
             env=rest_gw_env,
         )
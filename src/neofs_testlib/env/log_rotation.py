@@ -0,0 +1,281 @@
+import glob
+import gzip
+import importlib.util
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Optional
+
+logger = logging.getLogger("neofs.testlib.env")
+
+_READ_SIZE = 64 * 1024
+_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+_SEGMENT_SUFFIX_REGEX = re.compile(r"\.(\d+)(\.gz|\.zst)?$")
+
+_file_locks: dict[str, threading.Lock] = {}
+_file_locks_lock = threading.Lock()
+
+
+@dataclass
+class LogRotationConfig:
+    """Settings of rotation of process output files.
+
+    Attributes:
+        max_size: Size (in bytes) of the output file that triggers rotation, 0 disables it.
+        max_age: Age (in seconds) of the output file that triggers rotation, 0 disables it.
+        compression: Compression of rotated segments: gzip, zstd (requires zstandard package)
+            or none.
+        max_segments: Max number of rotated segments to keep, 0 keeps all of them.
+        check_interval: Interval (in seconds) between checks of output files.
+    """
+
+    max_size: int = 100 * 1024 * 1024
+    max_age: int = 0
+    compression: str = "gzip"
+    max_segments: int = 0
+    check_interval: float = 1.0
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict]) -> Optional["LogRotationConfig"]:
+        """Creates settings from `logs` section of env config.
+
+        Rotation is opt-in, so None is returned if the section is missing or not enabled.
+        """
+        config = dict(config or {})
+        if not config.pop("enabled", False):
+            return None
+        return cls(**config)
+
+
+def _open_compressed(path: str, compression: str) -> IO[bytes]:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.open(path, "wb")
+    return gzip.open(path, "wb", compresslevel=6)
+
+
+class _RotatedFile:
+    """Output file of a process that is rotated by copy and truncate."""
+
+    def __init__(self, path: str, config: LogRotationConfig) -> None:
+        self.path = path
+        self.config = config
+        self.opened_at = time.monotonic()
+        self.compression = config.compression
+        if self.compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            logger.warning("zstandard is not installed, log segments are compressed by gzip")
+            self.compression = "gzip"
+
+    def needs_rotation(self) -> bool:
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return False
+        if not size:
+            return False
+        if self.config.max_age and time.monotonic() - self.opened_at >= self.config.max_age:
+            return True
+        return bool(self.config.max_size) and size > self.config.max_size
+
+    def rotate(self) -> None:
+        segments = get_log_segments(self.path)
+        number = _get_segment_number(segments[-1]) + 1 if segments else 1
+        segment_path = f"{self.path}.{number}"
+
+        # The process keeps writing to the same file (opened with O_APPEND), so we copy its
+        # content and truncate it right away; records written in between are lost, same as
+        # with copytruncate of logrotate
+        with (
+            get_file_lock(self.path),
+            open(self.path, "rb") as source,
+            open(segment_path, "wb") as target,
+        ):
+            shutil.copyfileobj(source, target, _READ_SIZE)
+            os.truncate(self.path, 0)
+        self.opened_at = time.monotonic()
+
+        if self.compression in _COMPRESSION_EXTENSIONS:
+            self._compress_segment(segment_path)
+        self._remove_old_segments()
+
+    def _compress_segment(self, segment_path: str) -> None:
+        compressed_path = f"{segment_path}{_COMPRESSION_EXTENSIONS[self.compression]}"
+        temp_path = f"{compressed_path}.tmp"
+        with (
+            open(segment_path, "rb") as source,
+            _open_compressed(temp_path, self.compression) as target,
+        ):
+            shutil.copyfileobj(source, target, _READ_SIZE)
+        os.replace(temp_path, compressed_path)
+        os.remove(segment_path)
+
+    def _remove_old_segments(self) -> None:
+        if not self.config.max_segments:
+            return
+        segments = get_log_segments(self.path)
+        for path in segments[: max(len(segments) - self.config.max_segments, 0)]:
+            os.remove(path)
+
+
+class LogRotator:
+    """Rotates output files of processes in a background thread.
+
+    Processes write their output straight to files, so they don't depend on the test process:
+    if it exits, the files just stop being rotated. When a file exceeds the size or age limit,
+    its content is copied to `<path>.<number>` (and compressed), and the file is truncated.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[str, _RotatedFile] = {}
+        self._lock = threading.Lock()
+        self._rotation_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, path: str, config: LogRotationConfig) -> None:
+        """Starts rotation of the file.
+
+        Args:
+            path: Path to the output file.
+            config: Rotation settings.
+        """
+        with self._lock:
+            self._files[path] = _RotatedFile(path, config)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="log-rotator", daemon=True)
+                self._thread.start()
+
+    def remove(self, path: str) -> None:
+        """Stops rotation of the file, waiting for its rotation if it is in progress."""
+        with self._rotation_lock, self._lock:
+            self._files.pop(path, None)
+
+    def check(self) -> None:
+        """Rotates all files that exceed their limits."""
+        with self._rotation_lock:
+            with self._lock:
+                files = list(self._files.values())
+            for rotated_file in files:
+                try:
+                    if rotated_file.needs_rotation():
+                        rotated_file.rotate()
+                except OSError as exc:
+                    logger.warning(f"Failed to rotate {rotated_file.path}: {exc}")
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._files:
+                    self._thread = None
+                    return
+                interval = min(file.config.check_interval for file in self._files.values())
+            self.check()
+            time.sleep(interval)
+
+
+_rotator = LogRotator()
+
+
+def launch_process(
+    command: list[str],
+    stdout_path: str,
+    stderr_path: str,
+    config: Optional[LogRotationConfig] = None,
+    env: Optional[dict[str, str]] = None,
+) -> subprocess.Popen:
+    """Launches process which output is written to files, optionally with rotation.
+
+    Args:
+        command: Command of the process.
+        stdout_path: Path to the file where stdout of the process should be written.
+        stderr_path: Path to the file where stderr of the process should be written.
+        config: Rotation settings; output files are not rotated if not set.
+        env: Environment variables of the process.
+
+    Returns:
+        Launched process.
+    """
+    # Files are opened in append mode, so that writes of the process continue from the
+    # beginning of the file after it is truncated by rotation
+    with open(stdout_path, "ab") as stdout_fp, open(stderr_path, "ab") as stderr_fp:
+        process = subprocess.Popen(command, stdout=stdout_fp, stderr=stderr_fp, env=env)
+    if config:
+        for path in (stdout_path, stderr_path):
+            _rotator.add(os.fspath(path), config)
+    return process
+
+
+def stop_rotation(*paths: str) -> None:
+    """Stops rotation of output files, for example, when their process is stopped.
+
+    Args:
+        paths: Paths to the output files that were passed to `launch_process`.
+    """
+    for path in paths:
+        _rotator.remove(os.fspath(path))
+
+
+def get_file_lock(path: str) -> threading.Lock:
+    """Returns lock that is held while the output file is truncated by rotation.
+
+    Readers that map the file into memory should hold it, since access to the mapped part of
+    the file beyond its end (after truncation) kills the process with SIGBUS.
+
+    Args:
+        path: Path to the output file.
+
+    Returns:
+        Lock of the file.
+    """
+    path = os.fspath(path)
+    with _file_locks_lock:
+        return _file_locks.setdefault(path, threading.Lock())
+
+
+def _get_segment_number(path: str) -> int:
+    return int(_SEGMENT_SUFFIX_REGEX.search(path).group(1))
+
+
+def get_log_segments(path: str) -> list[str]:
+    """Returns paths to rotated segments of process output file from the oldest to the newest.
+
+    Segments are found on disk, so they are returned for processes launched by other test
+    processes too (for example, env loaded with `NeoFSEnv.load`).
+
+    Args:
+        path: Path to the output file that was passed to `launch_process`.
+
+    Returns:
+        Paths to the segments; empty list if the file was not rotated.
+    """
+    path = os.fspath(path)
+    segments = [
+        segment_path
+        for segment_path in glob.glob(f"{glob.escape(path)}.*")
+        if _SEGMENT_SUFFIX_REGEX.fullmatch(segment_path[len(path) :])
+    ]
+    return sorted(segments, key=_get_segment_number)
+
+
+def open_log_file(path: str) -> IO[bytes]:
+    """Opens output file or its rotated segment for reading, decompressing it if needed.
+
+    Args:
+        path: Path to the output file or to the segment.
+
+    Returns:
+        Binary file object with decompressed content.
+    """
+    path = os.fspath(path)
+    if path.endswith(".zst"):
+        import zstandard
+
+        return zstandard.open(path, "rb")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
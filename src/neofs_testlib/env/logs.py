@@ -0,0 +1,455 @@
+import bisect
+import mmap
+import os
+import re
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from neofs_testlib.env import log_rotation
+
+_JSON_LEVEL_REGEX = re.compile(rb'"level":\s*"(\w+)"')
+_JSON_TIMESTAMP_REGEX = re.compile(rb'"ts":\s*"?([^",}]+)')
+_JSON_MESSAGE_REGEX = re.compile(rb'"msg":\s*"((?:[^"\\]|\\.)*)"')
+_CONSOLE_TIMESTAMP_REGEX = re.compile(
+    rb"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$"
+)
+_CALLER_REGEX = re.compile(rb"^\S+\.go:\d+$")
+_HEAD_SIZE = 256
+
+_log_indexes: dict[str, "LogIndex"] = {}
+_log_indexes_lock = threading.Lock()
+
+
+@dataclass
+class LogRecord:
+    """Single line of a log file.
+
+    Attributes:
+        timestamp: Unix timestamp of the record, None if the line has no timestamp.
+        level: Log level of the record, None if the line has no level.
+        message: Message key of the record (msg field of zap), None if it is not present.
+        line: Text of the line without trailing newline.
+    """
+
+    timestamp: Optional[float]
+    level: Optional[str]
+    message: Optional[str]
+    line: str
+
+
+def _parse_timestamp(value: bytes) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    match = _CONSOLE_TIMESTAMP_REGEX.match(value)
+    if not match:
+        return None
+    seconds, fraction, offset = (group.decode() if group else group for group in match.groups())
+    if not offset or offset == "Z":
+        offset = "+00:00"
+    elif ":" not in offset:
+        offset = f"{offset[:3]}:{offset[3:]}"
+    return datetime.fromisoformat(f"{seconds}{offset}").timestamp() + float(f"0.{fraction or 0}")
+
+
+def parse_log_line(line: bytes) -> tuple[Optional[float], Optional[str], Optional[str]]:
+    """Extracts timestamp, level and message key from a log line of zap logger.
+
+    Both JSON and console encodings of zap are supported.
+
+    Args:
+        line: Log line without trailing newline.
+
+    Returns:
+        Tuple of timestamp, level and message key; missing parts are None.
+    """
+    if line.startswith(b"{"):
+        timestamp_match = _JSON_TIMESTAMP_REGEX.search(line)
+        level_match = _JSON_LEVEL_REGEX.search(line)
+        message_match = _JSON_MESSAGE_REGEX.search(line)
+        return (
+            _parse_timestamp(timestamp_match.group(1)) if timestamp_match else None,
+            level_match.group(1).decode() if level_match else None,
+            message_match.group(1).decode(errors="replace") if message_match else None,
+        )
+
+    # Console encoding: timestamp, level, [logger name], [caller], message, [fields]
+    parts = line.split(b"\t", 5)
+    if len(parts) < 3:
+        return None, None, None
+    timestamp = _parse_timestamp(parts[0])
+    if timestamp is None:
+        return None, None, None
+    message = None
+    for part in parts[2:]:
+        if not _CALLER_REGEX.match(part) and not part.startswith(b"{"):
+            message = part.decode(errors="replace")
+    return timestamp, parts[1].decode(errors="replace").lower(), message
+
+
+def _to_timestamp(moment: Optional[datetime]) -> Optional[float]:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class LogIndex:
+    """Sparse index of a log file produced by zap logger.
+
+    The file is split into blocks of roughly `block_size` bytes aligned to line boundaries.
+    For each block the index keeps its offset, the lowest timestamp of its records and the set
+    of levels present in it; for each message key it keeps the list of blocks where the
+    message occurs. Index is updated incrementally: each update parses only lines that were
+    appended since the previous one.
+
+    Timestamps of records are expected to be non-decreasing, which holds for logs of a single
+    process.
+    """
+
+    def __init__(self, path: str, block_size: int = 256 * 1024) -> None:
+        """
+        Args:
+            path: Path to the log file.
+            block_size: Approximate size (in bytes) of an indexed block.
+        """
+        self.path = path
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._block_offsets = array("q")
+        self._block_timestamps = array("d")
+        self._block_levels: list[set[str]] = []
+        self._blocks_by_message: dict[str, array] = {}
+        self._indexed_size = 0
+        self._inode = None
+        self._head = b""
+        self._last_timestamp = float("-inf")
+
+    def update(self) -> None:
+        """Indexes lines that were appended to the file since the previous update."""
+        with log_rotation.get_file_lock(self.path), self._lock:
+            self._update()
+
+    def _update(self) -> None:
+        try:
+            file_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        size = file_stat.st_size
+        with open(self.path, "rb") as log_file:
+            # Rotation truncates the file, which may have grown back since the previous update,
+            # so the beginning of the file is compared too
+            if (
+                size < self._indexed_size
+                or file_stat.st_ino != self._inode
+                or log_file.read(len(self._head)) != self._head
+            ):
+                self._reset()
+                self._inode = file_stat.st_ino
+            if size == self._indexed_size:
+                return
+            if len(self._head) < _HEAD_SIZE:
+                log_file.seek(0)
+                self._head = log_file.read(min(_HEAD_SIZE, size))
+
+            log_file.seek(self._indexed_size)
+            offset = self._indexed_size
+            while offset < size:
+                chunk = log_file.read(min(4 * self.block_size, size - offset))
+                end = chunk.rfind(b"\n") + 1
+                if not end:
+                    # Line is longer than the chunk, so we read the rest of it
+                    chunk += log_file.readline()
+                    if not chunk.endswith(b"\n"):
+                        # The last line is not complete yet
+                        break
+                    end = len(chunk)
+                self._index_lines(chunk[:end], offset)
+                offset += end
+                log_file.seek(offset)
+        self._indexed_size = offset
+
+    def _index_lines(self, chunk: bytes, offset: int) -> None:
+        position = 0
+        for line in chunk.splitlines(keepends=True):
+            line_offset = offset + position
+            position += len(line)
+            if not self._block_offsets or line_offset - self._block_offsets[-1] >= self.block_size:
+                self._block_offsets.append(line_offset)
+                self._block_timestamps.append(self._last_timestamp)
+                self._block_levels.append(set())
+
+            timestamp, level, message = parse_log_line(line.rstrip(b"\r\n"))
+            if timestamp is not None:
+                self._last_timestamp = timestamp
+            if level is not None:
+                self._block_levels[-1].add(level)
+            if message is not None:
+                blocks = self._blocks_by_message.setdefault(message, array("q"))
+                block = len(self._block_offsets) - 1
+                if not blocks or blocks[-1] != block:
+                    blocks.append(block)
+
+    def search(
+        self,
+        regex: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        level: Optional[str] = None,
+        message: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[LogRecord]:
+        """Searches log records matching specified criteria.
+
+        Only blocks that may contain matching records are read (via mmap). Lines that have no
+        own timestamp (for example, stack traces) are returned only if neither time window nor
+        level is specified.
+
+        Args:
+            regex: Regular expression the line should match.
+            since: If set, only records made at this time or later are returned. Must be in UTC.
+            until: If set, only records made at this time or earlier are returned. Must be in UTC.
+            level: If set, only records of this level are returned.
+            message: If set, only records with this message key are returned.
+            limit: Max number of returned records.
+
+        Returns:
+            Matching records in the order they appear in the file.
+        """
+        # File is not truncated by rotation while it is indexed and mapped
+        with log_rotation.get_file_lock(self.path), self._lock:
+            self._update()
+            return self._search(regex, since, until, level, message, limit)
+
+    def _search(
+        self,
+        regex: str,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        level: Optional[str],
+        message: Optional[str],
+        limit: Optional[int],
+    ) -> list[LogRecord]:
+        if not self._indexed_size:
+            return []
+
+        since_timestamp = _to_timestamp(since)
+        until_timestamp = _to_timestamp(until)
+        blocks = self._get_candidate_blocks(since_timestamp, until_timestamp, level, message)
+
+        pattern = re.compile(regex.encode())
+        records = []
+        with open(self.path, "rb") as log_file:
+            # The file may still be truncated by other processes, so the mapping never exceeds
+            # its current size
+            map_size = min(os.fstat(log_file.fileno()).st_size, self._indexed_size)
+            if not map_size:
+                return []
+            log_map = mmap.mmap(log_file.fileno(), map_size, access=mmap.ACCESS_READ)
+        with log_map:
+            for block in blocks:
+                start = self._block_offsets[block]
+                end = self._get_block_end(block)
+                last_line_start = -1
+                for match in pattern.finditer(log_map, start, end):
+                    line_start = log_map.rfind(b"\n", start, match.start()) + 1 or start
+                    if line_start == last_line_start:
+                        continue
+                    last_line_start = line_start
+                    line_end = log_map.find(b"\n", match.start(), end)
+                    line = log_map[line_start : line_end if line_end != -1 else end]
+
+                    record = LogRecord(*parse_log_line(line), line.decode(errors="replace"))
+                    if self._is_record_matched(
+                        record, since_timestamp, until_timestamp, level, message
+                    ):
+                        records.append(record)
+                        if limit is not None and len(records) >= limit:
+                            return records
+        return records
+
+    def _get_block_end(self, block: int) -> int:
+        if block + 1 < len(self._block_offsets):
+            return self._block_offsets[block + 1]
+        return self._indexed_size
+
+    def _get_candidate_blocks(
+        self,
+        since_timestamp: Optional[float],
+        until_timestamp: Optional[float],
+        level: Optional[str],
+        message: Optional[str],
+    ) -> list[int]:
+        first_block = 0
+        if since_timestamp is not None:
+            # Block can contain records up to the lowest timestamp of the next block
+            first_block = max(bisect.bisect_left(self._block_timestamps, since_timestamp) - 1, 0)
+        last_block = len(self._block_offsets)
+        if until_timestamp is not None:
+            last_block = bisect.bisect_right(self._block_timestamps, until_timestamp)
+
+        if message is not None:
+            blocks = self._blocks_by_message.get(message, ())
+            candidates = blocks[bisect.bisect_left(blocks, first_block) :]
+        else:
+            candidates = range(first_block, last_block)
+
+        result = []
+        for block in candidates:
+            if block >= last_block:
+                break
+            if level is None or level in self._block_levels[block]:
+                result.append(block)
+        return result
+
+    @staticmethod
+    def _is_record_matched(
+        record: LogRecord,
+        since_timestamp: Optional[float],
+        until_timestamp: Optional[float],
+        level: Optional[str],
+        message: Optional[str],
+    ) -> bool:
+        if record.timestamp is None:
+            return since_timestamp is None and until_timestamp is None and level is None
+        if since_timestamp is not None and record.timestamp < since_timestamp:
+            return False
+        if until_timestamp is not None and record.timestamp > until_timestamp:
+            return False
+        if level is not None and record.level != level:
+            return False
+        return message is None or record.message == message
+
+
+def get_log_index(path: str) -> LogIndex:
+    """Returns index of the log file, creating it on first use.
+
+    Indexes are cached for the lifetime of the process, so consecutive searches in the same
+    file only parse lines appended in between.
+
+    Args:
+        path: Path to the log file.
+
+    Returns:
+        Index of the file.
+    """
+    with _log_indexes_lock:
+        if path not in _log_indexes:
+            _log_indexes[path] = LogIndex(path)
+        return _log_indexes[path]
+
+
+def _search_compressed_segment(
+    path: str,
+    regex: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    level: Optional[str] = None,
+    message: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> list[LogRecord]:
+    # Compressed segments can't be mapped to memory, so they are scanned line by line
+    pattern = re.compile(regex.encode())
+    since_timestamp = _to_timestamp(since)
+    until_timestamp = _to_timestamp(until)
+    records = []
+    with log_rotation.open_log_file(path) as segment_file:
+        for line in segment_file:
+            if not pattern.search(line):
+                continue
+            line = line.rstrip(b"\r\n")
+            record = LogRecord(*parse_log_line(line), line.decode(errors="replace"))
+            if LogIndex._is_record_matched(
+                record, since_timestamp, until_timestamp, level, message
+            ):
+                records.append(record)
+                if limit is not None and len(records) >= limit:
+                    break
+    return records
+
+
+def search_logs(
+    paths: list[str],
+    regex: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    level: Optional[str] = None,
+    message: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> list[LogRecord]:
+    """Searches log records in multiple files using cached indexes of the files.
+
+    Rotated segments of the files (see `log_rotation`) are searched too.
+
+    Args:
+        paths: Paths to log files that should be searched.
+        regex: Regular expression the line should match.
+        since: If set, only records made at this time or later are returned. Must be in UTC.
+        until: If set, only records made at this time or earlier are returned. Must be in UTC.
+        level: If set, only records of this level are returned.
+        message: If set, only records with this message key are returned.
+        limit: Max number of returned records from each file (with its rotated segments).
+
+    Returns:
+        Matching records of each file in the order they were written.
+    """
+    records = []
+    for path in map(os.fspath, paths):
+        file_records = []
+        for file_path in log_rotation.get_log_segments(path) + [path]:
+            file_limit = limit - len(file_records) if limit is not None else None
+            if file_limit is not None and file_limit <= 0:
+                break
+            if file_path.endswith((".gz", ".zst")):
+                file_records += _search_compressed_segment(
+                    file_path, regex, since, until, level, message, file_limit
+                )
+            elif os.path.isfile(file_path):
+                file_records += get_log_index(file_path).search(
+                    regex, since, until, level, message, file_limit
+                )
+        records += file_records
+    return records
+
+
+class LogSearchMixin:
+    """Adds search in logs to env nodes.
+
+    Classes that use the mixin must have `stdout` and `stderr` attributes with paths to output
+    files of the node process.
+    """
+
+    stdout: str
+    stderr: str
+
+    def search_logs(
+        self,
+        regex: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        level: Optional[str] = None,
+        message: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[LogRecord]:
+        """Searches records in stdout and stderr logs of the current process of the node.
+
+        Args:
+            regex: Regular expression the line should match.
+            since: If set, only records made at this time or later are returned. Must be in UTC.
+            until: If set, only records made at this time or earlier are returned. Must be in UTC.
+            level: If set, only records of this level (debug, info, warn, error) are returned.
+            message: If set, only records with this message key are returned.
+            limit: Max number of returned records from each of stdout and stderr.
+
+        Returns:
+            Matching log records.
+        """
+        return search_logs([self.stdout, self.stderr], regex, since, until, level, message, limit)
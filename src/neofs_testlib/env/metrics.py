@@ -0,0 +1,233 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from neofs_testlib.reporter import get_reporter
+
+reporter = get_reporter()
+logger = logging.getLogger("neofs.testlib.env")
+
+_SAMPLE_REGEX = re.compile(
+    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>.*)\})?\s+(?P<value>\S+)(?:\s+\S+)?$"
+)
+_LABEL_REGEX = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+_TYPE_REGEX = re.compile(r"^#\s+TYPE\s+(\S+)\s+(\S+)")
+_HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+_CUMULATIVE_TYPES = ("counter", "histogram", "summary")
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class MetricsSnapshot:
+    """Parsed metrics exposed by a single node.
+
+    Attributes:
+        samples: Values of metric series keyed by metric name and sorted label pairs.
+        types: Metric types (counter, gauge, histogram, summary, untyped) keyed by metric family.
+    """
+
+    samples: dict[SeriesKey, float] = field(default_factory=dict)
+    types: dict[str, str] = field(default_factory=dict)
+
+    def type_of(self, name: str) -> str:
+        """Returns type of the metric family the series name belongs to."""
+        if name in self.types:
+            return self.types[name]
+        for suffix in _HISTOGRAM_SUFFIXES:
+            if name.endswith(suffix) and name[: -len(suffix)] in self.types:
+                return self.types[name[: -len(suffix)]]
+        return "untyped"
+
+
+def parse_metrics(text: str) -> MetricsSnapshot:
+    """Parses metrics in Prometheus text exposition format.
+
+    Args:
+        text: Response body of the metrics endpoint.
+
+    Returns:
+        Snapshot with parsed metrics.
+    """
+    snapshot = MetricsSnapshot()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            type_match = _TYPE_REGEX.match(line)
+            if type_match:
+                snapshot.types[type_match.group(1)] = type_match.group(2)
+            continue
+
+        sample_match = _SAMPLE_REGEX.match(line)
+        if not sample_match:
+            logger.debug(f"Skipping malformed metrics line: {line}")
+            continue
+        labels = tuple(sorted(_LABEL_REGEX.findall(sample_match.group("labels") or "")))
+        snapshot.samples[(sample_match.group("name"), labels)] = float(sample_match.group("value"))
+    return snapshot
+
+
+@dataclass
+class MetricsDelta:
+    """Changes of cumulative metrics (counters, histograms, summaries) between two scrapes.
+
+    Attributes:
+        deltas: Non-zero deltas of metric series keyed by node name.
+    """
+
+    deltas: dict[str, dict[SeriesKey, float]] = field(default_factory=dict)
+
+    def get(self, name: str, node: Optional[str] = None, **labels: str) -> float:
+        """Returns total delta of the metric across series matching specified labels.
+
+        Args:
+            name: Name of the metric series.
+            node: If set, only delta of this node is taken into account.
+            labels: Label values the series should have.
+
+        Returns:
+            Sum of matching deltas.
+        """
+        total = 0.0
+        for node_name, node_deltas in self.deltas.items():
+            if node is not None and node_name != node:
+                continue
+            for (series_name, series_labels), series_delta in node_deltas.items():
+                if series_name != name:
+                    continue
+                series_labels = dict(series_labels)
+                if all(series_labels.get(key) == label for key, label in labels.items()):
+                    total += series_delta
+        return total
+
+    def histogram_mean(self, name: str, node: Optional[str] = None, **labels: str) -> float:
+        """Returns mean value of histogram observations made between the scrapes.
+
+        Args:
+            name: Name of the histogram metric family (without _sum/_count suffixes).
+            node: If set, only observations of this node are taken into account.
+            labels: Label values the series should have.
+
+        Returns:
+            Mean observed value or 0 if nothing was observed.
+        """
+        count = self.get(f"{name}_count", node, **labels)
+        if not count:
+            return 0.0
+        return self.get(f"{name}_sum", node, **labels) / count
+
+    def __str__(self) -> str:
+        lines = []
+        for node_name, node_deltas in self.deltas.items():
+            for (name, labels), value in sorted(node_deltas.items()):
+                label_str = ",".join(f'{key}="{label}"' for key, label in labels)
+                lines.append(f"{node_name} {name}{{{label_str}}} {value:+g}")
+        return "\n".join(lines)
+
+
+def diff_metrics(
+    before: dict[str, MetricsSnapshot], after: dict[str, MetricsSnapshot]
+) -> MetricsDelta:
+    """Computes deltas of cumulative metrics between two scrapes of the same nodes.
+
+    Gauges are excluded, because their difference does not describe the work done in between.
+    Nodes that were not scraped at the beginning of the period are excluded as well.
+
+    Args:
+        before: Snapshots taken at the beginning of the measured period keyed by node name.
+        after: Snapshots taken at the end of the measured period keyed by node name.
+
+    Returns:
+        Deltas of cumulative metrics.
+    """
+    delta = MetricsDelta()
+    for node_name, after_snapshot in after.items():
+        if node_name not in before:
+            continue
+        before_samples = before[node_name].samples
+        node_deltas = {}
+        for key, value in after_snapshot.samples.items():
+            if after_snapshot.type_of(key[0]) not in _CUMULATIVE_TYPES:
+                continue
+            change = value - before_samples.get(key, 0.0)
+            if change:
+                node_deltas[key] = change
+        delta.deltas[node_name] = node_deltas
+    return delta
+
+
+class MetricsScraper:
+    """Scrapes metrics endpoints of multiple nodes concurrently over pooled HTTP connections."""
+
+    def __init__(self, endpoints: dict[str, str], timeout: int = 10, max_workers: int = 16) -> None:
+        """
+        Args:
+            endpoints: Metrics endpoint addresses ('<host>:<port>') keyed by node name.
+            timeout: Timeout (in seconds) for a single scrape request.
+            max_workers: Max number of concurrent scrape requests.
+        """
+        self.endpoints = endpoints
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(endpoints) or 1, pool_maxsize=max_workers)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def scrape(self) -> dict[str, MetricsSnapshot]:
+        """Scrapes all endpoints.
+
+        Endpoints that fail to respond are logged and excluded from the result.
+
+        Returns:
+            Snapshots keyed by node name.
+        """
+        if not self.endpoints:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.endpoints))) as pool:
+            futures = {
+                name: pool.submit(self._scrape_endpoint, address)
+                for name, address in self.endpoints.items()
+            }
+        snapshots = {}
+        for name, future in futures.items():
+            try:
+                snapshots[name] = future.result()
+            except requests.RequestException as exc:
+                logger.warning(f"Failed to scrape metrics of {name}: {exc}")
+        return snapshots
+
+    @contextmanager
+    def measure(self, name: str = "metrics") -> Iterator[MetricsDelta]:
+        """Scrapes metrics before and after the block and computes deltas.
+
+        Deltas are attached to the report.
+
+        Args:
+            name: Name of the attachment with deltas.
+
+        Returns:
+            Deltas object that is filled in when the block exits.
+        """
+        delta = MetricsDelta()
+        before = self.scrape()
+        try:
+            yield delta
+        finally:
+            delta.deltas = diff_metrics(before, self.scrape()).deltas
+            reporter.attach(str(delta), f"{name}.txt")
+
+    def _scrape_endpoint(self, address: str) -> MetricsSnapshot:
+        response = self._session.get(f"http://{address}/metrics", timeout=self.timeout)
+        response.raise_for_status()
+        return parse_metrics(response.text)
@@ -0,0 +1,329 @@
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+
+from neofs_testlib.cli import NeofsCli
+from neofs_testlib.utils.payload import PayloadGenerator
+
+if TYPE_CHECKING:
+    from neofs_testlib.env.env import NeoFSEnv, NodeWallet
+
+logger = logging.getLogger("neofs.testlib.env")
+
+# Older versions of neofs-cli print "ID: <oid>" after put, newer ones print "OID: <oid>"
+_OID_REGEX = re.compile(r"^\s*O?ID:\s*(\w+)", re.MULTILINE)
+_TRANSIENT_ERROR_REGEX = re.compile(
+    r"deadline exceeded|timed out|connection refused|connection reset|unavailable",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class UploadItem:
+    """Object that should be uploaded to NeoFS.
+
+    Attributes:
+        cid: ID of the container the object should be put to.
+        file: Path to the file with payload of the object.
+        payload: Payload of the object; used if file is not set. Bytes are written to
+            a temporary file that is removed after the upload; payload of a generator is
+            streamed to neofs-cli through a named pipe without touching the disk.
+        attributes: User attributes of the object.
+    """
+
+    cid: str
+    file: Optional[str] = None
+    payload: Optional[Union[bytes, PayloadGenerator]] = None
+    attributes: Optional[dict] = None
+
+
+@dataclass
+class TransferStats:
+    """Throughput and latency statistics of a batch of transfers.
+
+    Attributes:
+        objects: Number of successfully transferred objects.
+        failed: Number of objects that failed to transfer.
+        total_bytes: Total size of payload of successfully transferred objects.
+        elapsed: Wall-clock time of the whole batch (in seconds).
+        latencies: Durations of successful transfers (in seconds).
+    """
+
+    objects: int = 0
+    failed: int = 0
+    total_bytes: int = 0
+    elapsed: float = 0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.objects / self.elapsed if self.elapsed else 0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.total_bytes / (1024 * 1024) / self.elapsed if self.elapsed else 0
+
+    def percentile(self, percent: float) -> float:
+        """Returns latency percentile (nearest-rank) of successful transfers.
+
+        Args:
+            percent: Percentile to calculate, from 0 to 100.
+
+        Returns:
+            Latency (in seconds); 0 if there were no successful transfers.
+        """
+        if not self.latencies:
+            return 0
+        latencies = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def summary(self) -> dict[str, float]:
+        """Returns statistics as a flat dictionary suitable for logging or reports."""
+        return {
+            "objects": self.objects,
+            "failed": self.failed,
+            "objects_per_second": self.objects_per_second,
+            "megabytes_per_second": self.megabytes_per_second,
+            "latency_p50": self.percentile(50),
+            "latency_p90": self.percentile(90),
+            "latency_p99": self.percentile(99),
+            "latency_max": self.percentile(100),
+        }
+
+
+@dataclass
+class TransferResult:
+    """Result of a batch of transfers.
+
+    Attributes:
+        values: For each input item in the same order: OID of uploaded object or path to
+            downloaded file; None if the transfer failed.
+        errors: For each input item: error of the transfer or None if it succeeded.
+        stats: Throughput and latency statistics of the batch.
+    """
+
+    values: list[Optional[str]]
+    errors: list[Optional[Exception]]
+    stats: TransferStats
+
+
+class ObjectTransfer:
+    """Uploads and downloads objects concurrently via neofs-cli.
+
+    Operations are spread across storage node endpoints in round-robin order and run with
+    bounded concurrency. Transient failures (timeouts, unavailable nodes) are retried on the
+    next endpoint.
+    """
+
+    def __init__(
+        self,
+        neofs_cli: NeofsCli,
+        endpoints: list[str],
+        wallet: str,
+        max_workers: int = 16,
+        retries: int = 2,
+        retry_delay: float = 0.5,
+        timeout: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            neofs_cli: neofs-cli configured with the wallet password.
+            endpoints: Endpoints of storage nodes.
+            wallet: Path to the wallet that signs requests.
+            max_workers: Max number of concurrent operations.
+            retries: Number of retries of an operation that failed with transient error.
+            retry_delay: Delay (in seconds) before a retry.
+            timeout: Timeout of a single operation in neofs-cli format (for example, 30s).
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self.neofs_cli = neofs_cli
+        self.endpoints = endpoints
+        self.wallet = wallet
+        self.max_workers = max_workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls, neofs_env: "NeoFSEnv", wallet: "NodeWallet", **kwargs) -> "ObjectTransfer":
+        """Creates transfer engine that uses all storage nodes of the env.
+
+        Args:
+            neofs_env: Env which storage nodes should be used.
+            wallet: Wallet that signs requests.
+            **kwargs: Other arguments of the constructor.
+
+        Returns:
+            Transfer engine.
+        """
+        neofs_cli = neofs_env.neofs_cli(neofs_env.generate_cli_config(wallet))
+        endpoints = [storage_node.endpoint for storage_node in neofs_env.storage_nodes]
+        return cls(neofs_cli, endpoints, wallet.path, **kwargs)
+
+    def upload(self, items: Iterable[UploadItem], raise_on_error: bool = True) -> TransferResult:
+        """Puts objects to NeoFS.
+
+        Args:
+            items: Objects to upload; the iterable is consumed lazily, so it can be a generator.
+            raise_on_error: Whether to raise an error if any upload failed.
+
+        Returns:
+            Result with OIDs of uploaded objects.
+        """
+        return self._run(self._upload, items, raise_on_error)
+
+    def download(
+        self,
+        objects: Iterable[tuple[str, str]],
+        directory: Optional[str] = None,
+        raise_on_error: bool = True,
+    ) -> TransferResult:
+        """Gets objects from NeoFS.
+
+        Args:
+            objects: Pairs of container ID and object ID.
+            directory: Directory where payloads are saved as `<cid>_<oid>` files. If not set,
+                payloads are saved to temporary files that are removed right after the download.
+            raise_on_error: Whether to raise an error if any download failed.
+
+        Returns:
+            Result with paths to downloaded files (None if directory is not set).
+        """
+        return self._run(partial(self._download, directory=directory), objects, raise_on_error)
+
+    def _run(self, operation: Callable, items: Iterable, raise_on_error: bool) -> TransferResult:
+        stats = TransferStats()
+        values: dict[int, Optional[str]] = {}
+        errors: dict[int, Optional[Exception]] = {}
+        lock = threading.Lock()
+        # Bound the number of queued items, so that lazy iterables are not consumed at once
+        slots = threading.BoundedSemaphore(self.max_workers * 2)
+
+        def on_done(index: int, future: Future) -> None:
+            slots.release()
+            with lock:
+                try:
+                    value, size, latency = future.result()
+                except Exception as exc:
+                    values[index], errors[index] = None, exc
+                    stats.failed += 1
+                    return
+                values[index], errors[index] = value, None
+                stats.objects += 1
+                stats.total_bytes += size
+                stats.latencies.append(latency)
+
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, item in enumerate(items):
+                slots.acquire()
+                future = executor.submit(operation, index, item)
+                future.add_done_callback(lambda done, index=index: on_done(index, done))
+        stats.elapsed = time.monotonic() - start_time
+
+        count = len(values)
+        result = TransferResult(
+            values=[values[index] for index in range(count)],
+            errors=[errors[index] for index in range(count)],
+            stats=stats,
+        )
+        logger.info(
+            f"Transferred {stats.objects} objects, {stats.failed} failed: {stats.summary()}"
+        )
+        if raise_on_error and stats.failed:
+            failures = [f"#{index}: {error}" for index, error in enumerate(result.errors) if error]
+            raise RuntimeError(f"{stats.failed} transfers failed:\n" + "\n".join(failures))
+        return result
+
+    def _upload(self, index: int, item: UploadItem) -> tuple[str, int, float]:
+        temp_file_path = None
+        file_path = item.file
+        if file_path is None:
+            if item.payload is None:
+                raise ValueError("Either file or payload must be set")
+            if not isinstance(item.payload, PayloadGenerator):
+                with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+                    temp_file.write(item.payload)
+                file_path = temp_file_path = temp_file.name
+
+        def put(endpoint: str) -> str:
+            if file_path is not None:
+                return self._put(item, endpoint, file_path)
+            # Pipe can be read only once, so each attempt streams the payload through a new one
+            with item.payload.fifo() as fifo_path:
+                return self._put(item, endpoint, fifo_path)
+
+        try:
+            size = os.path.getsize(file_path) if file_path is not None else item.payload.size
+            start_time = time.monotonic()
+            output = self._execute_with_retries(index, put)
+            latency = time.monotonic() - start_time
+            match = _OID_REGEX.search(output)
+            if not match:
+                raise RuntimeError(f"Could not find object ID in output: {output}")
+            return match.group(1), size, latency
+        finally:
+            if temp_file_path:
+                os.remove(temp_file_path)
+
+    def _put(self, item: UploadItem, endpoint: str, file_path: str) -> str:
+        return self.neofs_cli.object.put(
+            rpc_endpoint=endpoint,
+            wallet=self.wallet,
+            cid=item.cid,
+            file=file_path,
+            attributes=item.attributes,
+            no_progress=True,
+            timeout=self.timeout,
+        ).stdout
+
+    def _download(
+        self, index: int, cid_oid: tuple[str, str], directory: Optional[str]
+    ) -> tuple[Optional[str], int, float]:
+        cid, oid = cid_oid
+        if directory:
+            file_path = os.path.join(directory, f"{cid}_{oid}")
+        else:
+            descriptor, file_path = tempfile.mkstemp()
+            os.close(descriptor)
+
+        try:
+            start_time = time.monotonic()
+            self._execute_with_retries(
+                index,
+                lambda endpoint: self.neofs_cli.object.get(
+                    rpc_endpoint=endpoint,
+                    wallet=self.wallet,
+                    cid=cid,
+                    oid=oid,
+                    file=file_path,
+                    no_progress=True,
+                    timeout=self.timeout,
+                ).stdout,
+            )
+            latency = time.monotonic() - start_time
+            return (file_path if directory else None), os.path.getsize(file_path), latency
+        finally:
+            if not directory:
+                os.remove(file_path)
+
+    def _execute_with_retries(self, index: int, execute: Callable[[str], str]) -> str:
+        for attempt in range(self.retries + 1):
+            endpoint = self.endpoints[(index + attempt) % len(self.endpoints)]
+            try:
+                return execute(endpoint)
+            except RuntimeError as exc:
+                if attempt == self.retries or not _TRANSIENT_ERROR_REGEX.search(str(exc)):
+                    raise
+                logger.warning(f"Transfer #{index} via {endpoint} failed, retrying: {exc}")
+                time.sleep(self.retry_delay)
@@ -0,0 +1,176 @@
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ContextManager, Iterator, Optional
+
+import requests
+
+from neofs_testlib.reporter import get_reporter
+
+if TYPE_CHECKING:
+    from neofs_testlib.env.env import NeoFSEnv
+
+logger = logging.getLogger("neofs.testlib.env")
+reporter = get_reporter()
+
+
+@dataclass
+class ProfileResult:
+    """Profiles collected from a single process.
+
+    Attributes:
+        paths: Paths to the files with collected profiles keyed by profile kind (cpu, cpu_1, ...
+            for segments of CPU profile, heap, goroutine). Files are in gzipped protobuf format
+            of pprof.
+        errors: Errors that happened while collecting profiles keyed by profile kind.
+    """
+
+    paths: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def fetch_profile(
+    pprof_address: str, kind: str, seconds: Optional[int] = None, timeout: int = 30
+) -> bytes:
+    """Fetches profile from pprof HTTP server of a Go service.
+
+    Args:
+        pprof_address: Address of the pprof server ('<host>:<port>').
+        kind: Kind of the profile as it is named in net/http/pprof ('profile' for CPU, 'heap',
+            'goroutine', 'allocs', 'block', 'mutex').
+        seconds: Duration of the profile for kinds that collect samples over time.
+        timeout: Timeout (in seconds) of HTTP request in addition to the profile duration.
+
+    Returns:
+        Profile in gzipped protobuf format.
+    """
+    params = {"seconds": seconds} if seconds else None
+    response = requests.get(
+        f"http://{pprof_address}/debug/pprof/{kind}",
+        params=params,
+        timeout=timeout + (seconds or 0),
+    )
+    response.raise_for_status()
+    return response.content
+
+
+@contextmanager
+def profile(
+    name: str,
+    pprof_address: str,
+    output_dir: str,
+    cpu: bool = True,
+    heap: bool = True,
+    goroutine: bool = False,
+    duration: int = 30,
+    cpu_segment: int = 5,
+) -> Iterator[ProfileResult]:
+    """Collects profiles of a Go service while the block is executed.
+
+    CPU profile is collected in background during the block, but not longer than `duration`
+    seconds. pprof can't stop CPU profile before the requested time, so the profile is
+    collected in consecutive segments of `cpu_segment` seconds, and exit from the block waits
+    only for the current segment. Segments are stored as separate profiles (cpu, cpu_1, cpu_2,
+    ...) that can be merged by `go tool pprof`. Heap and goroutine profiles are taken when the
+    block exits. All collected profiles are attached to the reporter.
+
+    Args:
+        name: Name of the profiled service, used in file and attachment names.
+        pprof_address: Address of the pprof server ('<host>:<port>').
+        output_dir: Directory where profile files should be stored.
+        cpu: Whether to collect CPU profile.
+        heap: Whether to collect heap profile.
+        goroutine: Whether to collect goroutine profile.
+        duration: Max duration (in seconds) of CPU profile.
+        cpu_segment: Duration (in seconds) of a single segment of CPU profile.
+
+    Returns:
+        Result object that is filled in when the block exits.
+    """
+    result = ProfileResult()
+    profiles: dict[str, bytes] = {}
+    block_exited = threading.Event()
+
+    def collect(kind: str, pprof_kind: str, seconds: Optional[int] = None) -> None:
+        try:
+            profiles[kind] = fetch_profile(pprof_address, pprof_kind, seconds)
+        except requests.RequestException as exc:
+            logger.warning(f"Failed to collect {kind} profile of {name}: {exc}")
+            result.errors[kind] = str(exc)
+
+    def collect_cpu() -> None:
+        deadline = time.monotonic() + duration
+        segment = 0
+        while not block_exited.is_set():
+            seconds = min(cpu_segment, math.ceil(deadline - time.monotonic()))
+            if seconds <= 0:
+                return
+            collect("cpu" if not segment else f"cpu_{segment}", "profile", seconds)
+            segment += 1
+
+    cpu_thread = None
+    if cpu:
+        cpu_thread = threading.Thread(target=collect_cpu, name=f"{name}-cpu-profile", daemon=True)
+        cpu_thread.start()
+    try:
+        yield result
+    finally:
+        block_exited.set()
+        if heap:
+            collect("heap", "heap")
+        if goroutine:
+            collect("goroutine", "goroutine")
+        if cpu_thread:
+            cpu_thread.join()
+
+        for kind, content in profiles.items():
+            path = os.path.join(output_dir, f"{name}_{kind}.pb.gz")
+            with open(path, "wb") as profile_file:
+                profile_file.write(content)
+            result.paths[kind] = path
+            reporter.attach(content, f"{name}_{kind}.pb.gz")
+
+
+class ProfilingMixin:
+    """Adds profiling via pprof server to env nodes.
+
+    Classes that use the mixin must have `neofs_env`, `pprof_address` and `pprof_name`
+    attributes.
+    """
+
+    neofs_env: "NeoFSEnv"
+    pprof_address: str
+    pprof_name: str
+
+    @property
+    def pprof_enabled(self) -> bool:
+        return self.neofs_env.pprof_enabled
+
+    def profile(
+        self,
+        cpu: bool = True,
+        heap: bool = True,
+        goroutine: bool = False,
+        duration: int = 30,
+        cpu_segment: int = 5,
+    ) -> ContextManager[ProfileResult]:
+        """Collects profiles of the node while the block is executed, see `profile`.
+
+        pprof must be enabled when the env is created.
+        """
+        if not self.pprof_enabled:
+            raise RuntimeError("pprof is not enabled, create env with enable_pprof=True")
+        return profile(
+            self.pprof_name,
+            self.pprof_address,
+            self.neofs_env._generate_temp_dir(prefix=f"{self.pprof_name}_pprof"),
+            cpu=cpu,
+            heap=heap,
+            goroutine=goroutine,
+            duration=duration,
+            cpu_segment=cpu_segment,
+        )
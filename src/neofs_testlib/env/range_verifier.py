@@ -0,0 +1,288 @@
+import hashlib
+import logging
+import mmap
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
+
+from neofs_testlib.cli import NeofsCli
+from neofs_testlib.env.object_transfer import TransferStats
+from neofs_testlib.utils.payload import PayloadGenerator
+
+if TYPE_CHECKING:
+    from neofs_testlib.env.env import NeoFSEnv, NodeWallet
+
+logger = logging.getLogger("neofs.testlib.env")
+
+_RANGE_HASH_REGEX = re.compile(r"Offset=(\d+) \(Length=(\d+)\)\s*:\s*([0-9a-fA-F]+)")
+
+
+def split_ranges(size: int, parts: int) -> list[tuple[int, int]]:
+    """Splits payload into contiguous ranges of nearly equal length.
+
+    Args:
+        size: Size of the payload (in bytes).
+        parts: Number of ranges; reduced if the payload is smaller, so that no range is empty.
+
+    Returns:
+        Pairs of offset and length of the ranges.
+    """
+    parts = max(min(parts, size), 1)
+    base_length, remainder = divmod(size, parts)
+    ranges = []
+    offset = 0
+    for index in range(parts):
+        length = base_length + (1 if index < remainder else 0)
+        ranges.append((offset, length))
+        offset += length
+    return ranges
+
+
+@dataclass
+class RangeCheck:
+    """Result of verification of a single payload range.
+
+    Attributes:
+        offset: Offset of the range.
+        length: Length of the range.
+        endpoint: Endpoint of the storage node the range was requested from.
+        expected: Expected SHA-256 hash of the range in hex, None until it is calculated.
+        actual: SHA-256 hash of the range returned by the node, None if request failed.
+        latency: Duration of the request (in seconds).
+        error: Error of the request, if any.
+    """
+
+    offset: int
+    length: int
+    endpoint: str
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+    latency: float = 0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.actual == self.expected
+
+
+@dataclass
+class RangeVerificationResult:
+    """Result of verification of an object by ranges.
+
+    Attributes:
+        checks: Results of individual ranges ordered by offset.
+        stats: Throughput and latency statistics of successful requests.
+    """
+
+    checks: list[RangeCheck]
+    stats: TransferStats
+
+    @property
+    def ok(self) -> bool:
+        return all(check.ok for check in self.checks)
+
+
+class RangeVerifier:
+    """Verifies payload of objects by ranges without downloading objects whole.
+
+    Object is split into ranges that are requested concurrently from different storage nodes
+    (round-robin), either as range hashes computed by the node (`object hash`) or as range data
+    (`object range`). The result is compared with hashes of the same ranges of local data.
+    """
+
+    def __init__(
+        self,
+        neofs_cli: NeofsCli,
+        endpoints: list[str],
+        wallet: str,
+        max_workers: int = 8,
+        timeout: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            neofs_cli: neofs-cli configured with the wallet password.
+            endpoints: Endpoints of storage nodes.
+            wallet: Path to the wallet that signs requests.
+            max_workers: Max number of concurrent requests.
+            timeout: Timeout of a single request in neofs-cli format (for example, 30s).
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self.neofs_cli = neofs_cli
+        self.endpoints = endpoints
+        self.wallet = wallet
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls, neofs_env: "NeoFSEnv", wallet: "NodeWallet", **kwargs) -> "RangeVerifier":
+        """Creates verifier that uses all storage nodes of the env.
+
+        Args:
+            neofs_env: Env which storage nodes should be used.
+            wallet: Wallet that signs requests.
+            **kwargs: Other arguments of the constructor.
+
+        Returns:
+            Range verifier.
+        """
+        neofs_cli = neofs_env.neofs_cli(neofs_env.generate_cli_config(wallet))
+        endpoints = [storage_node.endpoint for storage_node in neofs_env.storage_nodes]
+        return cls(neofs_cli, endpoints, wallet.path, **kwargs)
+
+    def verify(
+        self,
+        cid: str,
+        oid: str,
+        expected_payload: Union[str, PayloadGenerator],
+        parts: int = 8,
+        fetch_data: bool = False,
+        raise_on_error: bool = True,
+    ) -> RangeVerificationResult:
+        """Verifies payload of the object against local data range by range.
+
+        Args:
+            cid: Container ID.
+            oid: Object ID.
+            expected_payload: Path to a file with expected payload or generator of the payload.
+            parts: Number of ranges the payload is split into.
+            fetch_data: If True, range data is fetched with `object range` and hashed locally;
+                otherwise nodes compute range hashes with `object hash`, so no payload is sent
+                over the network.
+            raise_on_error: Whether to raise an error if any range does not match.
+
+        Returns:
+            Results of verification of the ranges.
+        """
+        check_range = self._check_range_data if fetch_data else self._check_range_hash
+        start_time = time.monotonic()
+        with _open_payload(expected_payload) as (payload_size, hash_range):
+            checks = [
+                RangeCheck(
+                    offset=offset,
+                    length=length,
+                    endpoint=self.endpoints[index % len(self.endpoints)],
+                )
+                for index, (offset, length) in enumerate(split_ranges(payload_size, parts))
+            ]
+            # Expected hashes are calculated by the workers too, so local ranges are hashed
+            # concurrently with each other and with requests to the nodes
+            check = partial(self._check_range, check_range, hash_range, cid, oid)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(check, checks))
+
+        stats = TransferStats(elapsed=time.monotonic() - start_time)
+        for check in checks:
+            if check.error is None:
+                stats.objects += 1
+                stats.total_bytes += check.length
+                stats.latencies.append(check.latency)
+            else:
+                stats.failed += 1
+        result = RangeVerificationResult(checks, stats)
+        logger.info(f"Verified {len(checks)} ranges of {cid}/{oid}: {stats.summary()}")
+
+        if raise_on_error and not result.ok:
+            failures = [
+                f"{check.offset}:{check.length} via {check.endpoint}: "
+                f"{check.error or f'expected {check.expected}, got {check.actual}'}"
+                for check in checks
+                if not check.ok
+            ]
+            raise RuntimeError(f"Ranges of {cid}/{oid} do not match:\n" + "\n".join(failures))
+        return result
+
+    def _check_range(
+        self,
+        check_range: Callable[[str, str, RangeCheck], None],
+        hash_range: Callable[[int, int], str],
+        cid: str,
+        oid: str,
+        check: RangeCheck,
+    ) -> None:
+        check.expected = hash_range(check.offset, check.length)
+        check_range(cid, oid, check)
+
+    def _check_range_hash(self, cid: str, oid: str, check: RangeCheck) -> None:
+        start_time = time.monotonic()
+        try:
+            output = self.neofs_cli.object.hash(
+                rpc_endpoint=check.endpoint,
+                wallet=self.wallet,
+                cid=cid,
+                oid=oid,
+                range=f"{check.offset}:{check.length}",
+                # Hash type is not set, since SHA-256 is the default of neofs-cli
+                timeout=self.timeout,
+            ).stdout
+            match = _RANGE_HASH_REGEX.search(output)
+            if not match:
+                raise RuntimeError(f"Could not find range hash in output: {output}")
+            check.actual = match.group(3).lower()
+        except Exception as exc:
+            check.error = exc
+        check.latency = time.monotonic() - start_time
+
+    def _check_range_data(self, cid: str, oid: str, check: RangeCheck) -> None:
+        descriptor, file_path = tempfile.mkstemp()
+        os.close(descriptor)
+        start_time = time.monotonic()
+        try:
+            self.neofs_cli.object.range(
+                rpc_endpoint=check.endpoint,
+                wallet=self.wallet,
+                cid=cid,
+                oid=oid,
+                range=f"{check.offset}:{check.length}",
+                file=file_path,
+                timeout=self.timeout,
+            )
+            check.latency = time.monotonic() - start_time
+            with _open_payload(file_path) as (size, hash_range):
+                check.actual = hash_range(0, size)
+        except Exception as exc:
+            check.latency = time.monotonic() - start_time
+            check.error = exc
+        finally:
+            os.remove(file_path)
+
+
+@contextmanager
+def _open_payload(
+    payload: Union[str, PayloadGenerator]
+) -> Iterator[tuple[int, Callable[[int, int], str]]]:
+    """Opens payload for hashing of its ranges.
+
+    Ranges are hashed incrementally: generated payload chunk by chunk and files through memory
+    map, so a range is never copied into a Python object whole.
+    """
+    if isinstance(payload, PayloadGenerator):
+
+        def hash_generated_range(offset: int, length: int) -> str:
+            range_hash = hashlib.sha256()
+            for chunk in payload.iter_chunks(offset=offset, length=length):
+                range_hash.update(chunk)
+            return range_hash.hexdigest()
+
+        yield payload.size, hash_generated_range
+        return
+
+    size = os.path.getsize(payload)
+    if not size:
+        yield 0, lambda offset, length: hashlib.sha256().hexdigest()
+        return
+    with open(payload, "rb") as payload_file:
+        with mmap.mmap(payload_file.fileno(), 0, access=mmap.ACCESS_READ) as payload_map:
+            view = memoryview(payload_map)
+            try:
+                yield size, lambda offset, length: hashlib.sha256(
+                    view[offset : offset + length]
+                ).hexdigest()
+            finally:
+                view.release()
@@ -0,0 +1,315 @@
+import csv
+import io
+import logging
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from neofs_testlib.reporter import get_reporter
+
+reporter = get_reporter()
+logger = logging.getLogger("neofs.testlib.env")
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass
+class ProcessSample:
+    """Single resource usage sample of a process.
+
+    Attributes:
+        timestamp: Unix time when the sample was taken.
+        cpu_user: Total CPU time spent in user mode (in seconds).
+        cpu_system: Total CPU time spent in kernel mode (in seconds).
+        rss: Resident set size (in bytes).
+        vms: Virtual memory size (in bytes).
+        threads: Number of threads.
+        fds: Number of open file descriptors.
+        read_bytes: Total number of bytes the process caused to be fetched from storage.
+        write_bytes: Total number of bytes the process caused to be sent to storage.
+        pid: PID of the process; cumulative counters start over when the PID changes.
+    """
+
+    timestamp: float
+    cpu_user: float
+    cpu_system: float
+    rss: int
+    vms: int
+    threads: int
+    fds: int
+    read_bytes: int
+    write_bytes: int
+    pid: int = 0
+
+
+SAMPLE_FIELDS = tuple(ProcessSample.__dataclass_fields__)
+
+
+class SampleRingBuffer:
+    """Fixed-size ring buffer of process samples backed by a flat array of doubles.
+
+    When the buffer is full, the oldest samples are overwritten.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._width = len(SAMPLE_FIELDS)
+        self._data = array("d", bytes(8 * capacity * self._width))
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, sample: ProcessSample) -> None:
+        offset = self._head * self._width
+        for index, field_name in enumerate(SAMPLE_FIELDS):
+            self._data[offset + index] = getattr(sample, field_name)
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def samples(self) -> list[ProcessSample]:
+        """Returns stored samples in chronological order."""
+        start = (self._head - self._size) % self.capacity
+        result = []
+        for position in range(self._size):
+            offset = ((start + position) % self.capacity) * self._width
+            values = self._data[offset : offset + self._width]
+            result.append(
+                ProcessSample(
+                    values[0], values[1], values[2], *(int(value) for value in values[3:])
+                )
+            )
+        return result
+
+
+def read_process_sample(pid: int) -> Optional[ProcessSample]:
+    """Reads resource usage of the process from procfs.
+
+    Args:
+        pid: PID of the process.
+
+    Returns:
+        Sample of the process resources or None if the process does not exist anymore.
+    """
+    proc_dir = f"/proc/{pid}"
+    try:
+        with open(f"{proc_dir}/stat") as stat_file:
+            stat_line = stat_file.read()
+        with open(f"{proc_dir}/status") as status_file:
+            status_lines = status_file.readlines()
+        fds = len(os.listdir(f"{proc_dir}/fd"))
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+
+    # Process name may contain spaces and parentheses, so we split after the last ')'
+    stat_fields = stat_line[stat_line.rfind(")") + 2 :].split()
+    status = {}
+    for line in status_lines:
+        key, _, value = line.partition(":")
+        status[key] = value.split()
+
+    read_bytes = write_bytes = 0
+    try:
+        with open(f"{proc_dir}/io") as io_file:
+            for line in io_file:
+                key, _, value = line.partition(":")
+                if key == "read_bytes":
+                    read_bytes = int(value)
+                elif key == "write_bytes":
+                    write_bytes = int(value)
+    except (FileNotFoundError, PermissionError):
+        pass
+
+    return ProcessSample(
+        timestamp=time.time(),
+        cpu_user=int(stat_fields[11]) / _CLOCK_TICKS,
+        cpu_system=int(stat_fields[12]) / _CLOCK_TICKS,
+        rss=int(status.get("VmRSS", [0])[0]) * 1024,
+        vms=int(status.get("VmSize", [0])[0]) * 1024,
+        threads=int(stat_fields[17]),
+        fds=fds,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+        pid=pid,
+    )
+
+
+class ResourceSampler:
+    """Samples resource usage of processes in a background thread.
+
+    Processes are resolved on every tick, so restarted processes are picked up automatically.
+
+    Attributes:
+        interval: Time (in seconds) between samples.
+        capacity: Max number of samples stored for each process.
+    """
+
+    def __init__(
+        self,
+        pids_provider: Callable[[], dict[str, int]],
+        interval: float = 1.0,
+        capacity: int = 3600,
+    ) -> None:
+        """
+        Args:
+            pids_provider: Callable that returns mapping of process names to their PIDs.
+            interval: Time (in seconds) between samples.
+            capacity: Max number of samples stored for each process.
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._pids_provider = pids_provider
+        self._buffers: dict[str, SampleRingBuffer] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ResourceSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Resource sampler has already been started")
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def sample(self) -> None:
+        """Takes single sample of all processes."""
+        for name, pid in self._pids_provider().items():
+            sample = read_process_sample(pid)
+            if sample is None:
+                continue
+            with self._lock:
+                if name not in self._buffers:
+                    self._buffers[name] = SampleRingBuffer(self.capacity)
+                self._buffers[name].append(sample)
+
+    def samples(self) -> dict[str, list[ProcessSample]]:
+        """Returns samples of all processes in chronological order."""
+        with self._lock:
+            return {name: buffer.samples() for name, buffer in self._buffers.items()}
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns aggregated resource usage of each process over the sampled period.
+
+        If a process was restarted (its PID changed), usage of each run is summed up: cumulative
+        counters of a restarted process start from zero, so the whole usage of the new process
+        is counted, while usage of the first run is counted from its first sample.
+        """
+        summary = {}
+        for name, samples in self.samples().items():
+            first, last = samples[0], samples[-1]
+            cpu_time = read_bytes = write_bytes = 0
+            for index, run in enumerate(_split_by_pid(samples)):
+                run_last = run[-1]
+                cpu_time += run_last.cpu_user + run_last.cpu_system
+                read_bytes += run_last.read_bytes
+                write_bytes += run_last.write_bytes
+                if index == 0:
+                    cpu_time -= first.cpu_user + first.cpu_system
+                    read_bytes -= first.read_bytes
+                    write_bytes -= first.write_bytes
+            summary[name] = {
+                "duration": last.timestamp - first.timestamp,
+                "cpu_time": cpu_time,
+                "rss_max": max(sample.rss for sample in samples),
+                "rss_growth": last.rss - first.rss,
+                "fds_max": max(sample.fds for sample in samples),
+                "read_bytes": read_bytes,
+                "write_bytes": write_bytes,
+                "restarts": len({sample.pid for sample in samples}) - 1,
+            }
+        return summary
+
+    def to_csv(self, path: Optional[str] = None) -> str:
+        """Exports samples in CSV format.
+
+        Args:
+            path: If set, CSV is also written to the file.
+
+        Returns:
+            CSV content.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(("process", *SAMPLE_FIELDS))
+        for name, samples in self.samples().items():
+            for sample in samples:
+                writer.writerow((name, *(getattr(sample, field) for field in SAMPLE_FIELDS)))
+        content = buffer.getvalue()
+        if path:
+            with open(path, "w", newline="") as csv_file:
+                csv_file.write(content)
+        return content
+
+    def to_parquet(self, path: str) -> None:
+        """Exports samples to parquet file.
+
+        Requires pyarrow to be installed.
+
+        Args:
+            path: Path to the parquet file.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("pyarrow is required to export samples to parquet") from exc
+
+        columns = {"process": [], **{field: [] for field in SAMPLE_FIELDS}}
+        for name, samples in self.samples().items():
+            for sample in samples:
+                columns["process"].append(name)
+                for field in SAMPLE_FIELDS:
+                    columns[field].append(getattr(sample, field))
+        pq.write_table(pa.table(columns), path)
+
+    def attach(self, name: str = "process_resources") -> None:
+        """Attaches collected samples and summary to the report.
+
+        Args:
+            name: Name of the attachments.
+        """
+        reporter.attach(self.to_csv(), f"{name}.csv")
+        summary_lines = [
+            f"{process}: " + ", ".join(f"{key}={value}" for key, value in usage.items())
+            for process, usage in self.summary().items()
+        ]
+        reporter.attach("\n".join(summary_lines), f"{name}_summary.txt")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            started_at = time.monotonic()
+            try:
+                self.sample()
+            except Exception as exc:
+                logger.warning(f"Failed to sample process resources: {exc}")
+            self._stop_event.wait(max(0.0, self.interval - (time.monotonic() - started_at)))
+
+
+def _split_by_pid(samples: list[ProcessSample]) -> list[list[ProcessSample]]:
+    """Splits chronological samples into runs of consecutive samples of the same process."""
+    runs = []
+    for sample in samples:
+        if not runs or runs[-1][-1].pid != sample.pid:
+            runs.append([])
+        runs[-1].append(sample)
+    return runs
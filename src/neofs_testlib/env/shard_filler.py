@@ -0,0 +1,267 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from neofs_testlib.env.object_transfer import ObjectTransfer, TransferStats, UploadItem
+from neofs_testlib.utils.payload import PayloadGenerator
+
+if TYPE_CHECKING:
+    from neofs_testlib.env.env import NodeWallet, StorageNode
+
+logger = logging.getLogger("neofs.testlib.env")
+
+_MANIFEST_FILE = "manifest.json"
+_OBJECT_IDS_FILE = "objects.txt"
+DEFAULT_SHARD_TIMEOUT = 3600
+
+
+@dataclass
+class Dataset:
+    """Reproducible set of objects of the same size.
+
+    Payload of each object is generated from the seed of the dataset and index of the object,
+    so datasets with the same parameters always consist of the same payloads.
+
+    Attributes:
+        objects: Number of objects.
+        object_size: Size of payload of each object (in bytes).
+        seed: Seed that defines content of payloads.
+        attributes: User attributes that are set on each object.
+    """
+
+    objects: int
+    object_size: int
+    seed: Union[int, str] = 0
+    attributes: Optional[dict] = None
+
+    @property
+    def key(self) -> str:
+        """Content hash of the dataset that identifies it in the cache."""
+        return hashlib.sha256(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()
+
+    def get_payload(self, index: int) -> PayloadGenerator:
+        """Returns generator of payload of the object with the specified index."""
+        return PayloadGenerator(self.object_size, seed=f"{self.seed}:{index}")
+
+    def iter_upload_items(self, cid: str) -> Iterator[UploadItem]:
+        """Generates objects of the dataset lazily.
+
+        Payloads are not materialized: they are generated while `object put` reads them.
+
+        Args:
+            cid: ID of the container the objects should be put to.
+
+        Yields:
+            Objects in the order of their indexes.
+        """
+        for index in range(self.objects):
+            yield UploadItem(cid=cid, payload=self.get_payload(index), attributes=self.attributes)
+
+
+@dataclass
+class FillResult:
+    """Result of filling of a storage node with a dataset.
+
+    Attributes:
+        oids: IDs of objects of the dataset in the order of their indexes.
+        restored: Whether objects were restored from cached shard dumps instead of being put.
+        elapsed: Duration of the filling (in seconds).
+        stats: Statistics of object uploads; None if objects were restored.
+    """
+
+    oids: list[str]
+    restored: bool
+    elapsed: float
+    stats: Optional[TransferStats] = None
+
+
+class ShardFiller:
+    """Fills shards of a storage node with large reproducible datasets.
+
+    The first time a dataset is requested, its objects are put concurrently directly to the
+    storage node. Then shards of the node are dumped (`control shards dump`) to the cache
+    directory under the content hash of the dataset, and the next time the same dataset is
+    requested for the same container, it is loaded with `control shards restore`, which is
+    much faster than putting objects one by one.
+
+    Objects are put to the node, but they are stored there only if the node is in the container
+    placement, so container policy should pin objects to the node (for example, with a filter
+    by node attribute). Dumps contain all objects of the shards, so when the dataset is cached
+    the node should not contain any other objects.
+    """
+
+    def __init__(
+        self,
+        storage_node: "StorageNode",
+        wallet: "NodeWallet",
+        cache_dir: Optional[str] = None,
+        max_workers: int = 16,
+        timeout: Optional[str] = None,
+        shard_timeout: int = DEFAULT_SHARD_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            storage_node: Storage node to fill.
+            wallet: Wallet that owns objects of the datasets.
+            cache_dir: Directory where shard dumps are cached; caching is disabled if not set.
+            max_workers: Max number of concurrent object uploads.
+            timeout: Timeout of a single object upload in neofs-cli format (for example, 30s).
+            shard_timeout: Timeout (in seconds) of dump or restore of a single shard; dumps of
+                large datasets take much longer than the default shell timeout.
+        """
+        self.storage_node = storage_node
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.shard_timeout = shard_timeout
+        neofs_env = storage_node.neofs_env
+        self.control_cli = neofs_env.neofs_cli(storage_node.cli_config)
+        self.transfer = ObjectTransfer(
+            neofs_env.neofs_cli(neofs_env.generate_cli_config(wallet)),
+            [storage_node.endpoint],
+            wallet.path,
+            max_workers=max_workers,
+            timeout=timeout,
+        )
+
+    def fill(self, cid: str, dataset: Dataset, use_cache: bool = True) -> FillResult:
+        """Fills the storage node with objects of the dataset.
+
+        Args:
+            cid: ID of the container the objects should be put to.
+            dataset: Dataset to fill the node with.
+            use_cache: Whether to restore the dataset from the cache if it is there.
+
+        Returns:
+            Result with IDs of objects of the dataset.
+        """
+        start_time = time.monotonic()
+        cache_path = self._get_cache_path(cid, dataset)
+        if use_cache and cache_path and os.path.exists(os.path.join(cache_path, _MANIFEST_FILE)):
+            oids = self._restore_from_cache(cache_path)
+            elapsed = time.monotonic() - start_time
+            logger.info(f"Restored {len(oids)} objects of dataset {dataset.key} in {elapsed:.1f}s")
+            return FillResult(oids=oids, restored=True, elapsed=elapsed)
+
+        result = self.transfer.upload(dataset.iter_upload_items(cid))
+        oids = result.values
+        if cache_path:
+            self._save_to_cache(cache_path, cid, dataset, oids)
+        elapsed = time.monotonic() - start_time
+        logger.info(f"Put {len(oids)} objects of dataset {dataset.key} in {elapsed:.1f}s")
+        return FillResult(oids=oids, restored=False, elapsed=elapsed, stats=result.stats)
+
+    def get_shard_ids(self) -> list[str]:
+        """Returns IDs of shards of the storage node."""
+        output = self.control_cli.shards.list(
+            endpoint=self.storage_node.control_grpc_endpoint,
+            wallet=self.storage_node.wallet.path,
+            json_mode=True,
+        ).stdout
+        return [shard["shard_id"] for shard in json.loads(output)]
+
+    def dump(self, directory: str) -> list[str]:
+        """Dumps all shards of the storage node concurrently.
+
+        Shards are switched to read-only mode for the time of the dump.
+
+        Args:
+            directory: Directory where dump files are created.
+
+        Returns:
+            Paths to the dump files in the order of shards.
+        """
+        shard_ids = self.get_shard_ids()
+        paths = [os.path.join(directory, f"shard-{index}.dump") for index in range(len(shard_ids))]
+        with ThreadPoolExecutor(max_workers=len(shard_ids) or 1) as executor:
+            list(executor.map(self._dump_shard, shard_ids, paths))
+        return paths
+
+    def restore(self, paths: list[str]) -> None:
+        """Restores dump files to shards of the storage node concurrently.
+
+        Args:
+            paths: Paths to dump files; they are distributed among shards in round-robin order.
+        """
+        shard_ids = self.get_shard_ids()
+        assigned_shard_ids = [shard_ids[index % len(shard_ids)] for index in range(len(paths))]
+        # Dumps assigned to the same shard are restored sequentially
+        paths_by_shard: dict[str, list[str]] = {}
+        for shard_id, path in zip(assigned_shard_ids, paths):
+            paths_by_shard.setdefault(shard_id, []).append(path)
+        with ThreadPoolExecutor(max_workers=len(paths_by_shard) or 1) as executor:
+            list(executor.map(self._restore_shard, paths_by_shard.keys(), paths_by_shard.values()))
+
+    def _get_cache_path(self, cid: str, dataset: Dataset) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{dataset.key}-{cid}")
+
+    def _restore_from_cache(self, cache_path: str) -> list[str]:
+        with open(os.path.join(cache_path, _MANIFEST_FILE)) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.restore([os.path.join(cache_path, dump) for dump in manifest["dumps"]])
+        with open(os.path.join(cache_path, _OBJECT_IDS_FILE)) as oids_file:
+            return [line.rstrip("\n") for line in oids_file]
+
+    def _save_to_cache(self, cache_path: str, cid: str, dataset: Dataset, oids: list[str]) -> None:
+        # Cache is built in a temporary directory and moved in place when it is complete, so
+        # interrupted dumps are never used
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = tempfile.mkdtemp(prefix="dataset-", dir=self.cache_dir)
+        try:
+            paths = self.dump(temp_path)
+            with open(os.path.join(temp_path, _OBJECT_IDS_FILE), "w") as oids_file:
+                oids_file.writelines(f"{oid}\n" for oid in oids)
+            manifest = {
+                "dataset": asdict(dataset),
+                "cid": cid,
+                "dumps": [os.path.basename(path) for path in paths],
+            }
+            with open(os.path.join(temp_path, _MANIFEST_FILE), "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+            shutil.rmtree(cache_path, ignore_errors=True)
+            os.rename(temp_path, cache_path)
+        except Exception:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+        logger.info(f"Cached dataset {dataset.key} of container {cid} at {cache_path}")
+
+    def _dump_shard(self, shard_id: str, path: str) -> None:
+        self._set_shard_mode(shard_id, "read-only")
+        try:
+            self.control_cli.shards.dump(
+                endpoint=self.storage_node.control_grpc_endpoint,
+                wallet=self.storage_node.wallet.path,
+                shard_id=shard_id,
+                path=path,
+                timeout=f"{self.shard_timeout}s",
+                shell_timeout=self.shard_timeout,
+            )
+        finally:
+            self._set_shard_mode(shard_id, "read-write")
+
+    def _restore_shard(self, shard_id: str, paths: list[str]) -> None:
+        for path in paths:
+            self.control_cli.shards.restore(
+                endpoint=self.storage_node.control_grpc_endpoint,
+                wallet=self.storage_node.wallet.path,
+                shard_id=shard_id,
+                path=path,
+                timeout=f"{self.shard_timeout}s",
+                shell_timeout=self.shard_timeout,
+            )
+
+    def _set_shard_mode(self, shard_id: str, mode: str) -> None:
+        self.control_cli.shards.set_mode(
+            endpoint=self.storage_node.control_grpc_endpoint,
+            wallet=self.storage_node.wallet.path,
+            mode=mode,
+            shards_id=[shard_id],
+        )
@@ -1,4 +1,4 @@
 from neofs_testlib.hosting.config import CLIConfig, HostConfig, ServiceConfig
 from neofs_testlib.hosting.docker_host import DockerHost
-from neofs_testlib.hosting.hosting import Hosting
+from neofs_testlib.hosting.hosting import Hosting, OperationResult, ServiceKind
 from neofs_testlib.hosting.interfaces import Host
@@ -2,15 +2,19 @@ import json
 import logging
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Union
+from functools import wraps
+from typing import Callable, Optional, Sequence, TypeVar, Union
 
 import docker
-from requests import HTTPError
+from docker.types.daemon import CancellableStream
+from requests import ConnectionError, HTTPError
 
-from neofs_testlib.hosting.config import ParsedAttributes
+from neofs_testlib.hosting.config import HostConfig, ParsedAttributes
 from neofs_testlib.hosting.interfaces import DiskInfo, Host
 from neofs_testlib.shell import LocalShell, Shell, SSHShell
 from neofs_testlib.shell.command_inspectors import SudoInspector
@@ -31,6 +35,8 @@ class HostAttributes(ParsedAttributes):
         ssh_password: Password for SSH connection.
         ssh_private_key_path: Path to private key for SSH connection.
         ssh_private_key_passphrase: Passphrase for the private key.
+        docker_timeout: Timeout (in seconds) for requests to docker API.
+        docker_pool_size: Max number of connections to docker API kept open by each client.
     """
 
     sudo_shell: bool = False
@@ -39,6 +45,8 @@ class HostAttributes(ParsedAttributes):
     ssh_password: Optional[str] = None
     ssh_private_key_path: Optional[str] = None
     ssh_private_key_passphrase: Optional[str] = None
+    docker_timeout: int = 60
+    docker_pool_size: int = 10
 
 
 @dataclass
@@ -58,8 +66,79 @@ class ServiceAttributes(ParsedAttributes):
     stop_timeout: int = 90
 
 
+@dataclass
+class LogCursor:
+    """Position in logs of containers up to which logs have already been read.
+
+    Cursor allows to poll logs incrementally: each read fetches only log lines that were
+    produced after the previous read.
+
+    Attributes:
+        positions: Unix timestamps (with fractional part) of the last read log line keyed by
+            container name.
+    """
+
+    positions: dict[str, float] = field(default_factory=dict)
+
+
+# Shard components of storage node, relative to the storage directory
+STORAGE_META_PATTERNS = ("meta*",)
+STORAGE_DATA_PATTERNS = ("blobovnicza*", "fstree*", "pilorama*")
+
+_STORAGE_PATTERN_REGEX = re.compile(r"^[\w.*?\[\]/-]+$")
+
+_TIMESTAMP_REGEX = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})$"
+)
+
+
+def _parse_log_timestamp(timestamp: str) -> float:
+    """Converts RFC3339Nano timestamp produced by docker into Unix timestamp."""
+    match = _TIMESTAMP_REGEX.match(timestamp)
+    if not match:
+        raise ValueError(f"Invalid timestamp: '{timestamp}'")
+    seconds, fraction, offset = match.groups()
+    parsed = datetime.fromisoformat(f"{seconds}{'+00:00' if offset == 'Z' else offset}")
+    return parsed.timestamp() + float(f"0.{fraction or 0}")
+
+
+def _split_log_line(line: bytes) -> tuple[Optional[float], str]:
+    """Splits log line fetched with timestamps into timestamp and message."""
+    timestamp, _, message = line.decode(errors="ignore").partition(" ")
+    try:
+        return _parse_log_timestamp(timestamp), message
+    except ValueError:
+        return None, line.decode(errors="ignore")
+
+
+T = TypeVar("T")
+
+
+def _reset_clients_on_connection_error(method: Callable[..., T]) -> Callable[..., T]:
+    """Drops cached docker clients of the host if method fails to connect to docker."""
+
+    @wraps(method)
+    def wrapper(self: "DockerHost", *args, **kwargs) -> T:
+        try:
+            return method(self, *args, **kwargs)
+        except ConnectionError:
+            self._invalidate_docker_clients()
+            raise
+
+    return wrapper
+
+
 class DockerHost(Host):
-    """Manages services hosted in Docker containers running on a local or remote machine."""
+    """Manages services hosted in Docker containers running on a local or remote machine.
+
+    Docker clients are created lazily and reused by all operations of the host, so that
+    connections to docker API are kept alive between calls.
+    """
+
+    def __init__(self, config: HostConfig) -> None:
+        super().__init__(config)
+        self._docker_clients: dict[bool, Union[docker.APIClient, docker.DockerClient]] = {}
+        self._docker_clients_lock = threading.Lock()
 
     def get_shell(self) -> Shell:
         host_attributes = HostAttributes.parse(self._config.attributes)
@@ -93,6 +172,7 @@ class DockerHost(Host):
         for service_config in self._config.services:
             self.stop_service(service_config.name)
 
+    @_reset_clients_on_connection_error
     def start_service(self, service_name: str) -> None:
         service_attributes = self._get_service_attributes(service_name)
 
@@ -105,6 +185,7 @@ class DockerHost(Host):
             timeout=service_attributes.start_timeout,
         )
 
+    @_reset_clients_on_connection_error
     def stop_service(self, service_name: str) -> None:
         service_attributes = self._get_service_attributes(service_name)
 
@@ -117,6 +198,7 @@ class DockerHost(Host):
             timeout=service_attributes.stop_timeout,
         )
 
+    @_reset_clients_on_connection_error
     def restart_service(self, service_name: str) -> None:
         service_attributes = self._get_service_attributes(service_name)
 
@@ -129,15 +211,41 @@ class DockerHost(Host):
             timeout=service_attributes.start_timeout,
         )
 
-    def delete_storage_node_data(self, service_name: str, cache_only: bool = False) -> None:
+    @_reset_clients_on_connection_error
+    def delete_storage_node_data(
+        self, service_name: str, cache_only: bool = False, patterns: Optional[Sequence[str]] = None
+    ) -> None:
+        if patterns is None:
+            patterns = STORAGE_META_PATTERNS
+            if not cache_only:
+                patterns += STORAGE_DATA_PATTERNS
+        self.wipe_storage_node_data(service_name, patterns)
+
+    @_reset_clients_on_connection_error
+    def wipe_storage_node_data(self, service_name: str, patterns: Sequence[str]) -> None:
+        """Removes files from storage directory of the storage node in a single container run.
+
+        Args:
+            service_name: Name of storage node service.
+            patterns: Glob patterns of shard components (relative to the storage directory)
+                to remove, for example: ["meta*", "fstree*"].
+        """
+        for pattern in patterns:
+            if not _STORAGE_PATTERN_REGEX.match(pattern) or ".." in pattern:
+                raise ValueError(f"Invalid storage path pattern: '{pattern}'")
+        if not patterns:
+            return
+
+        service_attributes = self._get_service_attributes(service_name)
+        paths = " ".join(f"/storage/{pattern}" for pattern in patterns)
+
         client = self._get_docker_client(api_client=False)
-        meta_files = 'meta0', 'meta1'
-        data_files = 'blobovnicza0', 'blobovnicza1', 'fstree0', 'fstree1', 'pilorama0', 'pilorama1'
-        for meta_file in meta_files:
-            client.containers.run('alpine', f'rm -rf /storage/{meta_file}', volumes_from=[service_name])
-        if not cache_only:
-            for data_file in data_files:
-                client.containers.run('alpine', f'rm -rf /storage/{data_file}', volumes_from=[service_name])
+        client.containers.run(
+            "alpine",
+            ["sh", "-c", f"rm -rf {paths}"],
+            volumes_from=[service_attributes.container_name],
+            remove=True,
+        )
 
     def attach_disk(self, device: str, disk_info: DiskInfo) -> None:
         raise NotImplementedError("Not supported for docker")
@@ -148,6 +256,7 @@ class DockerHost(Host):
     def is_disk_attached(self, device: str, disk_info: DiskInfo) -> bool:
         raise NotImplementedError("Not supported for docker")
 
+    @_reset_clients_on_connection_error
     def dump_logs(
         self,
         directory_path: str,
@@ -155,18 +264,15 @@ class DockerHost(Host):
         until: Optional[datetime] = None,
         filter_regex: Optional[str] = None,
     ) -> None:
-        client = self._get_docker_client()
-        for service_config in self._config.services:
-            container_name = self._get_service_attributes(service_config.name).container_name
-            try:
-                logs = client.logs(container_name, since=since, until=until)
-            except HTTPError as exc:
-                logger.info(f"Got exception while dumping logs of '{container_name}': {exc}")
-                continue
-
-            if filter_regex:
+        filter_pattern = re.compile(filter_regex, re.IGNORECASE) if filter_regex else None
+        for container_name, logs in self.read_logs(since=since, until=until).items():
+            if filter_pattern:
+                # Only matched fragments are kept, as it was done before logs were streamed
                 logs = (
-                    "\n".join(match[0] for match in re.findall(filter_regex, logs, re.IGNORECASE))
+                    "\n".join(
+                        match.group(1) if filter_pattern.groups else match.group(0)
+                        for match in filter_pattern.finditer(logs)
+                    )
                     or f"No matches found in logs based on given filter '{filter_regex}'"
                 )
 
@@ -175,37 +281,121 @@ class DockerHost(Host):
                 directory_path,
                 f"{self._config.address}-{container_name}-log.txt",
             )
-            with open(file_path, "wb") as file:
+            with open(file_path, "w") as file:
                 file.write(logs)
 
+    @_reset_clients_on_connection_error
     def is_message_in_logs(
         self,
         message_regex: str,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
+        cursor: Optional[LogCursor] = None,
+    ) -> bool:
+        """Checks logs on host for specified message regex.
+
+        Logs of all containers are streamed concurrently and scanning stops at the first match.
+
+        Args:
+            message_regex: message to find.
+            since: If set, limits the time from which logs should be collected. Must be in UTC.
+            until: If set, limits the time until which logs should be collected. Must be in UTC.
+            cursor: If set, only logs after the cursor positions are scanned and the cursor
+                is advanced to the last scanned line.
+
+        Returns:
+            True if message found in logs in the given time frame.
+            False otherwise.
+        """
+        return self._scan_logs(message_regex, since, until, cursor, follow=False)
+
+    @_reset_clients_on_connection_error
+    def wait_for_message_in_logs(
+        self,
+        message_regex: str,
+        timeout: float,
+        since: Optional[datetime] = None,
+        cursor: Optional[LogCursor] = None,
     ) -> bool:
+        """Waits until message matching specified regex appears in logs of any container.
+
+        Args:
+            message_regex: message to find.
+            timeout: Time (in seconds) to wait for the message.
+            since: If set, limits the time from which logs should be collected. Must be in UTC.
+            cursor: If set, only logs after the cursor positions are scanned and the cursor
+                is advanced to the last scanned line.
+
+        Returns:
+            True if message appeared in logs before the timeout.
+            False otherwise.
+        """
+        return self._scan_logs(message_regex, since, None, cursor, follow=True, timeout=timeout)
+
+    @_reset_clients_on_connection_error
+    def get_log_cursor(self) -> LogCursor:
+        """Creates cursor that points to the current end of logs of all containers.
+
+        Returns:
+            Log cursor.
+        """
+        # We use time of docker host to be independent of clock skew between machines
+        server_time = _parse_log_timestamp(self._get_docker_client().info()["SystemTime"])
+        return LogCursor(
+            positions={
+                container_name: server_time for container_name in self._get_container_names()
+            }
+        )
+
+    @_reset_clients_on_connection_error
+    def read_logs(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[LogCursor] = None,
+    ) -> dict[str, str]:
+        """Reads logs of all containers on the host concurrently.
+
+        Args:
+            since: If set, limits the time from which logs should be collected. Must be in UTC.
+            until: If set, limits the time until which logs should be collected. Must be in UTC.
+            cursor: If set, only logs after the cursor positions are read and the cursor is
+                advanced to the last read line.
+
+        Returns:
+            Logs keyed by container name.
+        """
         client = self._get_docker_client()
-        for service_config in self._config.services:
-            container_name = self._get_service_attributes(service_config.name).container_name
+        container_names = self._get_container_names()
+
+        def read(container_name: str) -> Optional[str]:
+            container_since = self._get_since(container_name, since, cursor)
             try:
-                logs = client.logs(container_name, since=since, until=until)
+                logs = client.logs(
+                    container_name, since=container_since, until=until, timestamps=True
+                )
             except HTTPError as exc:
                 logger.info(f"Got exception while dumping logs of '{container_name}': {exc}")
-                continue
-
-            if message_regex:
-                matches = re.findall(message_regex, logs, re.IGNORECASE)
-                if matches:
-                    return True
-
-        return False
-
+                return None
+            messages = []
+            for line in logs.splitlines():
+                timestamp, message = _split_log_line(line)
+                messages.append(message)
+                if cursor is not None and timestamp is not None:
+                    cursor.positions[container_name] = timestamp
+            return "\n".join(messages)
+
+        with ThreadPoolExecutor(max_workers=max(len(container_names), 1)) as executor:
+            results = dict(zip(container_names, executor.map(read, container_names)))
+        return {name: logs for name, logs in results.items() if logs is not None}
+
+    @_reset_clients_on_connection_error
     def get_service_pid(self, service_name: str) -> str:
         client = self._get_docker_client()
         top_info = client.top(service_name)
-        pid_index = top_info['Titles'].index('PID')
+        pid_index = top_info["Titles"].index("PID")
         # In the current configuration, only one service runs in each container
-        pid = top_info['Processes'][0][pid_index]
+        pid = top_info["Processes"][0][pid_index]
         return pid
 
     def _get_service_attributes(self, service_name) -> ServiceAttributes:
@@ -213,42 +403,187 @@ class DockerHost(Host):
         return ServiceAttributes.parse(service_config.attributes)
 
     def _get_docker_client(self, api_client=True) -> Union[docker.APIClient, docker.DockerClient]:
-        docker_endpoint = HostAttributes.parse(self._config.attributes).docker_endpoint
+        client = self._docker_clients.get(api_client)
+        if client is not None:
+            return client
+
+        with self._docker_clients_lock:
+            if api_client not in self._docker_clients:
+                self._docker_clients[api_client] = self._create_docker_client(api_client)
+            return self._docker_clients[api_client]
+
+    def _create_docker_client(
+        self, api_client: bool
+    ) -> Union[docker.APIClient, docker.DockerClient]:
+        host_attributes = HostAttributes.parse(self._config.attributes)
 
         client_type = docker.APIClient if api_client else docker.DockerClient
+        # If endpoint is not specified, docker client talks to unix socket
+        return client_type(
+            base_url=host_attributes.docker_endpoint or None,
+            timeout=host_attributes.docker_timeout,
+            max_pool_size=host_attributes.docker_pool_size,
+        )
 
-        if not docker_endpoint:
-            # Use default docker client that talks to unix socket
-            return client_type()
+    def _invalidate_docker_clients(self) -> None:
+        with self._docker_clients_lock:
+            clients = list(self._docker_clients.values())
+            self._docker_clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as exc:
+                logger.debug(f"Failed to close docker client: {exc}")
 
-        # Otherwise use docker client that talks to specified endpoint
-        return client_type(base_url=docker_endpoint)
+    def _get_container_names(self) -> list[str]:
+        return [
+            self._get_service_attributes(service_config.name).container_name
+            for service_config in self._config.services
+        ]
 
-    def _get_container_by_name(self, container_name: str) -> dict[str, Any]:
+    def _get_since(
+        self,
+        container_name: str,
+        since: Optional[datetime],
+        cursor: Optional[LogCursor],
+    ) -> Optional[Union[datetime, float]]:
+        if cursor is not None and container_name in cursor.positions:
+            # Docker includes lines with timestamp equal to since, so we skip the last read line
+            return cursor.positions[container_name] + 1e-6
+        return since
+
+    def _scan_logs(
+        self,
+        message_regex: str,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        cursor: Optional[LogCursor],
+        follow: bool,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        pattern = re.compile(message_regex, re.IGNORECASE)
         client = self._get_docker_client()
-        containers = client.containers(all=True)
-
-        for container in containers:
-            # Names in local docker environment are prefixed with /
-            clean_names = set(name.strip("/") for name in container["Names"])
-            if container_name in clean_names:
-                return container
-        return None
+        container_names = self._get_container_names()
+        found = threading.Event()
+        stopped = threading.Event()
+        streams = []
+        streams_lock = threading.Lock()
+
+        def close_streams() -> None:
+            with streams_lock:
+                stopped.set()
+                while streams:
+                    self._close_stream(streams.pop())
+
+        def scan(container_name: str) -> None:
+            try:
+                stream = client.logs(
+                    container_name,
+                    stream=True,
+                    follow=follow,
+                    timestamps=True,
+                    since=self._get_since(container_name, since, cursor),
+                    until=until,
+                )
+            except HTTPError as exc:
+                logger.info(f"Got exception while reading logs of '{container_name}': {exc}")
+                return
+            with streams_lock:
+                if stopped.is_set():
+                    self._close_stream(stream)
+                    return
+                streams.append(stream)
+
+            pending = b""
+            for chunk in stream:
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    timestamp, message = _split_log_line(line)
+                    if cursor is not None and timestamp is not None:
+                        cursor.positions[container_name] = timestamp
+                    if pattern.search(message):
+                        found.set()
+                        close_streams()
+                        return
+                if stopped.is_set():
+                    return
+            if pending and pattern.search(_split_log_line(pending)[1]):
+                found.set()
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, close_streams)
+            timer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(container_names), 1)) as executor:
+                list(executor.map(scan, container_names))
+        finally:
+            if timer:
+                timer.cancel()
+        return found.is_set()
+
+    def _get_container_state(self, container_name: str) -> Optional[str]:
+        client = self._get_docker_client()
+        try:
+            state = client.inspect_container(container_name)["State"]
+        except docker.errors.NotFound:
+            return None
+        logger.debug(f"Current container state\n:{json.dumps(state, indent=2)}")
+        return state["Status"]
 
     def _wait_for_container_to_be_in_state(
         self, container_name: str, expected_state: str, timeout: int
     ) -> None:
-        iterations = 10
-        iteration_wait_time = timeout / iterations
-
-        # To speed things up, we break timeout in smaller iterations and check container state
-        # several times. This way waiting stops as soon as container reaches the expected state
-        for _ in range(iterations):
-            container = self._get_container_by_name(container_name)
-            logger.debug(f"Current container state\n:{json.dumps(container, indent=2)}")
-
-            if container and container["State"] == expected_state:
+        docker_endpoint = HostAttributes.parse(self._config.attributes).docker_endpoint
+        if docker_endpoint and docker_endpoint.startswith("ssh://"):
+            # Event streams can't be interrupted over SSH transport, so we fall back to polling
+            self._poll_container_state(container_name, expected_state, timeout)
+            return
+
+        # We subscribe to events before checking the state, so that state change that happens
+        # in between can't be missed. Each event of the container triggers a state check, and
+        # the stream is closed when timeout expires
+        client = self._get_docker_client()
+        events = client.events(
+            filters={"type": "container", "container": container_name}, decode=True
+        )
+        timer = threading.Timer(timeout, self._close_stream, args=(events,))
+        timer.start()
+        try:
+            if self._get_container_state(container_name) == expected_state:
                 return
-            time.sleep(iteration_wait_time)
+            for event in events:
+                logger.debug(f"Container {container_name} event: {event.get('status')}")
+                if self._get_container_state(container_name) == expected_state:
+                    return
+        finally:
+            timer.cancel()
+            self._close_stream(events)
+
+        if self._get_container_state(container_name) != expected_state:
+            raise RuntimeError(f"Container {container_name} is not in {expected_state} state.")
+
+    def _poll_container_state(self, container_name: str, expected_state: str, timeout: int) -> None:
+        # Poll frequently at first, since most state changes complete within a second,
+        # and then back off to reduce load on docker daemon
+        deadline = time.monotonic() + timeout
+        poll_interval = 0.1
+        while True:
+            if self._get_container_state(container_name) == expected_state:
+                return
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(poll_interval * 2, 2)
 
         raise RuntimeError(f"Container {container_name} is not in {expected_state} state.")
+
+    @staticmethod
+    def _close_stream(stream: CancellableStream) -> None:
+        try:
+            stream.close()
+        except (OSError, docker.errors.DockerException) as exc:
+            # Stream has already been closed or can't be closed by the transport (for example,
+            # SSH transport raises DockerException), the reader stops at the end of the stream
+            logger.debug(f"Failed to close docker stream: {exc}")
@@ -1,10 +1,73 @@
+import bisect
+import logging
 import re
-from typing import Any
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
 
 from neofs_testlib.hosting.config import HostConfig, ServiceConfig
 from neofs_testlib.hosting.interfaces import Host
 from neofs_testlib.plugins import load_plugin
 
+logger = logging.getLogger("neofs.testlib.hosting")
+
+
+class ServiceKind(Enum):
+    STORAGE = "storage"
+    IR = "ir"
+    S3_GATE = "s3"
+    HTTP_GATE = "http"
+
+
+_SERVICE_NAME_REGEX_BY_KIND = {
+    ServiceKind.STORAGE: re.compile(r"s\d+"),
+    ServiceKind.IR: re.compile(r"ir\d+"),
+    ServiceKind.S3_GATE: re.compile(r"s3-gate\d+"),
+    ServiceKind.HTTP_GATE: re.compile(r"http-gate\d+"),
+}
+
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+_REGEX_OPTIONAL_CHARS = frozenset("*?{")
+
+
+def _get_literal_prefix(pattern: str) -> str:
+    """Returns literal prefix that any string matched by the pattern (with re.match) starts with."""
+    if "|" in pattern:
+        # Alternatives may have different prefixes
+        return ""
+    prefix = []
+    for char in pattern.removeprefix("^"):
+        if char in _REGEX_SPECIAL_CHARS:
+            if char in _REGEX_OPTIONAL_CHARS and prefix:
+                # Preceding char is optional or repeated, so it is not a part of the prefix
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+@dataclass
+class OperationResult:
+    """Outcome of an operation performed on a single service or host.
+
+    Attributes:
+        name: Name of the service or address of the host.
+        error: Exception raised by the operation, None if the operation succeeded.
+        duration: Time (in seconds) the operation took.
+    """
+
+    name: str
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
 
 class Hosting:
     """Hosting manages infrastructure  where neoFS runs (machines and neoFS services)."""
@@ -12,6 +75,11 @@ class Hosting:
     _hosts: list[Host]
     _host_by_address: dict[str, Host]
     _host_by_service_name: dict[str, Host]
+    _service_configs: list[ServiceConfig]
+    _sorted_service_names: list[str]
+    _service_positions: dict[str, int]
+    _service_configs_by_kind: dict[ServiceKind, list[ServiceConfig]]
+    _service_configs_by_pattern: dict[str, list[ServiceConfig]]
 
     @property
     def hosts(self) -> list[Host]:
@@ -33,6 +101,7 @@ class Hosting:
         hosts = []
         host_by_address = {}
         host_by_service_name = {}
+        service_configs = []
 
         host_configs = [HostConfig(**host_config) for host_config in config["hosts"]]
         for host_config in host_configs:
@@ -44,10 +113,12 @@ class Hosting:
 
             for service_config in host_config.services:
                 host_by_service_name[service_config.name] = host
+                service_configs.append(service_config)
 
         self._hosts = hosts
         self._host_by_address = host_by_address
         self._host_by_service_name = host_by_service_name
+        self._build_service_index(service_configs)
 
     def get_host_by_address(self, host_address: str) -> Host:
         """Returns host with specified address.
@@ -98,10 +169,234 @@ class Hosting:
         Returns:
             List of service configs matched with the regular expression.
         """
-        service_configs = [
-            service_config
+        service_configs = self._service_configs_by_pattern.get(service_name_pattern)
+        if service_configs is None:
+            service_configs = self._match_service_configs(service_name_pattern)
+            self._service_configs_by_pattern[service_name_pattern] = service_configs
+        return list(service_configs)
+
+    def get_service_configs_by_kind(self, kind: ServiceKind) -> list[ServiceConfig]:
+        """Returns configs of all services of specified kind.
+
+        Kind of the service is determined by its name, for example: s01 is a storage node,
+        ir01 is an inner ring node, s3-gate01 and http-gate01 are gateways.
+
+        Args:
+            kind: Kind of the services.
+
+        Returns:
+            List of service configs in the order they are defined in the hosting config.
+        """
+        return list(self._service_configs_by_kind[kind])
+
+    def _build_service_index(self, service_configs: list[ServiceConfig]) -> None:
+        self._service_configs = service_configs
+        self._service_positions = {
+            service_config.name: position for position, service_config in enumerate(service_configs)
+        }
+        self._sorted_service_names = sorted(self._service_positions)
+        self._service_configs_by_kind = {
+            kind: [
+                service_config
+                for service_config in service_configs
+                if name_regex.fullmatch(service_config.name)
+            ]
+            for kind, name_regex in _SERVICE_NAME_REGEX_BY_KIND.items()
+        }
+        self._service_configs_by_pattern = {}
+
+    def _match_service_configs(self, service_name_pattern: str) -> list[ServiceConfig]:
+        pattern = re.compile(service_name_pattern)
+        prefix = _get_literal_prefix(service_name_pattern)
+
+        # Only services with names starting with the literal prefix of the pattern can match it
+        start = bisect.bisect_left(self._sorted_service_names, prefix)
+        positions = []
+        for name in self._sorted_service_names[start:]:
+            if not name.startswith(prefix):
+                break
+            if pattern.match(name):
+                positions.append(self._service_positions[name])
+        return [self._service_configs[position] for position in sorted(positions)]
+
+    def start_services(
+        self,
+        service_names: list[str],
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, OperationResult]:
+        """Starts multiple services in parallel and waits until they start.
+
+        Args:
+            service_names: Names of the services.
+            max_workers: Max number of services that are processed at the same time.
+            timeout: If set, overall time (in seconds) for all services to start.
+            raise_on_error: Whether to raise an error if operation failed for any service.
+
+        Returns:
+            Outcomes of the operation keyed by service name.
+        """
+        operations = {
+            service_name: partial(
+                self.get_host_by_service(service_name).start_service, service_name
+            )
+            for service_name in service_names
+        }
+        return self._run_concurrently(operations, max_workers, timeout, raise_on_error)
+
+    def stop_services(
+        self,
+        service_names: list[str],
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, OperationResult]:
+        """Stops multiple services in parallel and waits until they stop.
+
+        Args:
+            service_names: Names of the services.
+            max_workers: Max number of services that are processed at the same time.
+            timeout: If set, overall time (in seconds) for all services to stop.
+            raise_on_error: Whether to raise an error if operation failed for any service.
+
+        Returns:
+            Outcomes of the operation keyed by service name.
+        """
+        operations = {
+            service_name: partial(self.get_host_by_service(service_name).stop_service, service_name)
+            for service_name in service_names
+        }
+        return self._run_concurrently(operations, max_workers, timeout, raise_on_error)
+
+    def restart_services(
+        self,
+        service_names: list[str],
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, OperationResult]:
+        """Restarts multiple services in parallel and waits until they start.
+
+        Args:
+            service_names: Names of the services.
+            max_workers: Max number of services that are processed at the same time.
+            timeout: If set, overall time (in seconds) for all services to restart.
+            raise_on_error: Whether to raise an error if operation failed for any service.
+
+        Returns:
+            Outcomes of the operation keyed by service name.
+        """
+        operations = {
+            service_name: partial(
+                self.get_host_by_service(service_name).restart_service, service_name
+            )
+            for service_name in service_names
+        }
+        return self._run_concurrently(operations, max_workers, timeout, raise_on_error)
+
+    def dump_logs_all(
+        self,
+        directory_path: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        filter_regex: Optional[str] = None,
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, OperationResult]:
+        """Dumps logs of all hosts to specified directory in parallel.
+
+        Args:
+            directory_path: Path to the directory where logs should be stored.
+            since: If set, limits the time from which logs should be collected. Must be in UTC.
+            until: If set, limits the time until which logs should be collected. Must be in UTC.
+            filter_regex: regex to filter output
+            max_workers: Max number of hosts that are processed at the same time.
+            timeout: If set, overall time (in seconds) for logs of all hosts to be dumped.
+            raise_on_error: Whether to raise an error if operation failed for any host.
+
+        Returns:
+            Outcomes of the operation keyed by host address.
+        """
+        operations = {
+            host.config.address: partial(host.dump_logs, directory_path, since, until, filter_regex)
             for host in self.hosts
-            for service_config in host.config.services
-            if re.match(service_name_pattern, service_config.name)
-        ]
-        return service_configs
+        }
+        return self._run_concurrently(operations, max_workers, timeout, raise_on_error)
+
+    def delete_storage_nodes_data(
+        self,
+        service_names: list[str],
+        cache_only: bool = False,
+        patterns: Optional[Sequence[str]] = None,
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, OperationResult]:
+        """Erases data of multiple storage nodes in parallel.
+
+        Args:
+            service_names: Names of storage node services.
+            cache_only: To delete cache only.
+            patterns: Glob patterns of shard components (relative to the storage directory) to
+                remove instead of all data or cache, for example: ["meta*", "fstree*"].
+            max_workers: Max number of nodes that are wiped at the same time.
+            timeout: If set, overall time (in seconds) for data of all nodes to be erased.
+            raise_on_error: Whether to raise an error if operation failed for any node.
+
+        Returns:
+            Outcomes of the operation keyed by service name.
+        """
+        operations = {
+            service_name: partial(
+                self.get_host_by_service(service_name).delete_storage_node_data,
+                service_name,
+                cache_only,
+                patterns,
+            )
+            for service_name in service_names
+        }
+        return self._run_concurrently(operations, max_workers, timeout, raise_on_error)
+
+    @staticmethod
+    def _run_concurrently(
+        operations: dict[str, Callable[[], None]],
+        max_workers: int,
+        timeout: Optional[float],
+        raise_on_error: bool,
+    ) -> dict[str, OperationResult]:
+        results = {name: OperationResult(name) for name in operations}
+        if not operations:
+            return results
+
+        def run(name: str) -> None:
+            started_at = time.monotonic()
+            try:
+                operations[name]()
+            finally:
+                results[name].duration = time.monotonic() - started_at
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(operations)))
+        try:
+            futures = {executor.submit(run, name): name for name in operations}
+            _, not_done = wait(futures, timeout=timeout)
+        finally:
+            # Operations that exceeded the deadline are abandoned rather than awaited
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for future, name in futures.items():
+            if future in not_done:
+                results[name].error = TimeoutError(
+                    f"Operation on '{name}' did not complete within {timeout} seconds"
+                )
+            elif future.exception() is not None:
+                results[name].error = future.exception()
+
+        failed = [result for result in results.values() if not result.succeeded]
+        for result in failed:
+            logger.warning(f"Operation on '{result.name}' failed: {result.error}")
+        if failed and raise_on_error:
+            details = "\n".join(f"{result.name}: {result.error}" for result in failed)
+            raise RuntimeError(f"Operation failed for {len(failed)} item(s):\n{details}")
+        return results
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from neofs_testlib.hosting.config import CLIConfig, HostConfig, ServiceConfig
 from neofs_testlib.shell.interfaces import Shell
@@ -113,12 +113,16 @@ class Host(ABC):
         """
 
     @abstractmethod
-    def delete_storage_node_data(self, service_name: str, cache_only: bool = False) -> None:
+    def delete_storage_node_data(
+        self, service_name: str, cache_only: bool = False, patterns: Optional[Sequence[str]] = None
+    ) -> None:
         """Erases all data of the storage node with specified name.
 
         Args:
             service_name: Name of storage node service.
             cache_only: To delete cache only.
+            patterns: Glob patterns of shard components (relative to the storage directory) to
+                remove instead of all data or cache, for example: ["meta*", "fstree*"].
         """
 
     @abstractmethod
@@ -169,7 +173,8 @@ class Host(ABC):
             directory_path: Path to the directory where logs should be stored.
             since: If set, limits the time from which logs should be collected. Must be in UTC.
             until: If set, limits the time until which logs should be collected. Must be in UTC.
-            filter_regex: regex to filter output
+            filter_regex: regex to filter output; only fragments of logs that match the regex
+                are stored (value of the first group if the regex has groups).
         """
 
     @abstractmethod
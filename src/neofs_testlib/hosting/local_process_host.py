@@ -0,0 +1,343 @@
+import fnmatch
+import io
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator, Optional, Sequence
+
+from neofs_testlib.env import log_rotation
+from neofs_testlib.env.env import NeoFSEnv, StorageNode
+from neofs_testlib.hosting.config import HostConfig, ParsedAttributes
+from neofs_testlib.hosting.interfaces import DiskInfo, Host
+from neofs_testlib.shell import LocalShell, Shell
+
+logger = logging.getLogger("neofs.testlib.hosting")
+
+_CONSOLE_TIMESTAMP_REGEX = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?)(Z|[+-]\d{2}:?\d{2})?\s"
+)
+_JSON_TIMESTAMP_REGEX = re.compile(r'"ts":\s*"?([^",}]+)')
+
+
+@dataclass
+class HostAttributes(ParsedAttributes):
+    """Represents attributes of host where neoFS processes of NeoFSEnv run.
+
+    Attributes:
+        neofs_env_path: Path to the persisted env (see NeoFSEnv.persist). It is used to load
+            the env if the host is not bound to a live env object.
+    """
+
+    neofs_env_path: Optional[str] = None
+
+
+@dataclass
+class ServiceAttributes(ParsedAttributes):
+    """Represents attributes of service running as a local process.
+
+    Attributes:
+        node_name: Name of the node in NeoFSEnv (see NeoFSEnv.nodes). If not set, name of the
+            service is used.
+        stop_timeout: Timeout (in seconds) for service to stop gracefully before it is killed.
+    """
+
+    node_name: Optional[str] = None
+    stop_timeout: int = 30
+
+
+def _parse_timestamp(timestamp: str) -> Optional[float]:
+    try:
+        return float(timestamp)
+    except ValueError:
+        pass
+    match = _CONSOLE_TIMESTAMP_REGEX.match(f"{timestamp} ")
+    if not match:
+        return None
+    moment, offset = match.groups()
+    if not offset or offset == "Z":
+        offset = "+00:00"
+    elif ":" not in offset:
+        offset = f"{offset[:3]}:{offset[3:]}"
+    return datetime.fromisoformat(f"{moment[:26]}{offset}").timestamp()
+
+
+def _get_line_timestamp(line: str) -> Optional[float]:
+    """Extracts timestamp from log line in zap console or JSON format."""
+    if line.startswith("{"):
+        match = _JSON_TIMESTAMP_REGEX.search(line)
+        return _parse_timestamp(match.group(1)) if match else None
+    match = _CONSOLE_TIMESTAMP_REGEX.match(line)
+    return _parse_timestamp(match.group(0).strip()) if match else None
+
+
+def _to_timestamp(moment: Optional[datetime]) -> Optional[float]:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _read_log_lines(
+    file_path: str, since: Optional[datetime], until: Optional[datetime]
+) -> Iterator[str]:
+    """Reads lines of the log file and its rotated segments within specified time frame.
+
+    Lines without timestamp (for example, stack traces) belong to the preceding line.
+    """
+    since_timestamp = _to_timestamp(since)
+    until_timestamp = _to_timestamp(until)
+    in_range = since_timestamp is None
+    for path in log_rotation.get_log_segments(file_path) + [file_path]:
+        if not os.path.isfile(path):
+            continue
+        with io.TextIOWrapper(log_rotation.open_log_file(path), errors="ignore") as log_file:
+            for line in log_file:
+                timestamp = _get_line_timestamp(line)
+                if timestamp is not None:
+                    in_range = (since_timestamp is None or timestamp >= since_timestamp) and (
+                        until_timestamp is None or timestamp <= until_timestamp
+                    )
+                if in_range:
+                    yield line
+
+
+def _is_pid_running(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            # State follows the command name, which is enclosed in parentheses
+            return stat_file.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return False
+
+
+class LocalProcessHost(Host):
+    """Manages services of NeoFSEnv that run as local processes.
+
+    Services are controlled directly via process handles owned by the env, so start and stop
+    of a service don't involve any container runtime. If the env was loaded from a persisted
+    file, processes launched by another test process are controlled by their persisted PIDs.
+    """
+
+    def __init__(self, config: HostConfig, neofs_env: Optional[NeoFSEnv] = None) -> None:
+        super().__init__(config)
+        self._neofs_env = neofs_env
+        self._log_files: dict[str, list[str]] = {}
+
+    @property
+    def neofs_env(self) -> NeoFSEnv:
+        """Returns env which processes are managed by the host.
+
+        If the host is not bound to an env, the env is loaded from neofs_env_path attribute.
+        """
+        if self._neofs_env is None:
+            host_attributes = HostAttributes.parse(self._config.attributes)
+            if not host_attributes.neofs_env_path:
+                raise RuntimeError("Host is not bound to env and neofs_env_path is not set")
+            self._neofs_env = NeoFSEnv.load(host_attributes.neofs_env_path)
+        return self._neofs_env
+
+    def bind(self, neofs_env: NeoFSEnv) -> None:
+        """Binds the host to a live env object.
+
+        Args:
+            neofs_env: Env which processes should be managed by the host.
+        """
+        self._neofs_env = neofs_env
+
+    def get_shell(self) -> Shell:
+        return LocalShell()
+
+    def start_host(self) -> None:
+        for service_config in self._config.services:
+            self.start_service(service_config.name)
+
+    def stop_host(self, mode: str = "soft") -> None:
+        for service_config in reversed(self._config.services):
+            self.stop_service(service_config.name)
+
+    def start_service(self, service_name: str) -> None:
+        node = self._get_node(service_name)
+        if self._is_running(node):
+            logger.info(f"Service {service_name} is already running")
+            return
+
+        self._remember_log_files(service_name, node)
+        node._launch_process()
+        self._remember_log_files(service_name, node)
+        wait_until_ready = getattr(node, "_wait_until_ready", None)
+        if wait_until_ready is not None:
+            wait_until_ready()
+
+    def stop_service(self, service_name: str) -> None:
+        node = self._get_node(service_name)
+        if not self._is_running(node):
+            logger.info(f"Service {service_name} is not running")
+            return
+
+        stop_timeout = self._get_service_attributes(service_name).stop_timeout
+        log_rotation.stop_rotation(node.stdout, node.stderr)
+        if getattr(node, "process", None) is None:
+            self._stop_persisted_process(service_name, node.pid, stop_timeout)
+            return
+
+        node.process.terminate()
+        try:
+            node.process.wait(timeout=stop_timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Service {service_name} did not stop in {stop_timeout}s, killing it")
+            node.process.kill()
+            node.process.wait()
+
+    def restart_service(self, service_name: str) -> None:
+        self.stop_service(service_name)
+        self.start_service(service_name)
+
+    def get_service_pid(self, service_name: str) -> str:
+        node = self._get_node(service_name)
+        if not self._is_running(node):
+            raise RuntimeError(f"Service {service_name} is not running")
+        if getattr(node, "process", None) is None:
+            return str(node.pid)
+        return str(node.process.pid)
+
+    def delete_storage_node_data(
+        self, service_name: str, cache_only: bool = False, patterns: Optional[Sequence[str]] = None
+    ) -> None:
+        node = self._get_node(service_name)
+        if not isinstance(node, StorageNode):
+            raise ValueError(f"Service {service_name} is not a storage node")
+
+        self.stop_service(service_name)
+        for index, shard in enumerate(node.shards):
+            if patterns is not None:
+                # Components are matched by the names they have in storage directory of
+                # containerized nodes, for example: meta0, fstree1
+                components = {
+                    f"meta{index}": shard.metabase_path,
+                    f"blobovnicza{index}": shard.blobovnicza_path,
+                    f"fstree{index}": shard.fstree_path,
+                    f"pilorama{index}": shard.pilorama_path,
+                    f"wc{index}": shard.wc_path,
+                }
+                paths = [
+                    path
+                    for name, path in components.items()
+                    if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+                ]
+            else:
+                paths = [shard.metabase_path]
+                if not cache_only:
+                    paths += [shard.blobovnicza_path, shard.fstree_path, shard.pilorama_path]
+            for path in paths:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.exists(path):
+                    os.remove(path)
+
+    def attach_disk(self, device: str, disk_info: DiskInfo) -> None:
+        raise NotImplementedError("Not supported for local processes")
+
+    def detach_disk(self, device: str) -> DiskInfo:
+        raise NotImplementedError("Not supported for local processes")
+
+    def is_disk_attached(self, device: str, disk_info: DiskInfo) -> bool:
+        raise NotImplementedError("Not supported for local processes")
+
+    def dump_logs(
+        self,
+        directory_path: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        filter_regex: Optional[str] = None,
+    ) -> None:
+        filter_pattern = re.compile(filter_regex, re.IGNORECASE) if filter_regex else None
+        for service_config in self._config.services:
+            logs = "".join(
+                line
+                for file_path in self._get_log_files(service_config.name)
+                for line in _read_log_lines(file_path, since, until)
+            )
+            if filter_pattern:
+                # Only matched fragments are kept, same as in DockerHost
+                logs = (
+                    "\n".join(
+                        match.group(1) if filter_pattern.groups else match.group(0)
+                        for match in filter_pattern.finditer(logs)
+                    )
+                    or f"No matches found in logs based on given filter '{filter_regex}'"
+                )
+
+            file_path = os.path.join(
+                directory_path, f"{self._config.address}-{service_config.name}-log.txt"
+            )
+            with open(file_path, "w") as file:
+                file.write(logs)
+
+    def is_message_in_logs(
+        self,
+        message_regex: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> bool:
+        pattern = re.compile(message_regex, re.IGNORECASE)
+        for service_config in self._config.services:
+            for file_path in self._get_log_files(service_config.name):
+                if any(pattern.search(line) for line in _read_log_lines(file_path, since, until)):
+                    return True
+        return False
+
+    def _get_service_attributes(self, service_name: str) -> ServiceAttributes:
+        service_config = self.get_service_config(service_name)
+        return ServiceAttributes.parse(service_config.attributes)
+
+    def _get_node(self, service_name: str):
+        node_name = self._get_service_attributes(service_name).node_name or service_name
+        node = self.neofs_env.nodes().get(node_name)
+        if node is None:
+            raise ValueError(f"Unknown node: '{node_name}'")
+        return node
+
+    @staticmethod
+    def _is_running(node) -> bool:
+        if getattr(node, "process", None) is not None:
+            return node.process.poll() is None
+        pid = getattr(node, "pid", None)
+        if not pid or not _is_pid_running(pid):
+            return False
+        return NeoFSEnv._is_node_process(pid, node.stdout)
+
+    @staticmethod
+    def _stop_persisted_process(service_name: str, pid: int, stop_timeout: int) -> None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + stop_timeout
+            killed = False
+            while _is_pid_running(pid):
+                if not killed and time.monotonic() >= deadline:
+                    logger.warning(
+                        f"Service {service_name} did not stop in {stop_timeout}s, killing it"
+                    )
+                    os.kill(pid, signal.SIGKILL)
+                    killed = True
+                time.sleep(0.1)
+        except ProcessLookupError:
+            # Process has already exited
+            pass
+
+    def _remember_log_files(self, service_name: str, node) -> None:
+        # Nodes write logs of each launch to new files, so we keep track of all of them
+        log_files = self._log_files.setdefault(service_name, [])
+        for file_path in (node.stdout, node.stderr):
+            if os.path.isfile(file_path) and file_path not in log_files:
+                log_files.append(file_path)
+
+    def _get_log_files(self, service_name: str) -> list[str]:
+        self._remember_log_files(service_name, self._get_node(service_name))
+        return self._log_files[service_name]
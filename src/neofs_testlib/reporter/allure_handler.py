@@ -1,13 +1,18 @@
 import os
 from contextlib import AbstractContextManager
 from textwrap import shorten
-from typing import Any
+from typing import Any, Callable, Optional, Union
+from uuid import uuid4
 
 import allure
 from allure import attachment_type
+from allure_commons import plugin_manager
+from allure_commons.reporter import AllureReporter
 
 from neofs_testlib.reporter.interfaces import ReporterHandler
 
+COMPRESSED_MIME_TYPES = {".gz": "application/gzip", ".zst": "application/zstd"}
+
 
 class AllureHandler(ReporterHandler):
     """Handler that stores test artifacts in Allure report."""
@@ -17,11 +22,55 @@ class AllureHandler(ReporterHandler):
         return allure.step(name)
 
     def attach(self, body: Any, file_name: str) -> None:
-        attachment_name, extension = os.path.splitext(file_name)
-        attachment_type = self._resolve_attachment_type(extension)
-
+        attachment_name, attachment_type, extension = self._resolve_attachment(file_name)
+        if self._is_file(body):
+            # Content of file is copied to the report without reading it into memory
+            body.flush()
+            allure.attach.file(body.name, attachment_name, attachment_type, extension)
+            return
         allure.attach(body, attachment_name, attachment_type, extension)
 
+    def prepare_attachment(self, body: Any, file_name: str) -> Callable[[], None]:
+        allure_reporter = self._get_allure_reporter()
+        if allure_reporter is None:
+            return super().prepare_attachment(body, file_name)
+
+        # Allure keeps context of steps (and its plugins) per thread, so the attachment is added
+        # to the current step and the hook that writes it is resolved here, and only the file
+        # is written by the returned function
+        attachment_name, attachment_type, extension = self._resolve_attachment(file_name)
+        attachment_file_name = allure_reporter._attach(
+            uuid4(), name=attachment_name, attachment_type=attachment_type, extension=extension
+        )
+        if self._is_file(body):
+            body.flush()
+            report_attached_file = plugin_manager.hook.report_attached_file
+            return lambda: report_attached_file(source=body.name, file_name=attachment_file_name)
+        report_attached_data = plugin_manager.hook.report_attached_data
+        return lambda: report_attached_data(body=body, file_name=attachment_file_name)
+
+    def _get_allure_reporter(self) -> Optional[AllureReporter]:
+        """Returns reporter of allure-pytest plugin or None if it is not active."""
+        for plugin in plugin_manager.get_plugins():
+            allure_reporter = getattr(plugin, "allure_logger", None)
+            if isinstance(allure_reporter, AllureReporter):
+                return allure_reporter
+        return None
+
+    def _is_file(self, body: Any) -> bool:
+        return hasattr(body, "read") and isinstance(getattr(body, "name", None), str)
+
+    def _resolve_attachment(self, file_name: str) -> tuple[str, Union[attachment_type, str], str]:
+        """Returns name, type and extension of attachment with the specified file name."""
+        attachment_name, extension = os.path.splitext(file_name)
+        if extension.lower() in COMPRESSED_MIME_TYPES:
+            # Compressed attachments are binary, so they are stored with the full extension
+            # (for example, .pb.gz) and are not decoded as text
+            attachment_name, inner_extension = os.path.splitext(attachment_name)
+            mime_type = COMPRESSED_MIME_TYPES[extension.lower()]
+            return attachment_name, mime_type, f"{inner_extension}{extension}".lstrip(".")
+        return attachment_name, self._resolve_attachment_type(extension), extension
+
     def _resolve_attachment_type(self, extension: str) -> attachment_type:
         """Try to find matching Allure attachment type by extension.
 
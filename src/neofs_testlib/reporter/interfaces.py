@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager
-from typing import Any
+from typing import Any, Callable
 
 
 class ReporterHandler(ABC):
@@ -21,8 +21,28 @@ class ReporterHandler(ABC):
     def attach(self, content: Any, file_name: str) -> None:
         """Attach specified content with given file name to the test report.
 
+        Args:
+            content: Content to attach. If content value is a file object (opened in binary
+                mode and backed by a named file), content of the file is attached. If content
+                value is not a string, it will be converted to a string.
+            file_name: File name of attachment.
+        """
+
+    def prepare_attachment(self, content: Any, file_name: str) -> Callable[[], None]:
+        """Binds attachment to the current context of the report and returns its writer.
+
+        Reporter in async mode calls this method on the thread where the attachment is made
+        and calls the returned function later on its writer thread, so handlers can offload
+        writing of attachments while keeping them in the step (or other thread-bound context)
+        where they were made. By default the attachment is made right away.
+
         Args:
             content: Content to attach. If content value is not a string, it will be
                 converted to a string.
             file_name: File name of attachment.
+
+        Returns:
+            Function that writes the attachment.
         """
+        self.attach(content, file_name)
+        return lambda: None
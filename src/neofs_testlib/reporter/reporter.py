@@ -1,10 +1,16 @@
+import atexit
+import logging
+import queue
+import threading
 from contextlib import AbstractContextManager, contextmanager
 from types import TracebackType
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from neofs_testlib.plugins import load_plugin
 from neofs_testlib.reporter.interfaces import ReporterHandler
 
+logger = logging.getLogger("neofs.testlib.reporter")
+
 
 @contextmanager
 def _empty_step():
@@ -12,13 +18,30 @@ def _empty_step():
 
 
 class Reporter:
-    """Root reporter that sends artifacts to handlers."""
+    """Root reporter that sends artifacts to handlers.
+
+    In async mode handlers bind each attachment to the report on the caller's thread (see
+    `ReporterHandler.prepare_attachment`), and the attachment is written by a writer thread,
+    so that callers don't wait for report I/O. Writers are called in the order attachments
+    were made; the queue is flushed when a step is entered or exited and when the process
+    exits. Errors of writers are raised by the next flush on the caller's thread.
+    """
 
     handlers: list[ReporterHandler]
 
     def __init__(self) -> None:
         super().__init__()
         self.handlers = []
+        self._attachments: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._errors: list[str] = []
+        self._errors_lock = threading.Lock()
+        self._exit_hook_registered = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the reporter has any handlers that consume artifacts."""
+        return bool(self.handlers)
 
     def register_handler(self, handler: ReporterHandler) -> None:
         """Register a new handler for the reporter.
@@ -37,6 +60,7 @@ class Reporter:
             config: Dictionary with reporter configuration.
         """
         # Reset current configuration
+        self.disable_async()
         self.handlers = []
 
         # Setup handlers from the specified config
@@ -45,6 +69,55 @@ class Reporter:
             handler_class = load_plugin("neofs.testlib.reporter", handler_config["plugin_name"])
             self.register_handler(handler_class())
 
+        if config.get("async"):
+            self.enable_async(config.get("queue_size", 100))
+
+    def enable_async(self, queue_size: int = 100) -> None:
+        """Switches the reporter to async mode.
+
+        Args:
+            queue_size: Max number of attachments waiting to be written. When the queue is full,
+                attach blocks until there is room in the queue.
+        """
+        if self._attachments is not None:
+            return
+        self._attachments = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(
+            target=self._write_attachments,
+            args=(self._attachments,),
+            name="reporter-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        if not self._exit_hook_registered:
+            atexit.register(self.flush)
+            self._exit_hook_registered = True
+
+    def disable_async(self) -> None:
+        """Writes pending attachments and switches the reporter to sync mode.
+
+        Raises:
+            RuntimeError: If any of the pending attachments failed to be written.
+        """
+        attachments, writer = self._attachments, self._writer
+        if attachments is None:
+            return
+        self._attachments = self._writer = None
+        attachments.put(None)
+        writer.join()
+        self._raise_errors()
+
+    def flush(self) -> None:
+        """Waits until all pending attachments are written.
+
+        Raises:
+            RuntimeError: If any of the attachments made since the previous flush failed to be
+                written.
+        """
+        if self._attachments is not None:
+            self._attachments.join()
+        self._raise_errors()
+
     def step(self, name: str) -> AbstractContextManager:
         """Register a new step in test execution.
 
@@ -58,19 +131,68 @@ class Reporter:
             return _empty_step()
 
         step_contexts = [handler.step(name) for handler in self.handlers]
+        if self._attachments is not None:
+            return self._flushing_step(AggregateContextManager(step_contexts))
         return AggregateContextManager(step_contexts)
 
     def attach(self, content: Any, file_name: str) -> None:
         """Attach specified content with given file name to the test report.
 
+        In async mode content is written later, so it should not be modified after this call.
+
         Args:
-            content: Content to attach. If content value is not a string, it will be
-                converted to a string.
+            content: Content to attach. If content value is a file object (opened in binary
+                mode and backed by a named file), content of the file is attached. If content
+                value is not a string, it will be converted to a string.
             file_name: File name of attachment.
         """
+        attachments = self._attachments
+        if attachments is not None:
+            for handler in self.handlers:
+                attachments.put((handler.prepare_attachment(content, file_name), file_name))
+            return
+        self._attach(content, file_name)
+
+    def _attach(self, content: Any, file_name: str) -> None:
         for handler in self.handlers:
             handler.attach(content, file_name)
 
+    @contextmanager
+    def _flushing_step(self, step_context: AbstractContextManager) -> Iterator[Any]:
+        self.flush()
+        with step_context as step:
+            try:
+                yield step
+            except BaseException:
+                # Error of the step takes precedence over errors of its attachments
+                try:
+                    self.flush()
+                except RuntimeError as exc:
+                    logger.warning(str(exc))
+                raise
+            self.flush()
+
+    def _write_attachments(self, attachments: queue.Queue) -> None:
+        while True:
+            attachment = attachments.get()
+            try:
+                if attachment is None:
+                    return
+                write, file_name = attachment
+                write()
+            except Exception as exc:
+                logger.warning(f"Failed to attach {file_name} to report: {exc}")
+                with self._errors_lock:
+                    self._errors.append(f"{file_name}: {exc}")
+            finally:
+                attachments.task_done()
+
+    def _raise_errors(self) -> None:
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise RuntimeError("Failed to attach to report:\n" + "\n".join(errors))
+
 
 class AggregateContextManager(AbstractContextManager):
     """Aggregates multiple context managers in a single context."""
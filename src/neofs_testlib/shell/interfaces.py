@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
 
 from neofs_testlib.defaults import Options
 
@@ -33,6 +33,24 @@ class CommandInspector(ABC):
         """
 
 
+@dataclass
+class ReportPolicy:
+    """Policy that controls how command output is logged and attached to the report.
+
+    Attributes:
+        max_log_bytes: Max size of each output stream in the log message. Larger output is
+            truncated in the middle, so that its head and tail are preserved.
+        max_attachment_bytes: Max size of each output stream in the text attachment. Larger
+            output is truncated in the same way.
+        attach_full_output: Whether complete output that exceeds max_attachment_bytes should be
+            attached to the report as a gzip-compressed file.
+    """
+
+    max_log_bytes: int = 64 * 1024
+    max_attachment_bytes: int = 1024 * 1024
+    attach_full_output: bool = True
+
+
 @dataclass
 class CommandOptions:
     """Options that control command execution.
@@ -47,6 +65,8 @@ class CommandOptions:
         check: Controls whether to check return code of the command. Set to False to
             ignore non-zero return codes.
         no_log: Do not print output to logger if True.
+        no_report: Do not attach command and its output to the report if True.
+        report_policy: Policy of logging and reporting of the command output.
     """
 
     interactive_inputs: Optional[list[InteractiveInput]] = None
@@ -54,6 +74,8 @@ class CommandOptions:
     timeout: Optional[int] = None
     check: bool = True
     no_log: bool = False
+    no_report: bool = False
+    report_policy: ReportPolicy = field(default_factory=ReportPolicy)
 
     def __post_init__(self):
         if self.timeout is None:
@@ -91,3 +113,20 @@ class Shell(ABC):
         Returns:
             Command's result.
         """
+
+    def exec_lines(self, command: str, options: Optional[CommandOptions] = None) -> Iterator[str]:
+        """Executes specified command on this shell and yields lines of its stdout.
+
+        Shells that can read output of a running process override this method to stream the
+        lines as they are printed, so that memory usage does not depend on output size. By
+        default the command is executed with `exec` and its complete output is split.
+
+        Args:
+            command: Command to execute on the shell.
+            options: Options that control command execution; interactive inputs are not
+                supported.
+
+        Yields:
+            Lines of stdout without trailing newlines.
+        """
+        yield from self.exec(command, options).stdout.splitlines()
@@ -1,17 +1,38 @@
 import logging
+import re
 import subprocess
 import tempfile
+import termios
+import threading
+import time
 from datetime import datetime
-from typing import IO, Optional
+from typing import IO, Iterator, Optional
 
 import pexpect
 
 from neofs_testlib.reporter import get_reporter
 from neofs_testlib.shell.interfaces import CommandInspector, CommandOptions, CommandResult, Shell
+from neofs_testlib.shell.reporting import (
+    LazyMessage,
+    compress_output,
+    get_command_summary,
+    get_output_size,
+    truncate_output,
+)
 
 logger = logging.getLogger("neofs.testlib.shell")
 reporter = get_reporter()
 
+# Password prompts turn terminal echo off after the prompt is printed, we wait for it, so that
+# the password is neither echoed (and logged) nor discarded by the terminal. Other prompts keep
+# echo on, so for them we wait only for a short while
+ECHO_OFF_TIMEOUT = 0.05
+PASSWORD_ECHO_OFF_TIMEOUT = 2
+# Delay before sending password if state of terminal echo can't be checked
+PASSWORD_FALLBACK_DELAY = 1
+ECHO_OFF_POLL_INTERVAL = 0.001
+PASSWORD_PROMPT_REGEX = re.compile(r"pass(word|phrase)", re.IGNORECASE)
+
 
 class LocalShell(Shell):
     """Implements command shell on a local machine."""
@@ -27,11 +48,77 @@ class LocalShell(Shell):
         for inspector in self.command_inspectors:
             command = inspector.inspect(command)
 
-        logger.info(f"Executing command: {command}")
+        logger.info("Executing command: %s", command)
         if options.interactive_inputs:
             return self._exec_interactive(command, options)
         return self._exec_non_interactive(command, options)
 
+    def exec_lines(self, command: str, options: Optional[CommandOptions] = None) -> Iterator[str]:
+        options = options or CommandOptions()
+
+        for inspector in self.command_inspectors:
+            command = inspector.inspect(command)
+
+        logger.info("Executing command: %s", command)
+        start_time = datetime.utcnow()
+        # Stderr is collected to a file, so that it does not interleave with streamed stdout
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            command_process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                universal_newlines=True,
+                shell=True,
+            )
+        except OSError as exc:
+            stderr_file.close()
+            raise RuntimeError(f"Command: {command}\nOutput: {exc.strerror}") from exc
+
+        timer = threading.Timer(options.timeout, command_process.kill)
+        timer.start()
+        line_count = 0
+        stdout_size = 0
+        try:
+            for line in command_process.stdout:
+                line_count += 1
+                stdout_size += len(line)
+                yield line.rstrip("\n")
+            return_code = command_process.wait()
+        finally:
+            timer.cancel()
+            if command_process.poll() is None:
+                # Consumer stopped iteration before the end of output
+                command_process.kill()
+                command_process.wait()
+            command_process.stdout.close()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            stderr_file.close()
+            end_time = datetime.utcnow()
+            logger.info(
+                "Command: %s\nReturn code: %s\nStreamed lines: %d\nElapsed: %s",
+                command,
+                command_process.returncode,
+                line_count,
+                end_time - start_time,
+            )
+            self._report_streamed_command(
+                command,
+                start_time,
+                end_time,
+                command_process.returncode,
+                line_count,
+                stdout_size,
+                stderr,
+                options,
+            )
+
+        if options.check and return_code != 0:
+            raise RuntimeError(
+                f"Command: {command}\nreturn code: {return_code}\nError output: {stderr}"
+            )
+
     def _exec_interactive(self, command: str, options: CommandOptions) -> CommandResult:
         start_time = datetime.utcnow()
         log_file = tempfile.TemporaryFile()  # File is reliable cross-platform way to capture output
@@ -41,21 +128,24 @@ class LocalShell(Shell):
         except (pexpect.ExceptionPexpect, OSError) as exc:
             raise RuntimeError(f"Command: {command}") from exc
 
-        command_process.delaybeforesend = 1
+        # Input is sent as soon as the prompt is ready to accept it instead of a fixed delay
+        command_process.delaybeforesend = None
         command_process.logfile_read = log_file
 
         try:
             for interactive_input in options.interactive_inputs:
                 command_process.expect(interactive_input.prompt_pattern)
+                self._wait_for_echo_off(command_process, interactive_input.prompt_pattern)
                 command_process.sendline(interactive_input.input)
         except (pexpect.ExceptionPexpect, OSError) as exc:
             if options.check:
                 raise RuntimeError(f"Command: {command}") from exc
         finally:
             result = self._get_pexpect_process_result(command_process)
-            log_file.close()
             end_time = datetime.utcnow()
-            self._report_command_result(command, start_time, end_time, result)
+            # Output is compressed for the report straight from the log file
+            self._report_command_result(command, start_time, end_time, result, options, log_file)
+            log_file.close()
 
         if options.check and result.return_code != 0:
             raise RuntimeError(
@@ -100,9 +190,35 @@ class LocalShell(Shell):
             raise RuntimeError(f"Command: {command}\nOutput: {exc.strerror}") from exc
         finally:
             end_time = datetime.utcnow()
-            self._report_command_result(command, start_time, end_time, result)
+            self._report_command_result(command, start_time, end_time, result, options)
         return result
 
+    @staticmethod
+    def _wait_for_echo_off(command_process: pexpect.spawn, prompt_pattern: str) -> None:
+        """Waits until the process turns terminal echo off.
+
+        For password prompts the wait takes at most PASSWORD_ECHO_OFF_TIMEOUT; if echo state
+        can't be checked, the input is delayed by PASSWORD_FALLBACK_DELAY. Regular prompts keep
+        echo on, so for them the wait takes at most ECHO_OFF_TIMEOUT.
+        """
+        is_password = PASSWORD_PROMPT_REGEX.search(prompt_pattern) is not None
+        timeout = PASSWORD_ECHO_OFF_TIMEOUT if is_password else ECHO_OFF_TIMEOUT
+        deadline = time.monotonic() + timeout
+        try:
+            while command_process.getecho():
+                if time.monotonic() >= deadline:
+                    if is_password:
+                        logger.warning(
+                            f"Terminal echo is still on after {timeout}s, password may be echoed"
+                        )
+                    return
+                time.sleep(ECHO_OFF_POLL_INTERVAL)
+        except (termios.error, OSError):
+            # Terminal is gone, either because the process has exited or it doesn't control
+            # the terminal as expected
+            if is_password and command_process.isalive():
+                time.sleep(PASSWORD_FALLBACK_DELAY)
+
     def _get_pexpect_process_result(self, command_process: pexpect.spawn) -> CommandResult:
         """
         Captures output of the process.
@@ -122,29 +238,90 @@ class LocalShell(Shell):
 
         return CommandResult(stdout=output, stderr="", return_code=return_code)
 
+    def _report_streamed_command(
+        self,
+        command: str,
+        start_time: datetime,
+        end_time: datetime,
+        return_code: Optional[int],
+        line_count: int,
+        stdout_size: int,
+        stderr: str,
+        options: CommandOptions,
+    ) -> None:
+        if options.no_report or not reporter.enabled:
+            return
+
+        # Streamed output is consumed by the caller and is not kept, so only its size is reported
+        elapsed_time = end_time - start_time
+        summary = get_command_summary(
+            return_code, stdout_size, get_output_size(stderr), elapsed_time
+        )
+        command_attachment = (
+            f"COMMAND: {command}\n"
+            f"RETCODE: {return_code}\n\n"
+            f"STDOUT:\n{line_count} lines streamed\n"
+            f"STDERR:\n{truncate_output(stderr, options.report_policy.max_attachment_bytes)}\n"
+            f"Start / End / Elapsed\t {start_time.time()} / {end_time.time()} / {elapsed_time}\n"
+            f"Summary\t {summary}"
+        )
+        with reporter.step(f"COMMAND: {command}"):
+            reporter.attach(command_attachment, "Command execution.txt")
+
     def _report_command_result(
         self,
         command: str,
         start_time: datetime,
         end_time: datetime,
         result: Optional[CommandResult],
+        options: CommandOptions,
+        output_file: Optional[IO[bytes]] = None,
     ) -> None:
-        # TODO: increase logging level if return code is non 0, should be warning at least
-        logger.info(
-            f"Command: {command}\n"
-            f"{'Success:' if result and result.return_code == 0 else 'Error:'}\n"
-            f"return code: {result.return_code if result else ''} "
-            f"\nOutput: {result.stdout if result else ''}"
+        report = result is not None and not options.no_report and reporter.enabled
+        if not report and not logger.isEnabledFor(logging.INFO):
+            # Quiet fast path: nobody consumes the messages, so we don't build them
+            return
+
+        policy = options.report_policy
+        elapsed_time = end_time - start_time
+        stdout = result.stdout if result else ""
+        stderr = result.stderr if result else ""
+        summary = LazyMessage(
+            lambda: get_command_summary(
+                result.return_code if result else None,
+                get_output_size(stdout),
+                get_output_size(stderr),
+                elapsed_time,
+            )
         )
 
-        if result:
-            elapsed_time = end_time - start_time
+        # TODO: increase logging level if return code is non 0, should be warning at least
+        def format_log_message() -> str:
+            log_message = (
+                f"Command: {command}\n"
+                f"{'Success:' if result and result.return_code == 0 else 'Error:'}\n"
+                f"{summary}"
+            )
+            if not options.no_log:
+                log_message += f"\nOutput: {truncate_output(stdout, policy.max_log_bytes)}"
+            return log_message
+
+        logger.info("%s", LazyMessage(format_log_message))
+
+        if report:
             command_attachment = (
                 f"COMMAND: {command}\n"
                 f"RETCODE: {result.return_code}\n\n"
-                f"STDOUT:\n{result.stdout}\n"
-                f"STDERR:\n{result.stderr}\n"
-                f"Start / End / Elapsed\t {start_time.time()} / {end_time.time()} / {elapsed_time}"
+                f"STDOUT:\n{truncate_output(stdout, policy.max_attachment_bytes)}\n"
+                f"STDERR:\n{truncate_output(stderr, policy.max_attachment_bytes)}\n"
+                f"Start / End / Elapsed\t {start_time.time()} / {end_time.time()} / "
+                f"{elapsed_time}\n"
+                f"Summary\t {summary}"
             )
             with reporter.step(f"COMMAND: {command}"):
                 reporter.attach(command_attachment, "Command execution.txt")
+                if (
+                    policy.attach_full_output
+                    and get_output_size(stdout) > policy.max_attachment_bytes
+                ):
+                    reporter.attach(compress_output(stdout, output_file), "Command output.txt.gz")
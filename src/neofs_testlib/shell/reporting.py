@@ -0,0 +1,101 @@
+import gzip
+import tempfile
+from datetime import timedelta
+from typing import IO, Callable, Optional
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class LazyMessage:
+    """Message that is built only when it is converted to string for the first time.
+
+    Passing lazy message as an argument of a logging call defers building of the message until
+    a log handler actually formats the record.
+    """
+
+    def __init__(self, build: Callable[[], str]) -> None:
+        self._build = build
+        self._message: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._build()
+        return self._message
+
+
+def format_size(size: int) -> str:
+    """Formats size in bytes in human-readable form."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def get_output_size(output: str) -> int:
+    """Returns size of the output in bytes (in UTF-8 encoding)."""
+    if output.isascii():
+        return len(output)
+    return len(output.encode(errors="replace"))
+
+
+def truncate_output(output: str, max_bytes: int) -> str:
+    """Truncates the output in the middle, so that it fits specified size.
+
+    Args:
+        output: Output to truncate.
+        max_bytes: Max size (in bytes) of the output head and tail.
+
+    Returns:
+        Output if it fits into the limit, otherwise its head and tail with a marker in between.
+    """
+    # Each character takes at least one byte, so the output that has fewer characters than
+    # the limit can be checked without encoding it as a whole
+    if len(output) <= max_bytes and get_output_size(output) <= max_bytes:
+        return output
+
+    half = max_bytes // 2
+    head = output[:half].encode(errors="replace")[:half].decode(errors="ignore")
+    tail = output[-half:].encode(errors="replace")[-half:].decode(errors="ignore") if half else ""
+    truncated_size = get_output_size(output) - len(head.encode()) - len(tail.encode())
+    return f"{head}\n... {format_size(truncated_size)} truncated ...\n{tail}"
+
+
+def compress_output(
+    output: Optional[str] = None, output_file: Optional[IO[bytes]] = None
+) -> IO[bytes]:
+    """Compresses the output with gzip into a temporary file.
+
+    If output file is specified, it is compressed chunk by chunk straight from the file, so
+    neither the output nor the compressed output is held in memory.
+
+    Args:
+        output: Output to compress.
+        output_file: Binary file that contains the output.
+
+    Returns:
+        Temporary file with the compressed output; it is removed when it is closed.
+    """
+    compressed = tempfile.NamedTemporaryFile(prefix="output-", suffix=".gz")
+    with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=6) as gzip_file:
+        if output_file is not None:
+            output_file.seek(0)
+            while chunk := output_file.read(_CHUNK_SIZE):
+                gzip_file.write(chunk)
+        elif output:
+            for position in range(0, len(output), _CHUNK_SIZE):
+                gzip_file.write(output[position : position + _CHUNK_SIZE].encode(errors="replace"))
+    compressed.flush()
+    compressed.seek(0)
+    return compressed
+
+
+def get_command_summary(
+    return_code: Optional[int], stdout_size: int, stderr_size: int, elapsed_time: timedelta
+) -> str:
+    """Returns single-line summary of command execution."""
+    return (
+        f"RC: {return_code if return_code is not None else 'unknown'}, "
+        f"stdout: {format_size(stdout_size)}, stderr: {format_size(stderr_size)}, "
+        f"elapsed: {elapsed_time.total_seconds():.3f}s"
+    )
@@ -21,6 +21,13 @@ from paramiko.ssh_exception import AuthenticationException
 
 from neofs_testlib.reporter import get_reporter
 from neofs_testlib.shell.interfaces import CommandInspector, CommandOptions, CommandResult, Shell
+from neofs_testlib.shell.reporting import (
+    LazyMessage,
+    compress_output,
+    get_command_summary,
+    get_output_size,
+    truncate_output,
+)
 
 logger = logging.getLogger("neofs.testlib.shell")
 reporter = get_reporter()
@@ -41,26 +48,51 @@ def log_command(func):
     ) -> CommandResult:
         command_info = command.removeprefix("$ProgressPreference='SilentlyContinue'\n")
         with reporter.step(command_info):
-            logger.info(f'Execute command "{command}" on "{shell.host}"')
+            logger.info('Execute command "%s" on "%s"', command, shell.host)
 
             start_time = datetime.utcnow()
             result = func(shell, command, options, *args, **kwargs)
             end_time = datetime.utcnow()
 
+            report = not options.no_report and reporter.enabled
+            log = not options.no_log and logger.isEnabledFor(logging.INFO)
+            if not report and not log:
+                # Quiet fast path: nobody consumes the messages, so we don't build them
+                return result
+
             elapsed_time = end_time - start_time
-            log_message = (
-                f"HOST: {shell.host}\n"
-                f"COMMAND:\n{textwrap.indent(command, ' ')}\n"
-                f"RC:\n {result.return_code}\n"
-                f"STDOUT:\n{textwrap.indent(result.stdout, ' ')}\n"
-                f"STDERR:\n{textwrap.indent(result.stderr, ' ')}\n"
-                f"Start / End / Elapsed\t {start_time.time()} / {end_time.time()} / {elapsed_time}"
+            policy = options.report_policy
+            summary = LazyMessage(
+                lambda: get_command_summary(
+                    result.return_code,
+                    get_output_size(result.stdout),
+                    get_output_size(result.stderr),
+                    elapsed_time,
+                )
             )
 
-            if not options.no_log:
-                logger.info(log_message)
-
-            reporter.attach(log_message, "SSH command.txt")
+            def format_message(max_output_bytes: int) -> str:
+                stdout = truncate_output(result.stdout, max_output_bytes)
+                stderr = truncate_output(result.stderr, max_output_bytes)
+                return (
+                    f"HOST: {shell.host}\n"
+                    f"COMMAND:\n{textwrap.indent(command, ' ')}\n"
+                    f"RC:\n {result.return_code}\n"
+                    f"STDOUT:\n{textwrap.indent(stdout, ' ')}\n"
+                    f"STDERR:\n{textwrap.indent(stderr, ' ')}\n"
+                    f"Start / End / Elapsed\t {start_time.time()} / {end_time.time()} / "
+                    f"{elapsed_time}\n"
+                    f"Summary\t {summary}"
+                )
+
+            if log:
+                logger.info("%s", LazyMessage(lambda: format_message(policy.max_log_bytes)))
+
+            if report:
+                reporter.attach(format_message(policy.max_attachment_bytes), "SSH command.txt")
+                stdout_size = get_output_size(result.stdout)
+                if policy.attach_full_output and stdout_size > policy.max_attachment_bytes:
+                    reporter.attach(compress_output(result.stdout), "SSH command output.txt.gz")
         return result
 
     return wrapper
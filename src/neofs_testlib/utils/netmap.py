@@ -0,0 +1,621 @@
+import base64
+import json
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Collection, Optional, Union
+
+import base58
+
+if TYPE_CHECKING:
+    from neofs_testlib.cli import NeofsCli
+
+DEFAULT_BACKUP_FACTOR = 3
+# Name of the implicit filter that matches all nodes
+MAIN_FILTER = "*"
+# Attributes that make nodes weighted in HRW placement
+WEIGHT_ATTRIBUTES = ("Capacity", "Price")
+
+_MASK_64 = 2**64 - 1
+_XXH_PRIME_1 = 0x9E3779B185EBCA87
+_XXH_PRIME_2 = 0xC2B2AE3D27D4EB4F
+_XXH_PRIME_3 = 0x165667B19E3779F9
+_XXH_PRIME_4 = 0x85EBCA77C2B2AE63
+_XXH_PRIME_5 = 0x27D4EB2F165667C5
+
+_POLICY_TOKEN_REGEX = re.compile(r"\"[^\"]*\"|'[^']*'|[()]|[^\s()]+")
+_FILTER_OPERATIONS = {"EQ", "NE", "GT", "GE", "LT", "LE"}
+
+
+def _rotate_left(value: int, bits: int) -> int:
+    return ((value << bits) | (value >> (64 - bits))) & _MASK_64
+
+
+def _xxh64_round(accumulator: int, lane: int) -> int:
+    accumulator = (accumulator + lane * _XXH_PRIME_2) & _MASK_64
+    return (_rotate_left(accumulator, 31) * _XXH_PRIME_1) & _MASK_64
+
+
+def xxh64(data: bytes) -> int:
+    """Calculates XXH64 hash (with zero seed) that NeoFS uses for HRW placement.
+
+    Args:
+        data: Data to hash.
+
+    Returns:
+        Hash as unsigned 64-bit integer.
+    """
+    length = len(data)
+    position = 0
+    if length >= 32:
+        accumulators = [
+            (_XXH_PRIME_1 + _XXH_PRIME_2) & _MASK_64,
+            _XXH_PRIME_2,
+            0,
+            (-_XXH_PRIME_1) & _MASK_64,
+        ]
+        while position + 32 <= length:
+            for lane in range(4):
+                start = position + lane * 8
+                accumulators[lane] = _xxh64_round(
+                    accumulators[lane], int.from_bytes(data[start : start + 8], "little")
+                )
+            position += 32
+        result = (
+            _rotate_left(accumulators[0], 1)
+            + _rotate_left(accumulators[1], 7)
+            + _rotate_left(accumulators[2], 12)
+            + _rotate_left(accumulators[3], 18)
+        ) & _MASK_64
+        for accumulator in accumulators:
+            result ^= _xxh64_round(0, accumulator)
+            result = (result * _XXH_PRIME_1 + _XXH_PRIME_4) & _MASK_64
+    else:
+        result = _XXH_PRIME_5
+
+    result = (result + length) & _MASK_64
+    while position + 8 <= length:
+        result ^= _xxh64_round(0, int.from_bytes(data[position : position + 8], "little"))
+        result = (_rotate_left(result, 27) * _XXH_PRIME_1 + _XXH_PRIME_4) & _MASK_64
+        position += 8
+    if position + 4 <= length:
+        result ^= (
+            int.from_bytes(data[position : position + 4], "little") * _XXH_PRIME_1
+        ) & _MASK_64
+        result = (_rotate_left(result, 23) * _XXH_PRIME_2 + _XXH_PRIME_3) & _MASK_64
+        position += 4
+    while position < length:
+        result ^= (data[position] * _XXH_PRIME_5) & _MASK_64
+        result = (_rotate_left(result, 11) * _XXH_PRIME_1) & _MASK_64
+        position += 1
+
+    result ^= result >> 33
+    result = (result * _XXH_PRIME_2) & _MASK_64
+    result ^= result >> 29
+    result = (result * _XXH_PRIME_3) & _MASK_64
+    result ^= result >> 32
+    return result
+
+
+def hrw_distance(left: int, right: int) -> int:
+    """Calculates rendezvous hashing distance between two hashes (murmur3 64-bit finalizer).
+
+    Args:
+        left: The first hash.
+        right: The second hash.
+
+    Returns:
+        Distance; the smaller the distance, the higher the priority.
+    """
+    distance = left ^ right
+    distance ^= distance >> 33
+    distance = (distance * 0xFF51AFD7ED558CCD) & _MASK_64
+    distance ^= distance >> 33
+    distance = (distance * 0xC4CEB9FE1A85EC53) & _MASK_64
+    distance ^= distance >> 33
+    return distance
+
+
+@dataclass
+class NetmapNode:
+    """Storage node in the network map.
+
+    Attributes:
+        public_key: Public key of the node in hex.
+        addresses: Network addresses of the node (multiaddrs).
+        attributes: Attributes of the node.
+        state: State of the node (for example, ONLINE or MAINTENANCE).
+    """
+
+    public_key: str
+    addresses: list[str] = field(default_factory=list)
+    attributes: dict[str, str] = field(default_factory=dict)
+    state: str = "ONLINE"
+
+    @cached_property
+    def hash(self) -> int:
+        return xxh64(bytes.fromhex(self.public_key))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NetmapNode":
+        """Creates node from its JSON representation printed by neofs-cli.
+
+        Args:
+            data: Decoded JSON of the node.
+
+        Returns:
+            Node.
+        """
+        public_key = data.get("publicKey", data.get("public_key", ""))
+        return cls(
+            public_key=base64.standard_b64decode(public_key).hex(),
+            addresses=list(data.get("addresses", [])),
+            attributes={
+                attribute["key"]: attribute.get("value", "")
+                for attribute in data.get("attributes", [])
+            },
+            state=data.get("state", "ONLINE"),
+        )
+
+
+@dataclass
+class Netmap:
+    """Network map of a certain epoch.
+
+    Attributes:
+        epoch: Epoch of the network map.
+        nodes: Storage nodes in the order they are listed in the snapshot.
+    """
+
+    epoch: int
+    nodes: list[NetmapNode] = field(default_factory=list)
+
+    @classmethod
+    def from_json(cls, data: Union[str, dict]) -> "Netmap":
+        """Parses network map from output of `netmap snapshot --json`.
+
+        Args:
+            data: Output of the command or decoded JSON.
+
+        Returns:
+            Network map.
+        """
+        if isinstance(data, str):
+            data = json.loads(data)
+        return cls(
+            epoch=int(data.get("epoch", 0)),
+            nodes=[NetmapNode.from_dict(node) for node in data.get("nodes", [])],
+        )
+
+    @classmethod
+    def from_cli(cls, neofs_cli: "NeofsCli", rpc_endpoint: str, wallet: str) -> "Netmap":
+        """Requests network map snapshot from a storage node.
+
+        Args:
+            neofs_cli: neofs-cli configured with the wallet password.
+            rpc_endpoint: Endpoint of the storage node.
+            wallet: Path to the wallet that signs the request.
+
+        Returns:
+            Network map.
+        """
+        result = neofs_cli.netmap.snapshot(rpc_endpoint=rpc_endpoint, wallet=wallet, json=True)
+        return cls.from_json(result.stdout)
+
+    @cached_property
+    def nodes_by_key(self) -> dict[str, NetmapNode]:
+        return {node.public_key: node for node in self.nodes}
+
+    def get_node(self, public_key: str) -> Optional[NetmapNode]:
+        """Returns node with the specified public key (in hex) or None if there is no such node."""
+        return self.nodes_by_key.get(public_key)
+
+    def diff(self, other: "Netmap") -> "NetmapDiff":
+        """Compares this network map with a newer one.
+
+        Args:
+            other: Network map to compare with, usually of a later epoch.
+
+        Returns:
+            Difference between the maps.
+        """
+        return diff_netmaps(self, other)
+
+
+@dataclass
+class NetmapDiff:
+    """Difference between two network maps.
+
+    Attributes:
+        old_epoch: Epoch of the old map.
+        new_epoch: Epoch of the new map.
+        added: Nodes that are present only in the new map.
+        removed: Nodes that are present only in the old map.
+        changed: Pairs of old and new state of nodes whose addresses, attributes or state changed.
+    """
+
+    old_epoch: int
+    new_epoch: int
+    added: list[NetmapNode] = field(default_factory=list)
+    removed: list[NetmapNode] = field(default_factory=list)
+    changed: list[tuple[NetmapNode, NetmapNode]] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not self.added and not self.removed and not self.changed
+
+
+def diff_netmaps(old: Netmap, new: Netmap) -> NetmapDiff:
+    """Compares two network maps in linear time, matching nodes by public key.
+
+    Args:
+        old: The old network map.
+        new: The new network map.
+
+    Returns:
+        Difference between the maps.
+    """
+    diff = NetmapDiff(old_epoch=old.epoch, new_epoch=new.epoch)
+    old_nodes = old.nodes_by_key
+    new_nodes = new.nodes_by_key
+    for node in new.nodes:
+        old_node = old_nodes.get(node.public_key)
+        if old_node is None:
+            diff.added.append(node)
+        elif old_node != node:
+            diff.changed.append((old_node, node))
+    diff.removed = [node for node in old.nodes if node.public_key not in new_nodes]
+    return diff
+
+
+@dataclass
+class Replica:
+    """REP statement of placement policy.
+
+    Attributes:
+        count: Number of object replicas.
+        selector: Name of the selector replicas are placed to; all selectors if not set.
+    """
+
+    count: int
+    selector: Optional[str] = None
+
+
+@dataclass
+class Selector:
+    """SELECT statement of placement policy.
+
+    Attributes:
+        count: Number of buckets (or nodes in the bucket for SAME clause) to select.
+        filter: Name of the filter that nodes must match.
+        attribute: Attribute nodes are grouped into buckets by; each node is its own bucket
+            if not set.
+        clause: SAME or DISTINCT.
+        name: Name of the selector.
+    """
+
+    count: int
+    filter: str = MAIN_FILTER
+    attribute: Optional[str] = None
+    clause: str = "DISTINCT"
+    name: str = ""
+
+
+@dataclass
+class Filter:
+    """FILTER statement (or its sub-expression) of placement policy.
+
+    Attributes:
+        operation: EQ, NE, GT, GE, LT, LE for attribute comparison, AND, OR for combinations
+            of inner filters or @ for reference to a named filter.
+        key: Attribute key for comparison or name of the referenced filter.
+        value: Value for comparison.
+        filters: Inner filters for AND, OR.
+        name: Name of the filter, empty for sub-expressions.
+    """
+
+    operation: str
+    key: str = ""
+    value: str = ""
+    filters: list["Filter"] = field(default_factory=list)
+    name: str = ""
+
+
+@dataclass
+class PlacementPolicy:
+    """Container placement policy evaluated locally against a network map.
+
+    Nodes are ranked with rendezvous hashing (HRW) in the same way NeoFS does: container nodes
+    are selected by HRW with container ID as a pivot, then nodes of each replica are sorted by
+    HRW with object ID as a pivot. Weighted placement is not supported, so network maps where
+    nodes announce price or capacity are rejected.
+
+    Attributes:
+        replicas: REP statements.
+        selectors: SELECT statements.
+        filters: Named FILTER statements.
+        backup_factor: Container backup factor (CBF).
+        unique: Whether nodes are selected so that no node is used by two replicas.
+    """
+
+    replicas: list[Replica]
+    selectors: list[Selector] = field(default_factory=list)
+    filters: dict[str, Filter] = field(default_factory=dict)
+    backup_factor: int = DEFAULT_BACKUP_FACTOR
+    unique: bool = False
+
+    @classmethod
+    def parse(cls, policy: str) -> "PlacementPolicy":
+        """Parses placement policy in NeoFS policy language, for example:
+        `REP 2 IN X CBF 1 SELECT 2 FROM F AS X FILTER Country EQ Germany AS F`.
+
+        Args:
+            policy: Text of the policy.
+
+        Returns:
+            Parsed policy.
+        """
+        return _PolicyParser(policy).parse()
+
+    def get_container_nodes(self, netmap: Netmap, cid: str) -> list[list[NetmapNode]]:
+        """Selects container nodes for each replica.
+
+        Args:
+            netmap: Network map to select nodes from.
+            cid: Container ID.
+
+        Returns:
+            For each REP statement: nodes that may store replicas of the container objects.
+
+        Raises:
+            ValueError: If nodes can't be selected or nodes of the map announce weights.
+        """
+        _check_weights(netmap)
+        pivot = xxh64(base58.b58decode(cid))
+        selectors = {selector.name: selector for selector in self.selectors}
+        selections = {
+            selector.name: self._select(netmap, selector, pivot) for selector in self.selectors
+        }
+
+        # With UNIQUE, selectors of replicas are evaluated again excluding already used nodes
+        used: set[str] = set()
+        vectors = []
+        for replica in self.replicas:
+            if replica.selector:
+                if replica.selector not in selections:
+                    raise ValueError(f"Unknown selector {replica.selector}")
+                if self.unique:
+                    buckets = self._select(netmap, selectors[replica.selector], pivot, used)
+                else:
+                    buckets = selections[replica.selector]
+            elif self.selectors:
+                buckets = [bucket for selection in selections.values() for bucket in selection]
+            else:
+                buckets = self._select(netmap, Selector(count=replica.count), pivot, used)
+            vector = [node for bucket in buckets for node in bucket]
+            if self.unique:
+                used.update(node.public_key for node in vector)
+            vectors.append(vector)
+        return vectors
+
+    def get_object_nodes(self, netmap: Netmap, cid: str, oid: str) -> list[list[NetmapNode]]:
+        """Returns container nodes for each replica ordered by priority for the object.
+
+        Args:
+            netmap: Network map to select nodes from.
+            cid: Container ID.
+            oid: Object ID.
+
+        Returns:
+            For each REP statement: container nodes sorted by HRW with object ID as a pivot.
+        """
+        pivot = xxh64(base58.b58decode(oid))
+        return [_sort_by_hrw(vector, pivot) for vector in self.get_container_nodes(netmap, cid)]
+
+    def get_replica_nodes(self, netmap: Netmap, cid: str, oid: str) -> list[NetmapNode]:
+        """Returns nodes that are expected to store replicas of the object.
+
+        Args:
+            netmap: Network map to select nodes from.
+            cid: Container ID.
+            oid: Object ID.
+
+        Returns:
+            Unique nodes from the heads of object placement vectors.
+        """
+        nodes = {}
+        for replica, vector in zip(self.replicas, self.get_object_nodes(netmap, cid, oid)):
+            for node in vector[: replica.count]:
+                nodes.setdefault(node.public_key, node)
+        return list(nodes.values())
+
+    def _select(
+        self, netmap: Netmap, selector: Selector, pivot: int, used: Collection[str] = ()
+    ) -> list[list[NetmapNode]]:
+        if selector.filter != MAIN_FILTER and selector.filter not in self.filters:
+            raise ValueError(f"Unknown filter {selector.filter}")
+        nodes = [
+            node
+            for node in netmap.nodes
+            if node.public_key not in used
+            and (
+                selector.filter == MAIN_FILTER
+                or _match(self.filters[selector.filter], node, self.filters)
+            )
+        ]
+
+        if selector.attribute:
+            groups: dict[str, list[NetmapNode]] = {}
+            for node in nodes:
+                groups.setdefault(node.attributes.get(selector.attribute, ""), []).append(node)
+            buckets = [_sort_by_hrw(group, pivot) for group in groups.values()]
+        else:
+            buckets = [[node] for node in nodes]
+
+        if selector.clause == "SAME":
+            bucket_count, nodes_in_bucket = 1, selector.count
+        else:
+            bucket_count, nodes_in_bucket = selector.count, 1
+        max_nodes_in_bucket = nodes_in_bucket * self.backup_factor
+
+        # Same as neofs-sdk-go, buckets that are large enough for the backup factor are used,
+        # and smaller ones (with backup factor of 1) are added only if there are not enough of them
+        selected = [
+            bucket[:max_nodes_in_bucket] for bucket in buckets if len(bucket) >= max_nodes_in_bucket
+        ]
+        if len(selected) < bucket_count:
+            selected += [
+                bucket for bucket in buckets if nodes_in_bucket <= len(bucket) < max_nodes_in_bucket
+            ]
+        if len(selected) < bucket_count:
+            raise ValueError(
+                f"Not enough nodes for selector {selector.name or selector.count}: "
+                f"{len(selected)} of {bucket_count} buckets available"
+            )
+        selected = _sort_by_hrw(selected, pivot, key=lambda bucket: bucket[0].hash)
+        if not selector.attribute:
+            # Each node is a separate bucket, so buckets are multiplied by backup factor
+            bucket_count *= self.backup_factor
+        return selected[:bucket_count]
+
+
+def _check_weights(netmap: Netmap) -> None:
+    for node in netmap.nodes:
+        for attribute in WEIGHT_ATTRIBUTES:
+            if node.attributes.get(attribute, "0") != "0":
+                raise ValueError(
+                    f"Node {node.public_key} announces {attribute}, "
+                    "weighted placement is not supported"
+                )
+
+
+def _sort_by_hrw(items: list, pivot: int, key=None) -> list:
+    key = key or (lambda node: node.hash)
+    return sorted(items, key=lambda item: hrw_distance(key(item), pivot))
+
+
+def _match(policy_filter: Filter, node: NetmapNode, filters: dict[str, Filter]) -> bool:
+    if policy_filter.operation == "@":
+        if policy_filter.key not in filters:
+            raise ValueError(f"Unknown filter {policy_filter.key}")
+        return _match(filters[policy_filter.key], node, filters)
+    if policy_filter.operation == "AND":
+        return all(_match(inner, node, filters) for inner in policy_filter.filters)
+    if policy_filter.operation == "OR":
+        return any(_match(inner, node, filters) for inner in policy_filter.filters)
+
+    value = node.attributes.get(policy_filter.key)
+    if policy_filter.operation == "EQ":
+        return value == policy_filter.value
+    if policy_filter.operation == "NE":
+        return value != policy_filter.value
+    try:
+        actual, expected = int(value), int(policy_filter.value)
+    except (TypeError, ValueError):
+        return False
+    return {
+        "GT": actual > expected,
+        "GE": actual >= expected,
+        "LT": actual < expected,
+        "LE": actual <= expected,
+    }[policy_filter.operation]
+
+
+class _PolicyParser:
+    """Recursive descent parser of NeoFS placement policy language."""
+
+    def __init__(self, policy: str) -> None:
+        self.tokens = _POLICY_TOKEN_REGEX.findall(policy)
+        self.position = 0
+
+    def parse(self) -> PlacementPolicy:
+        unique = self._accept("UNIQUE")
+        replicas = []
+        while self._accept("REP"):
+            count = self._take_int()
+            selector = self._take() if self._accept("IN") else None
+            replicas.append(Replica(count, selector))
+        if not replicas:
+            raise ValueError("Placement policy must contain at least one REP statement")
+
+        policy = PlacementPolicy(replicas, unique=unique)
+        if self._accept("CBF"):
+            policy.backup_factor = self._take_int()
+        while self._accept("SELECT"):
+            policy.selectors.append(self._parse_selector())
+        while self._accept("FILTER"):
+            policy_filter = self._parse_or()
+            self._expect("AS")
+            policy_filter.name = self._take()
+            policy.filters[policy_filter.name] = policy_filter
+        if self.position < len(self.tokens):
+            raise ValueError(f"Unexpected token in placement policy: {self.tokens[self.position]}")
+        return policy
+
+    def _parse_selector(self) -> Selector:
+        selector = Selector(count=self._take_int())
+        if self._accept("IN"):
+            if self._peek() in ("SAME", "DISTINCT"):
+                selector.clause = self._take().upper()
+            selector.attribute = self._take()
+        self._expect("FROM")
+        selector.filter = self._take()
+        if self._accept("AS"):
+            selector.name = self._take()
+        return selector
+
+    def _parse_or(self) -> Filter:
+        filters = [self._parse_and()]
+        while self._accept("OR"):
+            filters.append(self._parse_and())
+        return filters[0] if len(filters) == 1 else Filter("OR", filters=filters)
+
+    def _parse_and(self) -> Filter:
+        filters = [self._parse_expression()]
+        while self._accept("AND"):
+            filters.append(self._parse_expression())
+        return filters[0] if len(filters) == 1 else Filter("AND", filters=filters)
+
+    def _parse_expression(self) -> Filter:
+        if self._accept("("):
+            policy_filter = self._parse_or()
+            self._expect(")")
+            return policy_filter
+        token = self._take()
+        if token.startswith("@"):
+            # Reference to a named filter, it is resolved when the filter is matched
+            return Filter("@", key=token[1:])
+        operation = self._take().upper()
+        if operation not in _FILTER_OPERATIONS:
+            raise ValueError(f"Unknown filter operation: {operation}")
+        return Filter(operation, key=token, value=self._take())
+
+    def _peek(self) -> Optional[str]:
+        if self.position >= len(self.tokens):
+            return None
+        return self.tokens[self.position].upper()
+
+    def _accept(self, keyword: str) -> bool:
+        if self._peek() == keyword:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, keyword: str) -> None:
+        if not self._accept(keyword):
+            raise ValueError(f"Expected {keyword} in placement policy, got {self._peek()}")
+
+    def _take(self) -> str:
+        if self.position >= len(self.tokens):
+            raise ValueError("Unexpected end of placement policy")
+        token = self.tokens[self.position]
+        self.position += 1
+        if len(token) >= 2 and token[0] == token[-1] and token[0] in "\"'":
+            token = token[1:-1]
+        return token
+
+    def _take_int(self) -> int:
+        token = self._take()
+        if not token.isdigit():
+            raise ValueError(f"Expected number in placement policy, got {token}")
+        return int(token)
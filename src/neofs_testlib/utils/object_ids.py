@@ -0,0 +1,177 @@
+import hashlib
+import heapq
+import itertools
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Object IDs are printed by neofs-cli as base58-encoded SHA-256 hashes
+_OBJECT_ID_REGEX = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{43,44}$")
+_DIGEST_MODULUS = 2**256
+DEFAULT_RUN_SIZE = 100_000
+
+
+def parse_object_ids(lines: Iterable[str]) -> Iterator[str]:
+    """Extracts object IDs from lines of neofs-cli output, skipping all other lines.
+
+    Args:
+        lines: Lines of output, for example, of `object search` or `container list-objects`.
+
+    Yields:
+        Object IDs.
+    """
+    for line in lines:
+        line = line.strip()
+        if _OBJECT_ID_REGEX.match(line):
+            yield line
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Splits items into lists of the specified size (the last one may be smaller).
+
+    Args:
+        items: Items to split; the iterable is consumed lazily.
+        size: Size of a chunk.
+
+    Yields:
+        Chunks of items.
+    """
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+@dataclass(frozen=True)
+class ObjectIdsDigest:
+    """Order-independent digest of a collection of object IDs.
+
+    Digests of two collections are equal if they contain the same IDs (with the same number of
+    repetitions) regardless of order, so large collections can be compared in constant memory.
+
+    Attributes:
+        count: Number of IDs in the collection.
+        digest: Sum of SHA-256 hashes of the IDs modulo 2^256 in hex.
+    """
+
+    count: int
+    digest: str
+
+
+def get_object_ids_digest(object_ids: Iterable[str]) -> ObjectIdsDigest:
+    """Calculates order-independent digest of object IDs.
+
+    Args:
+        object_ids: Object IDs; the iterable is consumed lazily.
+
+    Returns:
+        Digest of the IDs.
+    """
+    count = 0
+    total = 0
+    for object_id in object_ids:
+        count += 1
+        total += int.from_bytes(hashlib.sha256(object_id.encode()).digest(), "big")
+    return ObjectIdsDigest(count, f"{total % _DIGEST_MODULUS:064x}")
+
+
+@dataclass
+class ObjectIdsDiff:
+    """Difference between two sets of object IDs.
+
+    Attributes:
+        only_left: IDs that are present only in the left set (up to the limit of the comparison).
+        only_right: IDs that are present only in the right set (up to the limit of the comparison).
+        only_left_count: Total number of IDs that are present only in the left set.
+        only_right_count: Total number of IDs that are present only in the right set.
+        common_count: Number of IDs that are present in both sets.
+    """
+
+    only_left: list[str] = field(default_factory=list)
+    only_right: list[str] = field(default_factory=list)
+    only_left_count: int = 0
+    only_right_count: int = 0
+    common_count: int = 0
+
+    @property
+    def equal(self) -> bool:
+        return not self.only_left_count and not self.only_right_count
+
+
+def compare_object_ids(
+    left: Iterable[str],
+    right: Iterable[str],
+    limit: Optional[int] = 1000,
+    run_size: int = DEFAULT_RUN_SIZE,
+    directory: Optional[str] = None,
+) -> ObjectIdsDiff:
+    """Compares two large sets of object IDs using external sort.
+
+    Each collection is split into sorted runs of `run_size` IDs that are spilled to temporary
+    files, then runs are merged and both sorted streams are compared in a single pass. Memory
+    usage is bounded by the run size. Duplicates within a collection are ignored.
+
+    Args:
+        left: The first collection of IDs.
+        right: The second collection of IDs.
+        limit: Max number of differing IDs of each side to keep in the result; None means
+            no limit. Counts of differing IDs are always exact.
+        run_size: Number of IDs sorted in memory at once.
+        directory: Directory for temporary files; system temporary directory by default.
+
+    Returns:
+        Difference between the sets.
+    """
+    with tempfile.TemporaryDirectory(prefix="object-ids-", dir=directory) as temp_directory:
+        left_sorted = _sort_externally(left, run_size, temp_directory, "left")
+        right_sorted = _sort_externally(right, run_size, temp_directory, "right")
+
+        diff = ObjectIdsDiff()
+        left_id = next(left_sorted, None)
+        right_id = next(right_sorted, None)
+        while left_id is not None or right_id is not None:
+            if right_id is None or (left_id is not None and left_id < right_id):
+                diff.only_left_count += 1
+                if limit is None or len(diff.only_left) < limit:
+                    diff.only_left.append(left_id)
+                left_id = next(left_sorted, None)
+            elif left_id is None or right_id < left_id:
+                diff.only_right_count += 1
+                if limit is None or len(diff.only_right) < limit:
+                    diff.only_right.append(right_id)
+                right_id = next(right_sorted, None)
+            else:
+                diff.common_count += 1
+                left_id = next(left_sorted, None)
+                right_id = next(right_sorted, None)
+        return diff
+
+
+def _sort_externally(
+    object_ids: Iterable[str], run_size: int, directory: str, prefix: str
+) -> Iterator[str]:
+    """Sorts IDs via sorted runs in files and returns iterator over unique sorted IDs."""
+    run_paths = []
+    for run in chunked(object_ids, run_size):
+        run_path = os.path.join(directory, f"{prefix}-{len(run_paths)}")
+        with open(run_path, "w") as run_file:
+            run_file.writelines(f"{object_id}\n" for object_id in sorted(run))
+        run_paths.append(run_path)
+    return _merge_runs(run_paths)
+
+
+def _merge_runs(run_paths: list[str]) -> Iterator[str]:
+    run_files = [open(run_path) for run_path in run_paths]
+    try:
+        previous_id = None
+        for line in heapq.merge(*run_files):
+            object_id = line.rstrip("\n")
+            if object_id != previous_id:
+                yield object_id
+                previous_id = object_id
+    finally:
+        for run_file in run_files:
+            run_file.close()
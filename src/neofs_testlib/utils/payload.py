@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import os
+import random
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+logger = logging.getLogger("neofs.testlib.utils")
+
+# Content of each block depends only on the seed and block number, so any range of the payload
+# can be generated without generating preceding data
+BLOCK_SIZE = 64 * 1024
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class PayloadGenerator:
+    """Generates reproducible pseudo-random payload of any size without keeping it in memory.
+
+    Payload is defined by its size and seed: generators with the same size and seed produce
+    the same bytes. Payload can be written to a file or streamed to a process through a named
+    pipe; SHA-256 hash of the payload is calculated on the fly while it is generated.
+    """
+
+    def __init__(self, size: int, seed: Union[int, str] = 0) -> None:
+        """
+        Args:
+            size: Size of the payload (in bytes).
+            seed: Seed that defines content of the payload.
+        """
+        self.size = size
+        self.seed = seed
+        self._sha256: Optional[str] = None
+
+    def read(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        """Returns range of the payload.
+
+        Args:
+            offset: Offset of the range.
+            length: Length of the range; by default the range ends at the end of the payload.
+
+        Returns:
+            Bytes of the range.
+        """
+        return b"".join(self.iter_chunks(offset=offset, length=length))
+
+    def iter_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, offset: int = 0, length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Generates range of the payload chunk by chunk.
+
+        Args:
+            chunk_size: Max size of a chunk (in bytes).
+            offset: Offset of the range.
+            length: Length of the range; by default the range ends at the end of the payload.
+
+        Yields:
+            Consecutive chunks of the range.
+        """
+        end = self.size if length is None else min(offset + length, self.size)
+        position = offset
+        while position < end:
+            chunk_end = min(position + chunk_size, end)
+            chunk = []
+            for block_index in range(position // BLOCK_SIZE, (chunk_end - 1) // BLOCK_SIZE + 1):
+                block_start = block_index * BLOCK_SIZE
+                block = self._get_block(block_index)
+                chunk.append(block[max(position - block_start, 0) : chunk_end - block_start])
+            yield b"".join(chunk)
+            position = chunk_end
+
+    def sha256(self) -> str:
+        """Returns hex-encoded SHA-256 hash of the payload.
+
+        The hash is cached, if the payload was written to a file or streamed before, it is not
+        generated again.
+        """
+        if self._sha256 is None:
+            digest = hashlib.sha256()
+            for chunk in self.iter_chunks():
+                digest.update(chunk)
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+
+    def write_to_file(self, path: str) -> str:
+        """Writes the payload to a file chunk by chunk.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            Path to the file.
+        """
+        with open(path, "wb") as file:
+            self._write(file)
+        return path
+
+    @contextmanager
+    def fifo(self, directory: Optional[str] = None) -> Iterator[str]:
+        """Streams the payload through a named pipe.
+
+        The pipe is fed by a background thread as the reader consumes it, so the payload never
+        touches the disk. A pipe can be read only once.
+
+        Args:
+            directory: Directory where the pipe is created; temporary directory by default.
+
+        Yields:
+            Path to the named pipe, for example, to be passed as file to `object put`.
+        """
+        fifo_directory = tempfile.mkdtemp(prefix="payload-", dir=directory)
+        fifo_path = os.path.join(fifo_directory, "payload")
+        os.mkfifo(fifo_path, 0o600)
+        fifo_opened = threading.Event()
+        writer = threading.Thread(
+            target=self._write_to_fifo,
+            args=(fifo_path, fifo_opened),
+            name="payload-writer",
+            daemon=True,
+        )
+        writer.start()
+        try:
+            yield fifo_path
+        finally:
+            if writer.is_alive():
+                # Reader did not consume the whole payload (or did not open the pipe at all), so we
+                # open and close the pipe for reading, so that the writer gets an error and exits
+                descriptor = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+                fifo_opened.wait()
+                os.close(descriptor)
+                writer.join()
+            os.remove(fifo_path)
+            os.rmdir(fifo_directory)
+
+    def _get_block(self, block_index: int) -> bytes:
+        block_size = min(BLOCK_SIZE, self.size - block_index * BLOCK_SIZE)
+        return random.Random(f"{self.seed}:{block_index}").randbytes(block_size)
+
+    def _write(self, file) -> None:
+        digest = hashlib.sha256()
+        for chunk in self.iter_chunks():
+            file.write(chunk)
+            digest.update(chunk)
+        self._sha256 = digest.hexdigest()
+
+    def _write_to_fifo(self, fifo_path: str, fifo_opened: threading.Event) -> None:
+        try:
+            with open(fifo_path, "wb") as fifo:
+                fifo_opened.set()
+                self._write(fifo)
+        except BrokenPipeError:
+            logger.warning(f"Payload stream {fifo_path} was closed by reader before the end")
@@ -1,8 +1,11 @@
+import json
+import os
 from unittest import TestCase
 from unittest.mock import Mock
 
 from neofs_testlib.cli import NeofsAdm, NeofsCli, NeoGo
 from neofs_testlib.cli.cli_command import CliCommand
+from neofs_testlib.shell import LocalShell
 from neofs_testlib.shell.interfaces import CommandOptions, InteractiveInput
 
 
@@ -120,6 +123,30 @@ class TestCli(TestCase):
             ),
         )
 
+    def test_wallet_sign_with_generated_wallet_config(self):
+        shell = Mock(spec=LocalShell)
+        neo_go = NeoGo(
+            shell=shell, config_path=self.config_file, neo_go_exec_path=self.neofs_go_exec_path
+        )
+        for _ in range(2):
+            neo_go.wallet.sign(
+                input_file=self.file1,
+                address=self.address,
+                wallet=self.wallet,
+                wallet_password=self.wallet_password,
+            )
+
+        first_command, second_command = [call.args[0] for call in shell.exec.call_args_list]
+        self.assertEqual(first_command, second_command)
+        self.assertNotIn("--wallet ", first_command)
+        wallet_config = first_command.split("--wallet-config '")[1].split("'")[0]
+        with open(wallet_config) as wallet_config_file:
+            self.assertEqual(
+                {"Path": os.path.abspath(self.wallet), "Password": self.wallet_password},
+                json.load(wallet_config_file),
+            )
+        self.assertEqual(0o600, os.stat(wallet_config).st_mode & 0o777)
+
     def test_subnet_create(self):
         shell = Mock()
         neofs_adm = NeofsAdm(
@@ -170,6 +197,52 @@ class TestCli(TestCase):
 
         shell.exec.assert_called_once_with(expected_command)
 
+    def test_wallet_nep17_multitransfer_with_transfers(self):
+        shell = Mock()
+        neo_go = NeoGo(
+            shell=shell, config_path=self.config_file, neo_go_exec_path=self.neofs_go_exec_path
+        )
+        transfers = [f"{self.token}:{address}:{self.amount}" for address in self.addresses]
+        neo_go.nep17.multitransfer(
+            wallet_config=self.config_file,
+            token=self.token,
+            to_address=self.addresses,
+            sysgas=self.sysgas,
+            rpc_endpoint=self.rpc_endpoint,
+            force=True,
+            transfers=transfers,
+        )
+
+        expected_command = (
+            f"{self.neofs_go_exec_path} --config_path {self.config_file} "
+            f"wallet nep17 multitransfer --sysgas '{self.sysgas}' "
+            f"--rpc-endpoint '{self.rpc_endpoint}' --wallet-config '{self.config_file}' --force "
+            f"--timeout '10s' {' '.join(transfers)}"
+        )
+
+        shell.exec.assert_called_once_with(expected_command)
+
+    def test_object_iter_search(self):
+        shell = Mock()
+        object_id = "9ahXdzn3ykEuCYvDMjzKKQDhCJSeW5Xd1b1Xye8U6bWX"
+        shell.exec_lines.return_value = iter(["Found 1 objects.", object_id])
+        neofs_cli = NeofsCli(
+            config_file=self.config_file,
+            neofs_cli_exec_path=self.neofs_cli_exec_path,
+            shell=shell,
+        )
+
+        object_ids = neofs_cli.object.iter_search(
+            rpc_endpoint=self.rpc_endpoint, wallet=self.wallet, cid="cid1", root=True
+        )
+
+        self.assertEqual([object_id], list(object_ids))
+        shell.exec_lines.assert_called_once_with(
+            f"{self.neofs_cli_exec_path} --config {self.config_file} object search "
+            f"--rpc-endpoint '{self.rpc_endpoint}' --wallet '{self.wallet}' --cid 'cid1' "
+            f"--root"
+        )
+
     def test_version(self):
         shell = Mock()
         neofs_adm = NeofsAdm(shell=shell, neofs_adm_exec_path=self.neofs_adm_exec_path)
@@ -238,15 +311,17 @@ class TestCli(TestCase):
             wallet=self.wallet,
             path=self.path_to_objects,
             shard_id=self.shard_id,
+            timeout="1h",
+            shell_timeout=3600,
         )
 
         expected_command = (
             f"{self.neofs_cli_exec_path} --config {self.config_file} control shards dump "
             f"--endpoint '{self.rpc_endpoint}' --wallet '{self.wallet}' --id '{self.shard_id}' "
-            f"--path '{self.path_to_objects}'"
+            f"--path '{self.path_to_objects}' --timeout '1h'"
         )
 
-        shell.exec.assert_called_once_with(expected_command)
+        shell.exec.assert_called_once_with(expected_command, options=CommandOptions(timeout=3600))
 
     def test_shards_list(self):
         shell = Mock()
@@ -315,4 +390,5 @@ class TestCli(TestCase):
             f"--path '{self.path_to_objects}'"
         )
 
-        shell.exec.assert_called_once_with(expected_command)
+        # Default shell timeout is used if shell timeout is not set
+        shell.exec.assert_called_once_with(expected_command, options=CommandOptions())
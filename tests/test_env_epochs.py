@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from neofs_testlib.env.env import NeoFSEnv
+from neofs_testlib.shell import CommandResult
+
+
+class TestNeoFSEnvEpochs(TestCase):
+    def setUp(self):
+        self.env = NeoFSEnv()
+        self.env.storage_nodes = [
+            SimpleNamespace(
+                sn_number=number,
+                cli_config=f"sn{number}.yml",
+                endpoint=f"sn{number}:8080",
+                wallet=SimpleNamespace(path=f"sn{number}.json"),
+            )
+            for number in (1, 2)
+        ]
+        self.epochs = {"sn1:8080": 5, "sn2:8080": 4}
+        # Second node catches up after the first poll
+        self.lagging_polls = {"sn2:8080": 1}
+
+        neofs_cli = Mock()
+        neofs_cli.netmap.epoch.side_effect = self._get_epoch
+        patcher = patch.object(NeoFSEnv, "neofs_cli", return_value=neofs_cli)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_epoch(self, rpc_endpoint: str, wallet: str) -> CommandResult:
+        if self.lagging_polls.get(rpc_endpoint):
+            self.lagging_polls[rpc_endpoint] -= 1
+        else:
+            self.epochs[rpc_endpoint] = max(self.epochs.values())
+        return CommandResult(stdout=f"{self.epochs[rpc_endpoint]}\n", stderr="", return_code=0)
+
+    def test_get_epochs(self):
+        self.assertEqual({"sn1": 5, "sn2": 4}, self.env.get_epochs())
+
+    def test_tick_epoch(self):
+        neofs_adm = Mock()
+
+        def force_new_epoch(**kwargs):
+            self.epochs["sn1:8080"] += 1
+            self.lagging_polls["sn2:8080"] = 2
+
+        neofs_adm.morph.force_new_epoch.side_effect = force_new_epoch
+        with (
+            patch.object(NeoFSEnv, "neofs_adm", return_value=neofs_adm),
+            patch.object(NeoFSEnv, "morph_rpc", "ir1:30333"),
+            patch.object(NeoFSEnv, "alphabet_wallets_dir", "alphabet"),
+        ):
+            new_epoch = self.env.tick_epoch(timeout=5)
+
+        self.assertEqual(6, new_epoch)
+        self.assertEqual({"sn1": 6, "sn2": 6}, self.env.get_epochs())
+
+    def test_wait_for_epoch_tolerates_node_errors(self):
+        self.epochs["sn2:8080"] = 5
+        failures = iter([True, True, False, True])
+
+        def get_epoch(rpc_endpoint: str, wallet: str) -> CommandResult:
+            if rpc_endpoint == "sn2:8080" and next(failures):
+                raise RuntimeError("Error: rpc error: code = Unavailable")
+            return self._get_epoch(rpc_endpoint, wallet)
+
+        self.env.neofs_cli().netmap.epoch.side_effect = get_epoch
+
+        self.env.wait_for_epoch(5, timeout=5, poll_interval=0.01)
+
+        with self.assertRaises(RuntimeError):
+            self.env.get_epochs()
+
+    def test_wait_for_epoch_timeout(self):
+        with self.assertRaisesRegex(TimeoutError, "sn1"):
+            self.env.wait_for_epoch(10, timeout=0.2, poll_interval=0.05)
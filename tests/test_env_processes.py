@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+
+from neofs_testlib.env.env import NeoFSEnv
+
+
+class TestNeoFSEnvProcesses(TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+
+        self.env = NeoFSEnv()
+        self.env.storage_nodes = [self._launch_node(1), self._launch_node(2)]
+        self.running_node, self.loaded_node = self.env.storage_nodes
+
+        # Node of a loaded env has PID instead of the process handle
+        process = self.loaded_node.__dict__.pop("process")
+        self.loaded_node.pid = process.pid
+
+    def _launch_node(self, sn_number: int) -> SimpleNamespace:
+        stdout = os.path.join(self.output_dir.name, f"sn{sn_number}_stdout")
+        with open(stdout, "w") as stdout_file:
+            process = subprocess.Popen(
+                [sys.executable, "-c", "import time; time.sleep(60)"], stdout=stdout_file
+            )
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        return SimpleNamespace(sn_number=sn_number, process=process, stdout=stdout)
+
+    def test_processes_of_loaded_env_are_skipped(self):
+        self.assertEqual({"sn1": self.running_node.process}, self.env.processes())
+
+    def test_pids_of_loaded_env(self):
+        self.assertEqual(
+            {"sn1": self.running_node.process.pid, "sn2": self.loaded_node.pid}, self.env.pids()
+        )
+
+        # PID that is reused by another process does not belong to the node anymore
+        self.loaded_node.stdout = os.path.join(self.output_dir.name, "other_stdout")
+        open(self.loaded_node.stdout, "w").close()
+        self.assertEqual({"sn1": self.running_node.process.pid}, self.env.pids())
+
+    def test_resource_sampler_of_loaded_env(self):
+        sampler = self.env.resource_sampler()
+        sampler.sample()
+
+        self.assertEqual({"sn1", "sn2"}, set(sampler.samples()))
@@ -0,0 +1,78 @@
+import json
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import requests
+
+from neofs_testlib.blockchain import FundingSender, Nep17Funder
+from neofs_testlib.blockchain.rpc_client import NeoRPCException, RPCClient
+from neofs_testlib.shell import CommandResult
+
+
+class TestNep17Funder(TestCase):
+    def setUp(self):
+        self.sent_transfers = []
+        self.neogo = Mock()
+        self.neogo.nep17.multitransfer.side_effect = self._multitransfer
+        self.funder = Nep17Funder(self.neogo, "http://localhost:30333", transfers_per_transaction=3)
+        self.funder.rpc_client = Mock()
+
+    def _multitransfer(self, **kwargs) -> CommandResult:
+        self.sent_transfers.append(kwargs["transfers"])
+        tx_hash = f"tx{len(self.sent_transfers)}"
+        return CommandResult(stdout=f"Sent\n{tx_hash}\n", stderr="", return_code=0)
+
+    def test_fund(self):
+        recipients = [(f"address{index}", index) for index in range(7)]
+        senders = [
+            FundingSender(wallet="wallet1.json", wallet_password="one"),
+            FundingSender(wallet="wallet2.json", wallet_password="two"),
+        ]
+        # The first transaction is included in a block only at the second poll
+        self.funder.rpc_client = RPCClient("http://localhost:30333")
+        unknown_error = {"code": -100, "message": "Unknown transaction"}
+        responses = iter([make_response(500, {"error": unknown_error})])
+        halt = make_response(200, {"result": {"executions": [{"vmstate": "HALT"}]}})
+
+        def post(endpoint: str, data: str, **kwargs) -> requests.Response:
+            tx_hash = json.loads(data)["params"][0]
+            return next(responses, halt) if tx_hash == "tx1" else halt
+
+        with patch(
+            "neofs_testlib.blockchain.rpc_client.requests.post", side_effect=post
+        ) as post_mock:
+            tx_hashes = self.funder.fund(recipients, senders, poll_interval=0)
+
+        self.assertEqual(4, post_mock.call_count)
+
+        self.assertCountEqual(["tx1", "tx2", "tx3"], tx_hashes)
+        self.assertCountEqual(
+            [f"GAS:address{index}:{index}" for index in range(7)],
+            [transfer for transfers in self.sent_transfers for transfer in transfers],
+        )
+        self.assertEqual([3, 3, 1], sorted(map(len, self.sent_transfers), reverse=True))
+        wallets = [call.kwargs["wallet"] for call in self.neogo.nep17.multitransfer.call_args_list]
+        self.assertEqual(["wallet1.json", "wallet1.json", "wallet2.json"], sorted(wallets))
+
+    def test_failed_transaction(self):
+        self.funder.rpc_client.get_application_log.return_value = {
+            "executions": [{"vmstate": "FAULT", "exception": "insufficient funds"}]
+        }
+
+        with self.assertRaisesRegex(RuntimeError, "insufficient funds"):
+            self.funder.fund([("address", 1)], [FundingSender(wallet_config="config.yaml")])
+
+    def test_rpc_errors_are_raised(self):
+        self.funder.rpc_client = RPCClient("http://localhost:30333")
+        response = make_response(500, {"error": {"code": -32603, "message": "Internal error"}})
+
+        with patch("neofs_testlib.blockchain.rpc_client.requests.post", return_value=response):
+            with self.assertRaises(NeoRPCException):
+                self.funder.wait_for_transactions(["tx1"], poll_interval=0)
+
+
+def make_response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps({"jsonrpc": "2.0", "id": 1, **body}).encode()
+    return response
@@ -1,8 +1,24 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
 import docker
+from docker.errors import DockerException
+from requests import ConnectionError
 
-from neofs_testlib.hosting import CLIConfig, DockerHost, HostConfig, Hosting, ServiceConfig
+from neofs_testlib.hosting import (
+    CLIConfig,
+    DockerHost,
+    HostConfig,
+    Hosting,
+    ServiceConfig,
+    ServiceKind,
+)
+from neofs_testlib.hosting.docker_host import LogCursor, _parse_log_timestamp
 
 
 class TestHosting(TestCase):
@@ -129,3 +145,281 @@ class TestHosting(TestCase):
         container.remove()
 
         self.assertEqual(expected_pid, pid)
+
+
+class TestDockerHostLogs(TestCase):
+    HOST_CONFIG = HostConfig(
+        plugin_name="docker",
+        address="localhost",
+        services=[
+            {"name": "s01", "attributes": {"container_name": "s01"}},
+            {"name": "s02", "attributes": {"container_name": "s02"}},
+        ],
+    )
+    LOGS = {
+        "s01": (
+            b"2024-01-01T00:00:01.000000001Z first line\n"
+            b"2024-01-01T00:00:02.500000000Z object put\n"
+        ),
+        "s02": b"2024-01-01T00:00:03.000000000Z other line\n",
+    }
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.logs.side_effect = self._logs
+        self.host = DockerHost(self.HOST_CONFIG)
+        self.host._get_docker_client = MagicMock(return_value=self.client)
+
+    def _logs(self, container_name, stream=False, **kwargs):
+        logs = self.LOGS[container_name]
+        if kwargs.get("since") and kwargs["since"] > _parse_log_timestamp("2024-01-01T00:00:02Z"):
+            logs = b"\n".join(line for line in logs.split(b"\n") if b":03." in line)
+        return StubLogStream([logs[:20], logs[20:]]) if stream else logs
+
+    def test_parse_log_timestamp(self):
+        self.assertAlmostEqual(1704067202.5, _parse_log_timestamp("2024-01-01T00:00:02.5Z"))
+        self.assertAlmostEqual(
+            1704067202.5, _parse_log_timestamp("2024-01-01T03:00:02.500000000+03:00")
+        )
+
+    def test_is_message_in_logs(self):
+        self.assertTrue(self.host.is_message_in_logs(r"OBJECT\s+put"))
+        self.assertFalse(self.host.is_message_in_logs("object get"))
+
+    def test_is_message_in_logs_with_cursor(self):
+        cursor = LogCursor()
+        self.assertTrue(self.host.is_message_in_logs("object put", cursor=cursor))
+        self.assertAlmostEqual(
+            _parse_log_timestamp("2024-01-01T00:00:02.5Z"), cursor.positions["s01"]
+        )
+        self.assertFalse(self.host.is_message_in_logs("object put", cursor=cursor))
+
+    def test_read_logs(self):
+        logs = self.host.read_logs()
+        self.assertEqual({"s01": "first line\nobject put", "s02": "other line"}, logs)
+
+    def test_stream_close_error_is_ignored(self):
+        def logs(container_name, **kwargs):
+            stream = StubLogStream([self.LOGS[container_name]])
+            stream.close = MagicMock(side_effect=DockerException("ssh transport"))
+            return stream
+
+        self.client.logs.side_effect = logs
+        self.assertTrue(self.host.is_message_in_logs("object put"))
+        self.assertFalse(self.host.is_message_in_logs("object get"))
+
+    def test_dump_logs_keeps_matched_fragments(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.host.dump_logs(directory, filter_regex=r"object (\w+)")
+
+        with open(os.path.join(directory, "localhost-s01-log.txt")) as file:
+            self.assertEqual("put", file.read())
+        with open(os.path.join(directory, "localhost-s02-log.txt")) as file:
+            self.assertIn("No matches found", file.read())
+
+
+class StubLogStream:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self) -> None:
+        pass
+
+
+class TestDockerHostStateWait(TestCase):
+    HOST_CONFIG = HostConfig(
+        plugin_name="docker",
+        address="localhost",
+        services=[{"name": "s01", "attributes": {"container_name": "s01", "start_timeout": 1}}],
+    )
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.host = DockerHost(self.HOST_CONFIG)
+        self.host._get_docker_client = MagicMock(return_value=self.client)
+
+    def _set_states(self, *states: str) -> None:
+        self.client.inspect_container.side_effect = [
+            {"State": {"Status": state}} for state in states
+        ]
+
+    def test_start_service_waits_for_event(self):
+        self._set_states("created", "running")
+        self.client.events.return_value = StubLogStream([{"status": "start"}])
+
+        self.host.start_service("s01")
+
+        self.client.start.assert_called_once_with("s01")
+        self.assertEqual(2, self.client.inspect_container.call_count)
+
+    def test_start_service_timeout(self):
+        self._set_states("created", "created", "created")
+        self.client.events.return_value = StubLogStream([{"status": "die"}])
+
+        with self.assertRaises(RuntimeError):
+            self.host.start_service("s01")
+
+
+class TestDockerHostClients(TestCase):
+    HOST_CONFIG = HostConfig(
+        plugin_name="docker",
+        address="localhost",
+        attributes={"docker_endpoint": "tcp://localhost:2375", "docker_pool_size": 4},
+        services=[{"name": "s01", "attributes": {"container_name": "s01"}}],
+    )
+
+    def test_clients_are_cached(self):
+        host = DockerHost(self.HOST_CONFIG)
+        with patch("docker.APIClient") as api_client_type:
+            client = host._get_docker_client()
+            self.assertIs(client, host._get_docker_client())
+            api_client_type.assert_called_once_with(
+                base_url="tcp://localhost:2375", timeout=60, max_pool_size=4
+            )
+
+    def test_clients_are_invalidated_on_connection_error(self):
+        host = DockerHost(self.HOST_CONFIG)
+        with patch("docker.APIClient") as api_client_type:
+            client = host._get_docker_client()
+            client.top.side_effect = ConnectionError("connection refused")
+            with self.assertRaises(ConnectionError):
+                host.get_service_pid("s01")
+            client.close.assert_called_once()
+
+            host._get_docker_client()
+            self.assertEqual(2, api_client_type.call_count)
+
+
+class TestDockerHostStorageWipe(TestCase):
+    HOST_CONFIG = HostConfig(
+        plugin_name="docker",
+        address="localhost",
+        services=[{"name": "s01", "attributes": {"container_name": "s01_container"}}],
+    )
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.host = DockerHost(self.HOST_CONFIG)
+        self.host._get_docker_client = MagicMock(return_value=self.client)
+
+    def test_delete_storage_node_data_in_single_container(self):
+        self.host.delete_storage_node_data("s01")
+
+        self.client.containers.run.assert_called_once_with(
+            "alpine",
+            [
+                "sh",
+                "-c",
+                "rm -rf /storage/meta* /storage/blobovnicza* /storage/fstree* /storage/pilorama*",
+            ],
+            volumes_from=["s01_container"],
+            remove=True,
+        )
+
+    def test_wipe_rejects_unsafe_patterns(self):
+        for pattern in ("../etc", "meta*; reboot", "$(id)"):
+            with self.assertRaises(ValueError):
+                self.host.wipe_storage_node_data("s01", [pattern])
+        self.client.containers.run.assert_not_called()
+
+
+class TestHostingConcurrentOperations(TestCase):
+    HOSTING_CONFIG = {
+        "hosts": [
+            {
+                "address": f"10.10.10.{index}",
+                "plugin_name": "docker",
+                "services": [{"name": f"s{index}", "attributes": {"container_name": f"s{index}"}}],
+            }
+            for index in range(1, 4)
+        ]
+    }
+
+    def setUp(self):
+        self.hosting = Hosting()
+        self.hosting.configure(self.HOSTING_CONFIG)
+
+    def test_restart_services_runs_in_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+        with patch.object(DockerHost, "restart_service", side_effect=lambda _: barrier.wait()):
+            results = self.hosting.restart_services(["s1", "s2", "s3"])
+
+        self.assertEqual({"s1", "s2", "s3"}, set(results))
+        self.assertTrue(all(result.succeeded for result in results.values()))
+
+    def test_failures_are_collected_per_service(self):
+        def start_service(service_name):
+            if service_name == "s2":
+                raise RuntimeError("container is not running")
+
+        with patch.object(DockerHost, "start_service", side_effect=start_service):
+            results = self.hosting.start_services(["s1", "s2", "s3"], raise_on_error=False)
+            with self.assertRaisesRegex(RuntimeError, "s2: container is not running"):
+                self.hosting.start_services(["s1", "s2", "s3"])
+
+        self.assertTrue(results["s1"].succeeded)
+        self.assertIsInstance(results["s2"].error, RuntimeError)
+
+    def test_deadline_is_enforced(self):
+        release = threading.Event()
+        with patch.object(DockerHost, "stop_service", side_effect=lambda _: release.wait(5)):
+            results = self.hosting.stop_services(["s1"], timeout=0.1, raise_on_error=False)
+        release.set()
+
+        self.assertIsInstance(results["s1"].error, TimeoutError)
+
+    def test_delete_storage_nodes_data_with_patterns(self):
+        client = MagicMock()
+        with patch.object(DockerHost, "_get_docker_client", return_value=client):
+            self.hosting.delete_storage_nodes_data(["s1", "s2"], patterns=["meta*", "fstree*"])
+
+        self.assertEqual(2, client.containers.run.call_count)
+        for call in client.containers.run.call_args_list:
+            self.assertEqual(["sh", "-c", "rm -rf /storage/meta* /storage/fstree*"], call.args[1])
+
+
+class TestHostingServiceIndex(TestCase):
+    SERVICE_NAMES = ["s01", "s02", "ir01", "s3-gate01", "http-gate01", "s10"]
+    HOSTING_CONFIG = {
+        "hosts": [
+            {
+                "address": "10.10.10.1",
+                "plugin_name": "docker",
+                "services": [{"name": name} for name in SERVICE_NAMES[:3]],
+            },
+            {
+                "address": "10.10.10.2",
+                "plugin_name": "docker",
+                "services": [{"name": name} for name in SERVICE_NAMES[3:]],
+            },
+        ]
+    }
+
+    def setUp(self):
+        self.hosting = Hosting()
+        self.hosting.configure(self.HOSTING_CONFIG)
+
+    def _find(self, pattern: str) -> list[str]:
+        return [service.name for service in self.hosting.find_service_configs(pattern)]
+
+    def test_find_service_configs_matches_regex(self):
+        for pattern in (r"s\d+", r"^s0", r"s3?-?g", r"(ir|http)", r".*gate", r"s1*0", r"s0[12]$"):
+            expected = [name for name in self.SERVICE_NAMES if re.match(pattern, name)]
+            self.assertEqual(expected, self._find(pattern), pattern)
+            # repeated lookup is served from cache and must not be affected by caller changes
+            self.hosting.find_service_configs(pattern).clear()
+            self.assertEqual(expected, self._find(pattern), pattern)
+
+    def test_get_service_configs_by_kind(self):
+        def names(kind: ServiceKind) -> list[str]:
+            return [service.name for service in self.hosting.get_service_configs_by_kind(kind)]
+
+        self.assertEqual(["s01", "s02", "s10"], names(ServiceKind.STORAGE))
+        self.assertEqual(["ir01"], names(ServiceKind.IR))
+        self.assertEqual(["s3-gate01"], names(ServiceKind.S3_GATE))
+        self.assertEqual(["http-gate01"], names(ServiceKind.HTTP_GATE))
@@ -0,0 +1,155 @@
+import gzip
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+from neofs_testlib.env import log_rotation
+from neofs_testlib.hosting import HostConfig
+from neofs_testlib.hosting.local_process_host import LocalProcessHost
+
+
+class StubNode:
+    def __init__(self, log_dir: str) -> None:
+        self.log_dir = log_dir
+        self.launches = 0
+        self.process = None
+        self.stdout = "Not initialized"
+        self.stderr = "Not initialized"
+
+    def _launch_process(self) -> None:
+        self.launches += 1
+        self.stdout = os.path.join(self.log_dir, f"stdout_{self.launches}")
+        self.stderr = os.path.join(self.log_dir, f"stderr_{self.launches}")
+        with open(self.stderr, "w") as stderr_file:
+            stderr_file.write(
+                f"2024-01-01T00:00:0{self.launches}.000Z\tinfo\tlaunch {self.launches}\n"
+                "\tcontinuation line\n"
+            )
+        self.process = log_rotation.launch_process(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            self.stdout,
+            self.stderr,
+            log_rotation.LogRotationConfig(),
+        )
+
+
+class StubEnv:
+    def __init__(self, nodes: dict) -> None:
+        self._nodes = nodes
+
+    def nodes(self) -> dict:
+        return self._nodes
+
+
+class TestLocalProcessHost(TestCase):
+    HOST_CONFIG = HostConfig(
+        plugin_name="local",
+        address="localhost",
+        services=[{"name": "sn1", "attributes": {"stop_timeout": 5}}],
+    )
+
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.node = StubNode(self.log_dir.name)
+        self.host = LocalProcessHost(self.HOST_CONFIG, neofs_env=StubEnv({"sn1": self.node}))
+
+    def tearDown(self):
+        if self.node.process is not None:
+            self.node.process.kill()
+            self.node.process.wait()
+            log_rotation.stop_rotation(self.node.stdout, self.node.stderr)
+        self.log_dir.cleanup()
+
+    def test_hosting_does_not_import_env(self):
+        # Local host is loaded as a plugin, so users of other hosts don't import the env
+        code = "import sys, neofs_testlib.hosting; print('neofs_testlib.env.env' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        self.assertEqual("False", output.strip())
+
+    def test_service_lifecycle(self):
+        self.host.start_service("sn1")
+        first_pid = self.host.get_service_pid("sn1")
+
+        first_stdout = self.node.stdout
+        self.assertIn(first_stdout, log_rotation._rotator._files)
+
+        self.host.restart_service("sn1")
+        self.assertNotEqual(first_pid, self.host.get_service_pid("sn1"))
+        self.assertNotIn(first_stdout, log_rotation._rotator._files)
+
+        self.host.stop_service("sn1")
+        self.assertIsNotNone(self.node.process.poll())
+        # Output files of stopped processes are not rotated anymore
+        self.assertNotIn(self.node.stdout, log_rotation._rotator._files)
+        self.assertNotIn(self.node.stderr, log_rotation._rotator._files)
+        with self.assertRaises(RuntimeError):
+            self.host.get_service_pid("sn1")
+
+    def test_logs_of_all_launches(self):
+        self.host.start_service("sn1")
+        self.host.restart_service("sn1")
+
+        self.assertTrue(self.host.is_message_in_logs("launch 1"))
+        self.assertFalse(
+            self.host.is_message_in_logs("launch 1", since=datetime(2024, 1, 1, 0, 0, 2))
+        )
+
+        self.host.dump_logs(self.log_dir.name, until=datetime(2024, 1, 1, 0, 0, 1))
+        with open(os.path.join(self.log_dir.name, "localhost-sn1-log.txt")) as log_file:
+            self.assertEqual(
+                "2024-01-01T00:00:01.000Z\tinfo\tlaunch 1\n\tcontinuation line\n", log_file.read()
+            )
+
+    def test_rotated_logs(self):
+        self.host.start_service("sn1")
+        os.rename(self.node.stderr, f"{self.node.stderr}.1")
+        with (
+            open(f"{self.node.stderr}.1", "rb") as segment,
+            gzip.open(f"{self.node.stderr}.1.gz", "wb") as compressed_segment,
+        ):
+            compressed_segment.write(segment.read())
+        os.remove(f"{self.node.stderr}.1")
+        with open(self.node.stderr, "w") as stderr_file:
+            stderr_file.write("2024-01-01T00:00:05.000Z\tinfo\tafter rotation\n")
+
+        self.assertTrue(self.host.is_message_in_logs("launch 1"))
+        self.host.dump_logs(self.log_dir.name, filter_regex=r"\t(launch \d|after rotation)")
+        with open(os.path.join(self.log_dir.name, "localhost-sn1-log.txt")) as log_file:
+            self.assertEqual("launch 1\nafter rotation", log_file.read())
+
+    def test_process_of_loaded_env(self):
+        self.host.start_service("sn1")
+        process = self.node.process
+
+        # Node of a loaded env has PID instead of the process handle
+        loaded_node = StubNode(self.log_dir.name)
+        loaded_node.pid = process.pid
+        loaded_node.stdout = self.node.stdout
+        host = LocalProcessHost(self.HOST_CONFIG, neofs_env=StubEnv({"sn1": loaded_node}))
+
+        host.start_service("sn1")
+        self.assertEqual(0, loaded_node.launches)
+        self.assertEqual(str(process.pid), host.get_service_pid("sn1"))
+
+        host.stop_service("sn1")
+        self.assertEqual(-15, process.wait(timeout=5))
+        with self.assertRaises(RuntimeError):
+            host.get_service_pid("sn1")
+
+    def test_reused_pid_is_not_controlled(self):
+        other_process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        self.addCleanup(other_process.wait)
+        self.addCleanup(other_process.kill)
+        loaded_node = StubNode(self.log_dir.name)
+        loaded_node.pid = other_process.pid
+        loaded_node.stdout = os.path.join(self.log_dir.name, "stdout")
+        open(loaded_node.stdout, "w").close()
+        host = LocalProcessHost(self.HOST_CONFIG, neofs_env=StubEnv({"sn1": loaded_node}))
+
+        with self.assertRaises(RuntimeError):
+            host.get_service_pid("sn1")
+        host.stop_service("sn1")
+        self.assertIsNone(other_process.poll())
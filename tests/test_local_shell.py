@@ -1,4 +1,6 @@
+import time
 from unittest import TestCase
+from unittest.mock import patch
 
 from neofs_testlib.shell.interfaces import CommandOptions, InteractiveInput
 from neofs_testlib.shell.local_shell import LocalShell
@@ -43,6 +45,42 @@ class TestLocalShellInteractive(TestCase):
         )
         self.assertEqual("", result.stderr)
 
+    def test_password_prompts_without_delay(self):
+        script = (
+            "import getpass; "
+            "print(getpass.getpass('Password1: ')); print(getpass.getpass('Password2: '))"
+        )
+        inputs = [
+            InteractiveInput(prompt_pattern="Password1", input="test1"),
+            InteractiveInput(prompt_pattern="Password2", input="test2"),
+        ]
+
+        start_time = time.monotonic()
+        result = self.shell.exec(
+            f'python3 -c "{script}"', CommandOptions(interactive_inputs=inputs)
+        )
+
+        self.assertLess(time.monotonic() - start_time, 1)
+        self.assertEqual(0, result.return_code)
+        # Passwords are not echoed by the terminal
+        self.assertEqual(["Password1:", "test1", "Password2:", "test2"], get_output_lines(result))
+
+    def test_password_is_not_echoed_if_echo_is_turned_off_late(self):
+        # Process prints the prompt and turns echo off only after a while (e.g. on a loaded host)
+        script = (
+            "import getpass, sys, time; "
+            "sys.stdout.write('Password: '); sys.stdout.flush(); time.sleep(0.5); "
+            "print(getpass.getpass(''))"
+        )
+        inputs = [InteractiveInput(prompt_pattern="Password", input="secret")]
+
+        result = self.shell.exec(
+            f'python3 -c "{script}"', CommandOptions(interactive_inputs=inputs)
+        )
+
+        self.assertEqual(0, result.return_code)
+        self.assertEqual(["Password:", "secret"], get_output_lines(result))
+
     def test_failed_command_with_check(self):
         script = "invalid script"
         inputs = [InteractiveInput(prompt_pattern=".*", input="test")]
@@ -80,6 +118,44 @@ class TestLocalShellNonInteractive(TestCase):
     def setUpClass(cls):
         cls.shell = LocalShell()
 
+    def test_exec_lines(self):
+        script = "import sys; print('a'); print('b'); print('error', file=sys.stderr)"
+
+        lines = self.shell.exec_lines(f'python3 -c "{script}"')
+
+        self.assertEqual(["a", "b"], list(lines))
+
+    def test_exec_lines_is_reported(self):
+        script = "import sys; print('a'); print('b'); print('error', file=sys.stderr)"
+
+        with patch("neofs_testlib.shell.local_shell.reporter") as reporter:
+            self.assertEqual(["a", "b"], list(self.shell.exec_lines(f'python3 -c "{script}"')))
+
+        reporter.step.assert_called_once_with(f'COMMAND: python3 -c "{script}"')
+        attachment, file_name = reporter.attach.call_args.args
+        self.assertEqual("Command execution.txt", file_name)
+        self.assertIn("RETCODE: 0", attachment)
+        self.assertIn("2 lines streamed", attachment)
+        self.assertIn("STDERR:\nerror", attachment)
+        self.assertIn("stdout: 4 B", attachment)
+
+    def test_exec_lines_stopped_early(self):
+        script = "import itertools; [print(i, flush=True) for i in itertools.count()]"
+
+        lines = self.shell.exec_lines(f'python3 -c "{script}"')
+
+        self.assertEqual(["0", "1", "2"], [next(lines) for _ in range(3)])
+        lines.close()
+
+    def test_exec_lines_failed_command(self):
+        script = "import sys; print('a'); sys.exit('failure')"
+
+        lines = self.shell.exec_lines(f'python3 -c "{script}"')
+
+        self.assertEqual("a", next(lines))
+        with self.assertRaisesRegex(RuntimeError, "failure"):
+            next(lines)
+
     def test_successful_command(self):
         script = "print('test')"
 
@@ -0,0 +1,82 @@
+import gzip
+import os
+import sys
+import tempfile
+from unittest import TestCase
+
+from neofs_testlib.env.log_rotation import (
+    LogRotationConfig,
+    _rotator,
+    get_log_segments,
+    launch_process,
+)
+
+# Lines are written in batches with pauses, so that the file is rotated after each batch
+SCRIPT = (
+    "import time\n"
+    "for batch in range(4):\n"
+    "    print(''.join(f'line {i}\\n' for i in range(batch * 100, (batch + 1) * 100)),\n"
+    "          end='', flush=True)\n"
+    "    time.sleep(0.3)\n"
+)
+EXPECTED = "".join(f"line {i}\n" for i in range(400)).encode()
+
+
+class TestLogRotation(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.stdout_path = os.path.join(self.directory.name, "stdout")
+        self.stderr_path = os.path.join(self.directory.name, "stderr")
+
+    def _run(self, config: LogRotationConfig) -> None:
+        process = launch_process(
+            [sys.executable, "-c", SCRIPT], self.stdout_path, self.stderr_path, config
+        )
+        self.assertEqual(self.stdout_path, os.readlink(f"/proc/{process.pid}/fd/1"))
+        process.wait()
+        # Stop rotation, so that files don't change while they are checked
+        for path in (self.stdout_path, self.stderr_path):
+            _rotator.remove(path)
+
+    def test_rotation_is_opt_in(self):
+        self.assertIsNone(LogRotationConfig.from_dict(None))
+        self.assertIsNone(LogRotationConfig.from_dict({"enabled": False, "max_size": 1}))
+        self.assertEqual(1, LogRotationConfig.from_dict({"enabled": True, "max_size": 1}).max_size)
+
+    def test_output_is_not_rotated_without_config(self):
+        self._run(None)
+
+        self.assertEqual([], get_log_segments(self.stdout_path))
+        with open(self.stdout_path, "rb") as stdout_file:
+            self.assertEqual(EXPECTED, stdout_file.read())
+
+    def test_segments_are_compressed(self):
+        self._run(LogRotationConfig(max_size=512, compression="gzip", check_interval=0.05))
+
+        segments = get_log_segments(self.stdout_path)
+        self.assertGreater(len(segments), 1)
+        content = b""
+        for segment in segments:
+            self.assertTrue(segment.endswith(".gz"))
+            with gzip.open(segment, "rb") as segment_file:
+                content += segment_file.read()
+        with open(self.stdout_path, "rb") as stdout_file:
+            content += stdout_file.read()
+
+        self.assertEqual(EXPECTED, content)
+        self.assertEqual([], get_log_segments(self.stderr_path))
+
+    def test_old_segments_are_removed(self):
+        self._run(
+            LogRotationConfig(max_size=512, compression="none", max_segments=2, check_interval=0.05)
+        )
+
+        segments = get_log_segments(self.stdout_path)
+        self.assertEqual(2, len(segments))
+        self.assertEqual(
+            sorted(segments + [self.stdout_path, self.stderr_path]),
+            sorted(
+                os.path.join(self.directory.name, name) for name in os.listdir(self.directory.name)
+            ),
+        )
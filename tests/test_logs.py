@@ -0,0 +1,131 @@
+import gzip
+import json
+import mmap
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from neofs_testlib.env import log_rotation
+from neofs_testlib.env.logs import LogIndex, LogSearchMixin, parse_log_line
+
+START_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def make_json_line(second: int, level: str, message: str) -> str:
+    record = {"level": level, "ts": START_TIMESTAMP + second, "msg": message, "n": second}
+    return json.dumps(record) + "\n"
+
+
+class TestLogIndex(TestCase):
+    def setUp(self):
+        self.log_file = tempfile.NamedTemporaryFile("w", delete=False)
+        self.addCleanup(os.remove, self.log_file.name)
+
+    def _write(self, *lines: str) -> None:
+        self.log_file.writelines(lines)
+        self.log_file.flush()
+
+    def test_parse_console_line(self):
+        timestamp, level, message = parse_log_line(
+            b'2024-01-01T00:00:01.500Z\tINFO\tnode/main.go:10\tobject put\t{"cid": "abc"}'
+        )
+
+        self.assertEqual(START_TIMESTAMP + 1.5, timestamp)
+        self.assertEqual("info", level)
+        self.assertEqual("object put", message)
+
+    def test_search(self):
+        self._write(
+            *(make_json_line(second, "debug", "tick") for second in range(1000)),
+            make_json_line(1000, "error", "object put failed"),
+            *(make_json_line(second, "debug", "tick") for second in range(1001, 2000)),
+        )
+        index = LogIndex(self.log_file.name, block_size=4096)
+
+        def since(second: int) -> datetime:
+            return datetime.fromtimestamp(START_TIMESTAMP + second, tz=timezone.utc)
+
+        self.assertEqual(1, len(index.search("failed")))
+        self.assertEqual(1, len(index.search("tick", level="debug", limit=1)))
+        self.assertEqual(
+            ["object put failed"], [record.message for record in index.search(".", level="error")]
+        )
+        self.assertEqual(1, len(index.search("put", message="object put failed")))
+        records = index.search('"n": 15\\d\\d', since=since(1550), until=since(1559))
+        self.assertEqual(list(range(1550, 1560)), [json.loads(r.line)["n"] for r in records])
+
+        # Incomplete line is not indexed until it is finished
+        self._write(make_json_line(2000, "warn", "late")[:-10])
+        self.assertEqual([], index.search("late"))
+        self._write(make_json_line(2000, "warn", "late")[-10:])
+        self.assertEqual("warn", index.search("late")[0].level)
+
+    def test_search_after_truncation(self):
+        self._write(*(make_json_line(second, "info", "old") for second in range(100)))
+        index = LogIndex(self.log_file.name, block_size=1024)
+        self.assertEqual(100, len(index.search("old")))
+
+        # File is truncated by rotation and grows back beyond the indexed size
+        os.truncate(self.log_file.name, 0)
+        self.log_file.seek(0)
+        self._write(*(make_json_line(second, "info", "new") for second in range(200, 400)))
+
+        self.assertEqual([], index.search(".", message="old"))
+        self.assertEqual(200, len(index.search(".", message="new")))
+
+    def test_file_is_not_rotated_during_search(self):
+        self._write(*(make_json_line(second, "info", "tick") for second in range(100)))
+        log_index = LogIndex(self.log_file.name)
+        file_lock = log_rotation.get_file_lock(self.log_file.name)
+        mapped_under_lock = []
+
+        def map_file(*args, **kwargs):
+            mapped_under_lock.append(file_lock.locked())
+            return real_mmap(*args, **kwargs)
+
+        real_mmap = mmap.mmap
+        with patch("neofs_testlib.env.logs.mmap.mmap", side_effect=map_file):
+            self.assertEqual(100, len(log_index.search("tick")))
+        self.assertEqual([True], mapped_under_lock)
+
+        # Rotation waits for the reader that holds the lock
+        rotated_file = log_rotation._RotatedFile(
+            self.log_file.name, log_rotation.LogRotationConfig(compression="none")
+        )
+        size = os.path.getsize(self.log_file.name)
+        with file_lock:
+            rotation = threading.Thread(target=rotated_file.rotate)
+            rotation.start()
+            rotation.join(0.2)
+            self.assertTrue(rotation.is_alive())
+            self.assertEqual(size, os.path.getsize(self.log_file.name))
+        rotation.join()
+        self.assertEqual(0, os.path.getsize(self.log_file.name))
+        self.addCleanup(os.remove, f"{self.log_file.name}.1")
+
+
+class TestSearchLogs(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.node = LogSearchMixin()
+        self.node.stdout = os.path.join(self.directory.name, "stdout")
+        self.node.stderr = os.path.join(self.directory.name, "stderr")
+
+    def test_rotated_segments_are_searched(self):
+        with gzip.open(f"{self.node.stdout}.1.gz", "wt") as segment:
+            segment.writelines(make_json_line(second, "info", "put") for second in range(10))
+        with open(f"{self.node.stdout}.2", "w") as segment:
+            segment.writelines(make_json_line(second, "error", "put") for second in range(10, 20))
+        with open(self.node.stdout, "w") as log_file:
+            log_file.writelines(make_json_line(second, "info", "put") for second in range(20, 30))
+
+        records = self.node.search_logs('"n": \\d+', message="put")
+        self.assertEqual(list(range(30)), [json.loads(record.line)["n"] for record in records])
+        self.assertEqual(10, len(self.node.search_logs(".", level="error")))
+        since = datetime.fromtimestamp(START_TIMESTAMP + 5, tz=timezone.utc)
+        records = self.node.search_logs(".", since=since, limit=12)
+        self.assertEqual(list(range(5, 17)), [json.loads(record.line)["n"] for record in records])
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from neofs_testlib.env.metrics import diff_metrics, parse_metrics
+
+METRICS_BEFORE = """
+# HELP neofs_node_object_put_req_count Number of PUT requests.
+# TYPE neofs_node_object_put_req_count counter
+neofs_node_object_put_req_count{success="true"} 10
+neofs_node_object_put_req_count{success="false"} 1
+# TYPE neofs_node_object_put_req_duration_seconds histogram
+neofs_node_object_put_req_duration_seconds_bucket{le="0.1"} 5
+neofs_node_object_put_req_duration_seconds_bucket{le="+Inf"} 10
+neofs_node_object_put_req_duration_seconds_sum 2.5
+neofs_node_object_put_req_duration_seconds_count 10
+# TYPE neofs_node_engine_capacity gauge
+neofs_node_engine_capacity 100
+"""
+
+METRICS_AFTER = """
+# TYPE neofs_node_object_put_req_count counter
+neofs_node_object_put_req_count{success="true"} 14
+neofs_node_object_put_req_count{success="false"} 1
+# TYPE neofs_node_object_put_req_duration_seconds histogram
+neofs_node_object_put_req_duration_seconds_bucket{le="0.1"} 7
+neofs_node_object_put_req_duration_seconds_bucket{le="+Inf"} 14
+neofs_node_object_put_req_duration_seconds_sum 4.5
+neofs_node_object_put_req_duration_seconds_count 14
+# TYPE neofs_node_engine_capacity gauge
+neofs_node_engine_capacity 80
+"""
+
+
+class TestMetrics(TestCase):
+    def test_parse_metrics(self):
+        snapshot = parse_metrics(METRICS_BEFORE)
+
+        self.assertEqual(
+            10, snapshot.samples[("neofs_node_object_put_req_count", (("success", "true"),))]
+        )
+        self.assertEqual(
+            10,
+            snapshot.samples[
+                ("neofs_node_object_put_req_duration_seconds_bucket", (("le", "+Inf"),))
+            ],
+        )
+        self.assertEqual(
+            "histogram", snapshot.type_of("neofs_node_object_put_req_duration_seconds_sum")
+        )
+        self.assertEqual("gauge", snapshot.type_of("neofs_node_engine_capacity"))
+
+    def test_diff_metrics(self):
+        delta = diff_metrics(
+            {"sn1": parse_metrics(METRICS_BEFORE)}, {"sn1": parse_metrics(METRICS_AFTER)}
+        )
+
+        self.assertEqual(4, delta.get("neofs_node_object_put_req_count"))
+        self.assertEqual(4, delta.get("neofs_node_object_put_req_count", success="true"))
+        self.assertEqual(0, delta.get("neofs_node_object_put_req_count", success="false"))
+        self.assertEqual(0, delta.get("neofs_node_object_put_req_count", node="sn2"))
+        self.assertEqual(0.5, delta.histogram_mean("neofs_node_object_put_req_duration_seconds"))
+        # gauges are not included into deltas
+        self.assertEqual(0, delta.get("neofs_node_engine_capacity"))
@@ -0,0 +1,230 @@
+import base64
+import hashlib
+import json
+from unittest import TestCase
+from unittest.mock import Mock
+
+import base58
+
+from neofs_testlib.utils.netmap import Netmap, NetmapNode, PlacementPolicy, xxh64
+
+COUNTRIES = ["Germany", "Germany", "France", "Russia", "Russia", "Russia"]
+
+
+def make_id(seed: str) -> str:
+    return base58.b58encode(hashlib.sha256(seed.encode()).digest()).decode()
+
+
+def make_netmap_json(epoch: int = 10) -> dict:
+    return {
+        "epoch": str(epoch),
+        "nodes": [
+            {
+                "publicKey": base64.standard_b64encode(
+                    b"\x02" + hashlib.sha256(f"node{index}".encode()).digest()
+                ).decode(),
+                "addresses": [f"/dns4/localhost/tcp/{8080 + index}"],
+                "attributes": [
+                    {"key": "Country", "value": country},
+                    {"key": "Rack", "value": str(index)},
+                ],
+                "state": "ONLINE",
+            }
+            for index, country in enumerate(COUNTRIES)
+        ],
+    }
+
+
+class TestNetmap(TestCase):
+    def setUp(self):
+        self.netmap = Netmap.from_json(json.dumps(make_netmap_json()))
+
+    def test_xxh64(self):
+        self.assertEqual(0xEF46DB3751D8E999, xxh64(b""))
+        self.assertEqual(0x44BC2CF5AD770999, xxh64(b"abc"))
+        self.assertEqual(0xFBCEA83C8A378BF1, xxh64(b"Nobody inspects the spammish repetition"))
+
+    def test_from_json(self):
+        self.assertEqual(10, self.netmap.epoch)
+        self.assertEqual(len(COUNTRIES), len(self.netmap.nodes))
+        node = self.netmap.nodes[0]
+        self.assertEqual(66, len(node.public_key))
+        self.assertEqual({"Country": "Germany", "Rack": "0"}, node.attributes)
+        self.assertIs(node, self.netmap.get_node(node.public_key))
+
+    def test_from_cli(self):
+        neofs_cli = Mock()
+        neofs_cli.netmap.snapshot.return_value.stdout = json.dumps(make_netmap_json(epoch=7))
+
+        netmap = Netmap.from_cli(neofs_cli, "localhost:8080", "wallet.json")
+
+        self.assertEqual(7, netmap.epoch)
+        neofs_cli.netmap.snapshot.assert_called_once_with(
+            rpc_endpoint="localhost:8080", wallet="wallet.json", json=True
+        )
+
+    def test_diff(self):
+        new_json = make_netmap_json(epoch=11)
+        removed = new_json["nodes"].pop(0)
+        new_json["nodes"][0]["state"] = "MAINTENANCE"
+        new_json["nodes"].append(dict(removed, publicKey=base64.b64encode(b"\x03" * 33).decode()))
+
+        diff = self.netmap.diff(Netmap.from_json(new_json))
+
+        self.assertEqual((10, 11), (diff.old_epoch, diff.new_epoch))
+        self.assertEqual([self.netmap.nodes[0]], diff.removed)
+        self.assertEqual(["03" * 33], [node.public_key for node in diff.added])
+        self.assertEqual(1, len(diff.changed))
+        self.assertEqual(("ONLINE", "MAINTENANCE"), tuple(node.state for node in diff.changed[0]))
+        self.assertTrue(self.netmap.diff(self.netmap).empty)
+
+    def test_parse_policy(self):
+        policy = PlacementPolicy.parse(
+            "REP 1 IN X REP 2 IN Y CBF 2 "
+            "SELECT 1 IN SAME Country FROM RU AS X SELECT 2 IN DISTINCT Country FROM EU AS Y "
+            "FILTER Country EQ Russia AS RU "
+            "FILTER (Country EQ Germany OR Country EQ France) AND @Cheap AS EU "
+            "FILTER Rack LE 4 AS Cheap"
+        )
+
+        self.assertEqual([(1, "X"), (2, "Y")], [(r.count, r.selector) for r in policy.replicas])
+        self.assertEqual(2, policy.backup_factor)
+        self.assertEqual(["SAME", "DISTINCT"], [s.clause for s in policy.selectors])
+        self.assertEqual(["RU", "EU"], [s.filter for s in policy.selectors])
+        self.assertEqual("AND", policy.filters["EU"].operation)
+        self.assertEqual("OR", policy.filters["EU"].filters[0].operation)
+        self.assertEqual("Cheap", policy.filters["EU"].filters[1].key)
+
+    def test_parse_invalid_policy(self):
+        for policy in ["SELECT 1 FROM *", "REP two", "REP 1 FILTER A XX B AS F", "REP 1 FOO"]:
+            with self.subTest(policy=policy):
+                with self.assertRaises(ValueError):
+                    PlacementPolicy.parse(policy)
+
+    def test_container_nodes_without_selectors(self):
+        cid = make_id("container")
+
+        nodes = PlacementPolicy.parse("REP 1").get_container_nodes(self.netmap, cid)
+        nodes_cbf1 = PlacementPolicy.parse("REP 2 CBF 1").get_container_nodes(self.netmap, cid)
+
+        self.assertEqual([3], [len(vector) for vector in nodes])
+        self.assertEqual([2], [len(vector) for vector in nodes_cbf1])
+        self.assertEqual(nodes_cbf1[0], nodes[0][:2])
+
+    def test_container_nodes_with_filters(self):
+        policy = PlacementPolicy.parse(
+            "REP 1 IN X REP 1 IN Y CBF 1 "
+            "SELECT 2 IN SAME Country FROM RU AS X SELECT 2 IN Country FROM EU AS Y "
+            "FILTER Country EQ Russia AS RU FILTER Country NE Russia AND Rack LT 5 AS EU"
+        )
+
+        russian, european = policy.get_container_nodes(self.netmap, make_id("container"))
+
+        self.assertEqual(["Russia"] * 2, [node.attributes["Country"] for node in russian])
+        self.assertEqual({"Germany", "France"}, {node.attributes["Country"] for node in european})
+
+    def test_full_buckets_are_preferred(self):
+        # With CBF 3 only Russia (3 nodes) is a full bucket, and with CBF 2 - Russia and Germany
+        # (2 nodes), so they are selected regardless of HRW order of buckets
+        single = PlacementPolicy.parse("REP 1 IN X SELECT 1 IN Country FROM * AS X")
+        double = PlacementPolicy.parse("REP 1 IN X CBF 2 SELECT 2 IN Country FROM * AS X")
+        for cid in [make_id(f"container{index}") for index in range(10)]:
+            [single_nodes] = single.get_container_nodes(self.netmap, cid)
+            [double_nodes] = double.get_container_nodes(self.netmap, cid)
+
+            self.assertCountEqual(self.netmap.nodes[3:], single_nodes)
+            self.assertEqual(
+                ["Germany"] * 2 + ["Russia"] * 2,
+                sorted(node.attributes["Country"] for node in double_nodes),
+            )
+
+    def test_small_buckets_are_used_as_fallback(self):
+        policy = PlacementPolicy.parse("REP 1 IN X SELECT 3 IN Country FROM * AS X")
+
+        [nodes] = policy.get_container_nodes(self.netmap, make_id("container"))
+
+        self.assertCountEqual(self.netmap.nodes, nodes)
+
+    def test_unique_placement(self):
+        policy = PlacementPolicy.parse("UNIQUE REP 1 REP 1")
+        not_unique_policy = PlacementPolicy.parse("REP 1 REP 1")
+        cid = make_id("container")
+
+        first, second = policy.get_container_nodes(self.netmap, cid)
+        not_unique = not_unique_policy.get_container_nodes(self.netmap, cid)
+
+        self.assertTrue(policy.unique)
+        self.assertEqual(not_unique[0], first)
+        self.assertEqual(not_unique[0], not_unique[1])
+        self.assertCountEqual(self.netmap.nodes, first + second)
+        with self.assertRaises(ValueError):
+            PlacementPolicy.parse("UNIQUE REP 1 REP 1 REP 1").get_container_nodes(self.netmap, cid)
+
+    def test_unique_placement_with_selectors(self):
+        policy = PlacementPolicy.parse(
+            "UNIQUE REP 1 IN X REP 1 IN X CBF 1 SELECT 2 IN SAME Country FROM * AS X"
+        )
+
+        first, second = policy.get_container_nodes(self.netmap, make_id("container"))
+
+        self.assertEqual(2, len(first))
+        self.assertEqual(2, len(second))
+        self.assertFalse({node.public_key for node in first} & {node.public_key for node in second})
+
+    def test_weighted_nodes_are_rejected(self):
+        policy = PlacementPolicy.parse("REP 1")
+        for attribute in ["Price", "Capacity"]:
+            with self.subTest(attribute=attribute):
+                netmap_json = make_netmap_json()
+                netmap_json["nodes"][1]["attributes"].append({"key": attribute, "value": "10"})
+                with self.assertRaises(ValueError):
+                    policy.get_container_nodes(Netmap.from_json(netmap_json), make_id("container"))
+
+        netmap_json = make_netmap_json()
+        netmap_json["nodes"][1]["attributes"].append({"key": "Price", "value": "0"})
+        [nodes] = policy.get_container_nodes(self.netmap, make_id("container"))
+        [zero_price_nodes] = policy.get_container_nodes(
+            Netmap.from_json(netmap_json), make_id("container")
+        )
+        self.assertEqual(
+            [node.public_key for node in nodes], [node.public_key for node in zero_price_nodes]
+        )
+
+    def test_not_enough_nodes(self):
+        policy = PlacementPolicy.parse(
+            "REP 1 IN X SELECT 3 IN Country FROM * AS X SELECT 1 FROM F AS Y "
+            "FILTER Country EQ Japan AS F"
+        )
+        with self.assertRaises(ValueError):
+            policy.get_container_nodes(self.netmap, make_id("container"))
+
+    def test_object_nodes(self):
+        policy = PlacementPolicy.parse("REP 2")
+        cid = make_id("container")
+        container_nodes = policy.get_container_nodes(self.netmap, cid)[0]
+
+        placements = set()
+        for index in range(20):
+            oid = make_id(f"object{index}")
+            vector = policy.get_object_nodes(self.netmap, cid, oid)[0]
+            replica_nodes = policy.get_replica_nodes(self.netmap, cid, oid)
+
+            self.assertCountEqual(container_nodes, vector)
+            self.assertEqual(vector[:2], replica_nodes)
+            self.assertEqual(replica_nodes, policy.get_replica_nodes(self.netmap, cid, oid))
+            placements.add(tuple(node.public_key for node in replica_nodes))
+        self.assertGreater(len(placements), 1)
+
+    def test_placement_does_not_depend_on_node_order(self):
+        policy = PlacementPolicy.parse("REP 2 IN X SELECT 2 IN Country FROM * AS X")
+        cid, oid = make_id("container"), make_id("object")
+        reversed_netmap = Netmap(self.netmap.epoch, list(reversed(self.netmap.nodes)))
+
+        self.assertEqual(
+            policy.get_replica_nodes(self.netmap, cid, oid),
+            policy.get_replica_nodes(reversed_netmap, cid, oid),
+        )
+
+    def test_node_hash(self):
+        node = NetmapNode(public_key="02" + "00" * 32)
+        self.assertEqual(xxh64(b"\x02" + b"\x00" * 32), node.hash)
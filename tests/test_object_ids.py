@@ -0,0 +1,48 @@
+import random
+from unittest import TestCase
+
+from neofs_testlib.utils.object_ids import (
+    chunked,
+    compare_object_ids,
+    get_object_ids_digest,
+    parse_object_ids,
+)
+
+
+def make_object_id(number: int) -> str:
+    return f"{number:0>44}".replace("0", "z")
+
+
+class TestObjectIds(TestCase):
+    def test_parse_object_ids(self):
+        object_id = "9ahXdzn3ykEuCYvDMjzKKQDhCJSeW5Xd1b1Xye8U6bWX"
+        lines = ["Found 2 objects.", object_id, f"  {object_id}  ", "not an object id"]
+
+        self.assertEqual([object_id, object_id], list(parse_object_ids(lines)))
+
+    def test_chunked(self):
+        self.assertEqual([[0, 1, 2], [3, 4]], list(chunked(range(5), 3)))
+
+    def test_digest(self):
+        object_ids = [make_object_id(number) for number in range(100)]
+        shuffled = random.sample(object_ids, len(object_ids))
+
+        self.assertEqual(get_object_ids_digest(object_ids), get_object_ids_digest(shuffled))
+        self.assertNotEqual(
+            get_object_ids_digest(object_ids), get_object_ids_digest(object_ids[:-1])
+        )
+
+    def test_compare(self):
+        left = [make_object_id(number) for number in range(1000)]
+        right = [make_object_id(number) for number in range(10, 1005)] + left[500:510]
+        random.shuffle(left)
+        random.shuffle(right)
+
+        diff = compare_object_ids(iter(left), iter(right), limit=5, run_size=64)
+
+        self.assertFalse(diff.equal)
+        self.assertEqual(10, diff.only_left_count)
+        self.assertEqual(sorted(make_object_id(number) for number in range(10))[:5], diff.only_left)
+        self.assertEqual(5, diff.only_right_count)
+        self.assertEqual(990, diff.common_count)
+        self.assertTrue(compare_object_ids(left, reversed(left), run_size=64).equal)
@@ -0,0 +1,110 @@
+import os
+import stat
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from neofs_testlib.env.object_transfer import ObjectTransfer, TransferStats, UploadItem
+from neofs_testlib.shell import CommandResult
+from neofs_testlib.utils.payload import PayloadGenerator
+
+
+class TestObjectTransfer(TestCase):
+    def setUp(self):
+        self.neofs_cli = Mock()
+        self.transfer = ObjectTransfer(
+            self.neofs_cli, ["sn1:8080", "sn2:8080"], "wallet.json", max_workers=4, retry_delay=0
+        )
+
+    def test_upload(self):
+        failed_once = set()
+
+        def put(rpc_endpoint: str, file: str, **kwargs) -> CommandResult:
+            with open(file, "rb") as payload_file:
+                payload = payload_file.read().decode()
+            if payload == "flaky" and payload not in failed_once:
+                failed_once.add(payload)
+                raise RuntimeError("Error: rpc error: code = Unavailable")
+            if payload == "broken":
+                raise RuntimeError("Error: access denied")
+            output = f"[{file}] Object successfully stored\n  ID: Oid{payload}\n  CID: cid\n"
+            return CommandResult(stdout=output, stderr="", return_code=0)
+
+        self.neofs_cli.object.put.side_effect = put
+        items = (UploadItem(cid="cid", payload=payload) for payload in (b"a", b"flaky", b"broken"))
+
+        result = self.transfer.upload(items, raise_on_error=False)
+
+        self.assertEqual(["Oida", "Oidflaky", None], result.values)
+        self.assertIsNone(result.errors[0])
+        self.assertIn("access denied", str(result.errors[2]))
+        self.assertEqual(2, result.stats.objects)
+        self.assertEqual(1, result.stats.failed)
+        self.assertEqual(6, result.stats.total_bytes)
+        endpoints = [call.kwargs["rpc_endpoint"] for call in self.neofs_cli.object.put.mock_calls]
+        # Retry of the second item goes to the next endpoint
+        self.assertCountEqual(["sn1:8080", "sn2:8080", "sn1:8080", "sn1:8080"], endpoints)
+
+        with self.assertRaises(RuntimeError):
+            self.transfer.upload([UploadItem(cid="cid", payload=b"broken")])
+
+    def test_upload_output_formats(self):
+        for output in ("  ID: oid1\n  CID: cid\n", "  OID: oid1\n  CID: cid\n"):
+            with self.subTest(output=output):
+                self.neofs_cli.object.put.return_value = CommandResult(
+                    stdout=f"[payload] Object successfully stored\n{output}",
+                    stderr="",
+                    return_code=0,
+                )
+
+                result = self.transfer.upload([UploadItem(cid="cid", payload=b"a")])
+
+                self.assertEqual(["oid1"], result.values)
+
+    def test_upload_streams_generated_payload(self):
+        generator = PayloadGenerator(300 * 1024, seed="stream")
+        payloads = []
+
+        def put(rpc_endpoint: str, file: str, **kwargs) -> CommandResult:
+            self.assertTrue(stat.S_ISFIFO(os.stat(file).st_mode))
+            with open(file, "rb") as payload_file:
+                if not payloads:
+                    # The first attempt reads only part of the pipe and fails
+                    payloads.append(payload_file.read(1024))
+                    raise RuntimeError("Error: rpc error: code = Unavailable")
+                payloads.append(payload_file.read())
+            return CommandResult(stdout="  OID: oid1\n", stderr="", return_code=0)
+
+        self.neofs_cli.object.put.side_effect = put
+
+        result = self.transfer.upload([UploadItem(cid="cid", payload=generator)])
+
+        self.assertEqual(["oid1"], result.values)
+        self.assertEqual(generator.size, result.stats.total_bytes)
+        self.assertEqual(generator.read(), payloads[-1])
+
+    def test_download(self):
+        def get(file: str, oid: str, **kwargs) -> CommandResult:
+            with open(file, "w") as payload_file:
+                payload_file.write(oid)
+            return CommandResult(stdout="", stderr="", return_code=0)
+
+        self.neofs_cli.object.get.side_effect = get
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.transfer.download([("cid", "oid1"), ("cid", "oid2")], directory)
+
+            self.assertEqual(
+                [os.path.join(directory, "cid_oid1"), os.path.join(directory, "cid_oid2")],
+                result.values,
+            )
+            self.assertTrue(all(os.path.isfile(path) for path in result.values))
+        self.assertEqual(8, result.stats.total_bytes)
+
+    def test_percentile(self):
+        stats = TransferStats(objects=10, elapsed=2, latencies=[i / 10 for i in range(10, 0, -1)])
+
+        self.assertEqual(5, stats.objects_per_second)
+        self.assertEqual(0.5, stats.percentile(50))
+        self.assertEqual(0.9, stats.percentile(90))
+        self.assertEqual(1.0, stats.percentile(100))
@@ -0,0 +1,45 @@
+import hashlib
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from neofs_testlib.utils.payload import BLOCK_SIZE, PayloadGenerator
+
+
+class TestPayloadGenerator(TestCase):
+    SIZE = 3 * BLOCK_SIZE + 123
+
+    def test_reproducible_ranges(self):
+        generator = PayloadGenerator(self.SIZE, seed=42)
+        payload = generator.read()
+
+        self.assertEqual(self.SIZE, len(payload))
+        self.assertEqual(payload, PayloadGenerator(self.SIZE, seed=42).read())
+        self.assertNotEqual(payload, PayloadGenerator(self.SIZE, seed=43).read())
+        self.assertEqual(payload, b"".join(generator.iter_chunks(chunk_size=1000)))
+        for offset, length in ((0, 1), (BLOCK_SIZE - 10, 20), (2 * BLOCK_SIZE + 5, 10**6)):
+            self.assertEqual(payload[offset : offset + length], generator.read(offset, length))
+        self.assertEqual(hashlib.sha256(payload).hexdigest(), generator.sha256())
+
+    def test_write_to_file(self):
+        generator = PayloadGenerator(self.SIZE, seed="file")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = generator.write_to_file(os.path.join(directory, "payload"))
+            with open(path, "rb") as file:
+                self.assertEqual(generator.read(), file.read())
+
+    def test_fifo(self):
+        generator = PayloadGenerator(self.SIZE, seed="fifo")
+
+        with generator.fifo() as path:
+            with open(path, "rb") as fifo:
+                self.assertEqual(generator.read(), fifo.read())
+        self.assertFalse(os.path.exists(path))
+
+        # Pipe that is never opened by a reader does not leave the writer hanging
+        threads = threading.active_count()
+        with generator.fifo():
+            pass
+        self.assertEqual(threads, threading.active_count())
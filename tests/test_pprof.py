@@ -0,0 +1,76 @@
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from neofs_testlib.env.env import REST_GW
+from neofs_testlib.env.pprof import ProfilingMixin, profile
+
+
+class StubPprofHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        kind = url.path.rsplit("/", 1)[-1]
+        if kind not in ("profile", "heap"):
+            self.send_error(404)
+            return
+        # Like pprof, CPU profile is returned when the requested duration elapses
+        time.sleep(float(parse_qs(url.query).get("seconds", [0])[0]))
+        body = f"{kind} data".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPprof(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("localhost", 0), StubPprofHandler)
+        cls.address = f"localhost:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_profiles_are_collected(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with profile("sn1", self.address, output_dir, goroutine=True, duration=1) as result:
+                pass
+
+            self.assertEqual({"cpu", "heap"}, set(result.paths))
+            self.assertIn("goroutine", result.errors)
+            with open(result.paths["cpu"], "rb") as profile_file:
+                self.assertEqual(b"profile data", profile_file.read())
+
+    def test_exit_does_not_wait_for_full_duration(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            start_time = time.monotonic()
+            with profile("sn1", self.address, output_dir, duration=30, cpu_segment=1) as result:
+                time.sleep(1.5)
+
+            self.assertLess(time.monotonic() - start_time, 5)
+            self.assertEqual({"cpu", "cpu_1", "heap"}, set(result.paths))
+
+    def test_profiling_must_be_enabled(self):
+        node = ProfilingMixin()
+        node.neofs_env = SimpleNamespace(pprof_enabled=False)
+        node.pprof_name = "sn_1"
+        node.pprof_address = self.address
+
+        with self.assertRaises(RuntimeError):
+            node.profile()
+
+    def test_rest_gateway_profiling_is_always_enabled(self):
+        node = REST_GW.__new__(REST_GW)
+        node.neofs_env = SimpleNamespace(pprof_enabled=False)
+
+        self.assertTrue(node.pprof_enabled)
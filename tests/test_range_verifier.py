@@ -0,0 +1,99 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from neofs_testlib.cli import NeofsCli
+from neofs_testlib.env.range_verifier import RangeVerifier, split_ranges
+from neofs_testlib.shell import CommandResult
+from neofs_testlib.utils.payload import PayloadGenerator
+
+
+class TestRangeVerifier(TestCase):
+    def setUp(self):
+        self.payload = PayloadGenerator(100_000, seed="range")
+        self.stored_payload = self.payload.read()
+        self.neofs_cli = Mock()
+        self.neofs_cli.object.hash.side_effect = self._hash
+        self.neofs_cli.object.range.side_effect = self._range
+        self.verifier = RangeVerifier(self.neofs_cli, ["sn1:8080", "sn2:8080"], "wallet.json")
+
+    def _get_range(self, range: str) -> bytes:
+        offset, length = map(int, range.split(":"))
+        return self.stored_payload[offset : offset + length]
+
+    def _hash(self, range: str, **kwargs) -> CommandResult:
+        offset, length = range.split(":")
+        range_hash = hashlib.sha256(self._get_range(range)).hexdigest()
+        output = f"Offset={offset} (Length={length})\t: {range_hash}\n"
+        return CommandResult(stdout=output, stderr="", return_code=0)
+
+    def _range(self, range: str, file: str, **kwargs) -> CommandResult:
+        with open(file, "wb") as range_file:
+            range_file.write(self._get_range(range))
+        return CommandResult(stdout="", stderr="", return_code=0)
+
+    def test_split_ranges(self):
+        self.assertEqual([(0, 4), (4, 3), (7, 3)], split_ranges(10, 3))
+        self.assertEqual([(0, 1), (1, 1)], split_ranges(2, 8))
+
+    def test_verify_hashes(self):
+        result = self.verifier.verify("cid", "oid", self.payload, parts=4)
+
+        self.assertTrue(result.ok)
+        self.assertEqual(4, result.stats.objects)
+        self.assertEqual(self.payload.size, result.stats.total_bytes)
+        endpoints = [check.endpoint for check in result.checks]
+        self.assertEqual(["sn1:8080", "sn2:8080", "sn1:8080", "sn2:8080"], endpoints)
+
+    def test_expected_hashes_are_calculated_by_workers(self):
+        hashing_threads = set()
+        iter_chunks = PayloadGenerator.iter_chunks
+
+        def record_thread(*args, **kwargs):
+            hashing_threads.add(threading.current_thread())
+            return iter_chunks(*args, **kwargs)
+
+        with (
+            patch.object(PayloadGenerator, "iter_chunks", autospec=True, side_effect=record_thread),
+            patch.object(PayloadGenerator, "read", side_effect=AssertionError("range is read")),
+        ):
+            result = self.verifier.verify("cid", "oid", self.payload, parts=4)
+
+        self.assertTrue(result.ok)
+        self.assertTrue(hashing_threads)
+        self.assertNotIn(threading.current_thread(), hashing_threads)
+
+    def test_hash_command(self):
+        shell = Mock()
+        shell.exec.side_effect = lambda command, options=None: self._hash(
+            re.search(r"--range '(\S+)'", command).group(1)
+        )
+        neofs_cli = NeofsCli(config_file="config.yml", neofs_cli_exec_path="neofs-cli", shell=shell)
+        verifier = RangeVerifier(neofs_cli, ["sn1:8080"], "wallet.json", timeout="30s")
+
+        self.assertTrue(verifier.verify("cid", "oid", self.payload, parts=1).ok)
+
+        shell.exec.assert_called_once()
+        self.assertEqual(
+            "neofs-cli --config config.yml object hash --rpc-endpoint 'sn1:8080' "
+            "--wallet 'wallet.json' --cid 'cid' --oid 'oid' --range '0:100000' --timeout '30s'",
+            shell.exec.call_args.args[0],
+        )
+
+    def test_verify_data_against_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            payload_path = self.payload.write_to_file(os.path.join(directory, "payload"))
+            # Corrupt the last range of stored object
+            self.stored_payload = self.stored_payload[:-1] + b"\0"
+
+            result = self.verifier.verify(
+                "cid", "oid", payload_path, parts=3, fetch_data=True, raise_on_error=False
+            )
+
+            self.assertEqual([True, True, False], [check.ok for check in result.checks])
+            with self.assertRaisesRegex(RuntimeError, "66667:33333"):
+                self.verifier.verify("cid", "oid", payload_path, parts=3, fetch_data=True)
@@ -1,10 +1,16 @@
+import tempfile
+import threading
 from contextlib import AbstractContextManager
 from types import TracebackType
 from typing import Optional
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from neofs_testlib.reporter import Reporter
+from allure_commons import hookimpl, plugin_manager
+from allure_commons.model2 import TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+
+from neofs_testlib.reporter import AllureHandler, Reporter, ReporterHandler
 
 
 class TestLocalShellInteractive(TestCase):
@@ -59,6 +65,115 @@ class TestLocalShellInteractive(TestCase):
                 raise ValueError("Test exception")
 
 
+class TestReporterAsync(TestCase):
+    def setUp(self):
+        self.reporter = Reporter()
+        self.events = []
+        self.release = threading.Event()
+
+        self.handler = DeferredHandler(self.events, self.release)
+        self.reporter.register_handler(self.handler)
+        self.reporter.enable_async(queue_size=2)
+        self.addCleanup(self.reporter.disable_async)
+
+    def test_attach_does_not_wait_for_handlers(self):
+        self.reporter.attach("content", "1.txt")
+        self.assertEqual(["bind 1.txt"], self.events)
+
+        self.release.set()
+        self.reporter.flush()
+        self.assertEqual(["bind 1.txt", "write 1.txt"], self.events)
+        self.assertEqual(threading.current_thread(), self.handler.bind_threads[0])
+
+    def test_attachments_stay_in_their_steps(self):
+        self.release.set()
+        with self.reporter.step("outer"):
+            self.reporter.attach("content", "1.txt")
+            with self.reporter.step("inner"):
+                self.reporter.attach("content", "2.txt")
+            self.reporter.attach("content", "3.txt")
+
+        self.assertEqual(
+            [
+                "enter outer",
+                "bind 1.txt",
+                "write 1.txt",
+                "enter inner",
+                "bind 2.txt",
+                "write 2.txt",
+                "exit inner",
+                "bind 3.txt",
+                "write 3.txt",
+                "exit outer",
+            ],
+            self.events,
+        )
+
+    def test_write_errors_are_raised_on_flush(self):
+        self.release.set()
+        self.handler.error = OSError("disk is full")
+
+        self.reporter.attach("content", "1.txt")
+        with self.assertRaisesRegex(RuntimeError, "1.txt: disk is full"):
+            self.reporter.flush()
+        self.reporter.flush()
+
+    def test_handlers_attach_on_caller_thread_by_default(self):
+        attach_threads = []
+
+        class SyncHandler(ReporterHandler):
+            def step(self, name: str) -> AbstractContextManager:
+                return StubContext(suppress_exception=False)
+
+            def attach(self, content, file_name: str) -> None:
+                attach_threads.append(threading.current_thread())
+
+        self.reporter.handlers = [SyncHandler()]
+        self.reporter.attach("content", "1.txt")
+
+        self.assertEqual([threading.current_thread()], attach_threads)
+
+
+class DeferredHandler(ReporterHandler):
+    def __init__(self, events: list[str], release: threading.Event) -> None:
+        self.events = events
+        self.release = release
+        self.bind_threads = []
+        self.error = None
+
+    def step(self, name: str) -> AbstractContextManager:
+        return StepContext(self.events, name)
+
+    def attach(self, content, file_name: str) -> None:
+        raise AssertionError("Attachments should be prepared in async mode")
+
+    def prepare_attachment(self, content, file_name: str):
+        self.events.append(f"bind {file_name}")
+        self.bind_threads.append(threading.current_thread())
+
+        def write() -> None:
+            self.release.wait(5)
+            if self.error:
+                raise self.error
+            self.events.append(f"write {file_name}")
+
+        return write
+
+
+class StepContext(AbstractContextManager):
+    def __init__(self, events: list[str], name: str) -> None:
+        super().__init__()
+        self.events = events
+        self.name = name
+
+    def __enter__(self):
+        self.events.append(f"enter {self.name}")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.events.append(f"exit {self.name}")
+
+
 class StubContext(AbstractContextManager):
     def __init__(self, suppress_exception: bool) -> None:
         super().__init__()
@@ -71,3 +186,71 @@ class StubContext(AbstractContextManager):
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
         return self.suppress_exception
+
+
+class TestAllureHandler(TestCase):
+    @patch("neofs_testlib.reporter.allure_handler.allure.attach")
+    def test_compressed_attachment_is_binary(self, attach: MagicMock):
+        AllureHandler().attach(b"\x1f\x8b", "sn_1_cpu.pb.gz")
+
+        attach.assert_called_once_with(b"\x1f\x8b", "sn_1_cpu", "application/gzip", "pb.gz")
+
+    @patch("neofs_testlib.reporter.allure_handler.allure.attach")
+    def test_file_attachment_is_not_read(self, attach: MagicMock):
+        with tempfile.NamedTemporaryFile(suffix=".gz") as output_file:
+            output_file.write(b"\x1f\x8b")
+            AllureHandler().attach(output_file, "Command output.txt.gz")
+
+        attach.file.assert_called_once_with(
+            output_file.name, "Command output", "application/gzip", "txt.gz"
+        )
+        attach.assert_not_called()
+
+    def test_async_attachments_are_written_on_writer_thread(self):
+        allure_reporter = AllureReporter()
+        allure_reporter.schedule_test("test", TestResult(uuid="test", name="test"))
+        allure_reporter.start_step(None, "step", TestStepResult(name="step"))
+        listener, file_logger = AllureListenerStub(allure_reporter), FileLoggerStub()
+        for plugin in (listener, file_logger):
+            plugin_manager.register(plugin)
+            self.addCleanup(plugin_manager.unregister, plugin)
+
+        reporter = Reporter()
+        reporter.register_handler(AllureHandler())
+        reporter.enable_async()
+        with tempfile.NamedTemporaryFile(suffix=".gz") as output_file:
+            reporter.attach("output", "Command output.txt")
+            reporter.attach(output_file, "Command output.txt.gz")
+            # Step context is not available on the writer thread, so the attachments must be
+            # bound to the step before they are written
+            allure_reporter.stop_step("step")
+            reporter.disable_async()
+
+        attachments = allure_reporter.get_item("test").steps[0].attachments
+        self.assertEqual(["Command output"] * 2, [attachment.name for attachment in attachments])
+        self.assertEqual(["text/plain", "application/gzip"], [a.type for a in attachments])
+        self.assertEqual(
+            [
+                ("reporter-writer", "output", attachments[0].source),
+                ("reporter-writer", output_file.name, attachments[1].source),
+            ],
+            file_logger.written,
+        )
+
+
+class AllureListenerStub:
+    def __init__(self, allure_reporter: AllureReporter) -> None:
+        self.allure_logger = allure_reporter
+
+
+class FileLoggerStub:
+    def __init__(self) -> None:
+        self.written = []
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self.written.append((threading.current_thread().name, body, file_name))
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        self.written.append((threading.current_thread().name, source, file_name))
@@ -0,0 +1,84 @@
+import os
+import time
+from unittest import TestCase
+
+from neofs_testlib.env.resources import (
+    ProcessSample,
+    ResourceSampler,
+    SampleRingBuffer,
+    read_process_sample,
+)
+
+
+def _make_sample(index: int) -> ProcessSample:
+    return ProcessSample(
+        timestamp=float(index),
+        cpu_user=0.5 * index,
+        cpu_system=0.25 * index,
+        rss=1024 * index,
+        vms=2048 * index,
+        threads=index,
+        fds=index,
+        read_bytes=index,
+        write_bytes=index,
+    )
+
+
+class TestSampleRingBuffer(TestCase):
+    def test_samples_are_returned_in_order(self):
+        buffer = SampleRingBuffer(capacity=5)
+        for index in range(3):
+            buffer.append(_make_sample(index))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([_make_sample(index) for index in range(3)], buffer.samples())
+
+    def test_oldest_samples_are_overwritten(self):
+        buffer = SampleRingBuffer(capacity=3)
+        for index in range(7):
+            buffer.append(_make_sample(index))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([_make_sample(index) for index in range(4, 7)], buffer.samples())
+
+
+class TestResourceSampler(TestCase):
+    def test_read_current_process(self):
+        sample = read_process_sample(os.getpid())
+
+        self.assertIsNotNone(sample)
+        self.assertGreater(sample.rss, 0)
+        self.assertGreater(sample.threads, 0)
+        self.assertGreater(sample.fds, 0)
+
+    def test_read_missing_process(self):
+        self.assertIsNone(read_process_sample(2**22 + 1))
+
+    def test_background_sampling(self):
+        with ResourceSampler(lambda: {"self": os.getpid()}, interval=0.05, capacity=10) as sampler:
+            time.sleep(0.3)
+
+        samples = sampler.samples()["self"]
+        self.assertGreater(len(samples), 1)
+        self.assertLessEqual(len(samples), 10)
+
+        csv_lines = sampler.to_csv().splitlines()
+        self.assertTrue(csv_lines[0].startswith("process,timestamp,"))
+        self.assertEqual(len(samples) + 1, len(csv_lines))
+        self.assertIn("self", sampler.summary())
+
+    def test_summary_of_restarted_process(self):
+        sampler = ResourceSampler(lambda: {})
+        samples = [_make_sample(index) for index in (2, 4, 1, 3)]
+        samples[2].pid = samples[3].pid = 1
+        buffer = SampleRingBuffer(capacity=10)
+        for sample in samples:
+            buffer.append(sample)
+        sampler._buffers["node"] = buffer
+
+        summary = sampler.summary()["node"]
+
+        self.assertEqual(1, summary["restarts"])
+        # 2 bytes read by the first run since the first sample and 3 bytes by the second run
+        self.assertEqual(5, summary["read_bytes"])
+        self.assertEqual(3.75, summary["cpu_time"])
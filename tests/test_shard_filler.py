@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import stat
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from neofs_testlib.env.shard_filler import Dataset, ShardFiller
+from neofs_testlib.shell import CommandResult
+
+SHARD_IDS = ["shard1", "shard2"]
+
+
+class TestShardFiller(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.put_count = 0
+        self.payloads = []
+
+        self.user_cli = Mock()
+        self.user_cli.object.put.side_effect = self._put
+        self.control_cli = Mock()
+        self.control_cli.shards.list.return_value = CommandResult(
+            stdout=json.dumps([{"shard_id": shard_id} for shard_id in SHARD_IDS]),
+            stderr="",
+            return_code=0,
+        )
+        self.control_cli.shards.dump.side_effect = self._dump
+
+        neofs_env = Mock()
+        neofs_env.neofs_cli.side_effect = lambda config: (
+            self.control_cli if config == "sn_cli_config.yml" else self.user_cli
+        )
+        storage_node = SimpleNamespace(
+            neofs_env=neofs_env,
+            cli_config="sn_cli_config.yml",
+            endpoint="sn1:8080",
+            control_grpc_endpoint="sn1:8081",
+            wallet=SimpleNamespace(path="sn_wallet.json"),
+        )
+        self.filler = ShardFiller(
+            storage_node, SimpleNamespace(path="user_wallet.json"), cache_dir=self.cache_dir
+        )
+
+    def _put(self, rpc_endpoint: str, file: str, **kwargs) -> CommandResult:
+        self.assertEqual("sn1:8080", rpc_endpoint)
+        # Payloads are streamed through a named pipe instead of being written to disk
+        self.assertTrue(stat.S_ISFIFO(os.stat(file).st_mode))
+        with open(file, "rb") as payload_file:
+            self.payloads.append(payload_file.read())
+        self.put_count += 1
+        return CommandResult(stdout=f"OID: oid{self.put_count}\n", stderr="", return_code=0)
+
+    def _dump(self, path: str, **kwargs) -> CommandResult:
+        with open(path, "wb") as dump_file:
+            dump_file.write(b"dump")
+        return CommandResult(stdout="", stderr="", return_code=0)
+
+    def assert_shards_were_read_only(self):
+        modes = {}
+        for _, kwargs in self.control_cli.shards.set_mode.call_args_list:
+            modes.setdefault(kwargs["shards_id"][0], []).append(kwargs["mode"])
+        self.assertEqual({shard_id: ["read-only", "read-write"] for shard_id in SHARD_IDS}, modes)
+
+    def test_dataset(self):
+        dataset = Dataset(objects=3, object_size=100, seed="data")
+
+        self.assertEqual(dataset.key, Dataset(objects=3, object_size=100, seed="data").key)
+        self.assertNotEqual(dataset.key, Dataset(objects=3, object_size=100, seed="other").key)
+        payloads = [item.payload.read() for item in dataset.iter_upload_items("cid")]
+        self.assertEqual(3, len(set(payloads)))
+        self.assertEqual(payloads[1], dataset.get_payload(1).read())
+
+    def test_fill_and_restore_from_cache(self):
+        dataset = Dataset(objects=10, object_size=100)
+
+        result = self.filler.fill("cid", dataset)
+
+        self.assertFalse(result.restored)
+        self.assertEqual(10, self.user_cli.object.put.call_count)
+        self.assertCountEqual([f"oid{index}" for index in range(1, 11)], result.oids)
+        self.assertCountEqual(
+            [dataset.get_payload(index).read() for index in range(10)], self.payloads
+        )
+        self.assertEqual(2, self.control_cli.shards.dump.call_count)
+        for _, kwargs in self.control_cli.shards.dump.call_args_list:
+            self.assertEqual(("3600s", 3600), (kwargs["timeout"], kwargs["shell_timeout"]))
+        self.assert_shards_were_read_only()
+        self.assertEqual([f"{dataset.key}-cid"], os.listdir(self.cache_dir))
+
+        restored = self.filler.fill("cid", dataset)
+
+        self.assertTrue(restored.restored)
+        self.assertEqual(result.oids, restored.oids)
+        self.assertEqual(10, self.user_cli.object.put.call_count)
+        cache_path = os.path.join(self.cache_dir, f"{dataset.key}-cid")
+        self.control_cli.shards.restore.assert_has_calls(
+            [
+                call(
+                    endpoint="sn1:8081",
+                    wallet="sn_wallet.json",
+                    shard_id=shard_id,
+                    path=os.path.join(cache_path, f"shard-{index}.dump"),
+                    timeout="3600s",
+                    shell_timeout=3600,
+                )
+                for index, shard_id in enumerate(SHARD_IDS)
+            ],
+            any_order=True,
+        )
+
+    def test_fill_without_cache(self):
+        self.filler.cache_dir = None
+        dataset = Dataset(objects=2, object_size=10)
+
+        self.filler.fill("cid", dataset)
+        self.filler.fill("cid", dataset)
+
+        self.assertEqual(4, self.user_cli.object.put.call_count)
+        self.control_cli.shards.dump.assert_not_called()
+
+    def test_failed_dump_is_not_cached(self):
+        self.control_cli.shards.dump.side_effect = RuntimeError("dump failed")
+
+        with self.assertRaises(RuntimeError):
+            self.filler.fill("cid", Dataset(objects=2, object_size=10))
+
+        self.assertEqual([], os.listdir(self.cache_dir))
+        for _, kwargs in self.control_cli.shards.set_mode.call_args_list[::2]:
+            self.assertEqual("read-only", kwargs["mode"])
+        self.assertEqual("read-write", self.control_cli.shards.set_mode.call_args.kwargs["mode"])
@@ -0,0 +1,86 @@
+import gzip
+import logging
+from unittest import TestCase
+from unittest.mock import patch
+
+from neofs_testlib.shell.interfaces import CommandOptions, ReportPolicy
+from neofs_testlib.shell.local_shell import LocalShell
+from neofs_testlib.shell.reporting import LazyMessage, truncate_output
+
+
+class TestShellReporting(TestCase):
+    def test_truncate_output(self):
+        self.assertEqual("short", truncate_output("short", 10))
+
+        truncated = truncate_output("a" * 50 + "b" * 50, 10)
+        self.assertEqual("aaaaa\n... 90 B truncated ...\nbbbbb", truncated)
+
+        # Multibyte characters are not split
+        truncated = truncate_output("й" * 100, 11)
+        self.assertTrue(truncated.startswith("йй\n"))
+        self.assertTrue(truncated.endswith("\nйй"))
+
+    def test_large_output_is_truncated_and_compressed(self):
+        shell = LocalShell()
+        options = CommandOptions(report_policy=ReportPolicy(max_attachment_bytes=100))
+
+        with patch("neofs_testlib.shell.local_shell.reporter") as reporter:
+            result = shell.exec("python3 -c \"print('x' * 1000)\"", options)
+
+        attachments = {call.args[1]: call.args[0] for call in reporter.attach.call_args_list}
+        self.assertIn("truncated", attachments["Command execution.txt"])
+        self.assertEqual(
+            result.stdout, gzip.decompress(attachments["Command output.txt.gz"].read()).decode()
+        )
+
+    def test_report_opt_out(self):
+        shell = LocalShell()
+
+        with patch("neofs_testlib.shell.local_shell.reporter") as reporter:
+            shell.exec("echo test", CommandOptions(no_report=True))
+
+        reporter.attach.assert_not_called()
+
+    def test_quiet_fast_path(self):
+        shell = LocalShell()
+
+        with (
+            patch("neofs_testlib.shell.local_shell.reporter") as reporter,
+            patch("neofs_testlib.shell.local_shell.logger") as logger,
+            patch("neofs_testlib.shell.local_shell.get_command_summary") as get_command_summary,
+        ):
+            reporter.enabled = False
+            logger.isEnabledFor.return_value = False
+            shell.exec("echo test")
+
+        get_command_summary.assert_not_called()
+        reporter.attach.assert_not_called()
+
+    def test_log_message_is_deferred(self):
+        shell = LocalShell()
+
+        with (
+            patch("neofs_testlib.shell.local_shell.reporter") as reporter,
+            patch("neofs_testlib.shell.local_shell.truncate_output") as truncate_output,
+            patch.object(LazyMessage, "__str__", autospec=True) as build_message,
+            patch.object(logging.getLogger("neofs.testlib.shell"), "disabled", True),
+        ):
+            reporter.enabled = False
+            shell.exec("echo test")
+
+        build_message.assert_not_called()
+        truncate_output.assert_not_called()
+
+    def test_log_message_is_built_on_format(self):
+        shell = LocalShell()
+
+        with (
+            patch("neofs_testlib.shell.local_shell.reporter") as reporter,
+            patch("neofs_testlib.shell.local_shell.logger") as logger,
+        ):
+            reporter.enabled = False
+            shell.exec("echo test")
+
+        message = logger.info.call_args.args[-1]
+        self.assertIsInstance(message, LazyMessage)
+        self.assertIn("Command: echo test", str(message))